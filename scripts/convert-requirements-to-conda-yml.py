@@ -1,12 +1,21 @@
 # encoding=UTF-8
 """convert-requirements-to-conda-yml.py"""
 
+import os
+import re
 import sys
+import json
+import time
+import tempfile
 import argparse
+import concurrent.futures
+
 import requests
-import pkg_resources
+import requests.adapters
+from urllib3.util.retry import Retry
 
 FEEDSTOCK_URL = 'https://github.com/conda-forge/{package}-feedstock'
+CHANNELDATA_URL = 'https://conda.anaconda.org/conda-forge/channeldata.json'
 YML_TEMPLATE = """name: invest-env
 channels:
 - conda-forge
@@ -15,12 +24,233 @@ dependencies:
 {conda_dependencies}
 {pip_dependencies}
 """
+# Split the template once, up front, into the constant text around its two
+# fields.
+_YML_HEAD, _YML_REST = YML_TEMPLATE.split('{conda_dependencies}')
+_YML_MIDDLE, _YML_TAIL = _YML_REST.split('{pip_dependencies}')
+
+# PEP 508 project names are a simple charset, so a regex is enough to pull
+# the name off the front of a requirement.
+PROJECT_NAME_RE = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+# Packages that are known to be on conda-forge don't need to be looked up.
+# Names are canonical (see ``_canonical_name``).
+KNOWN_CONDA_FORGE = frozenset([
+    'cython',
+    'gdal',
+    'matplotlib',
+    'numpy',
+    'pandas',
+    'psutil',
+    'qtpy',
+    'requests',
+    'rtree',
+    'scipy',
+    'setuptools',
+    'shapely',
+    'six',
+    'sphinx',
+    'wheel',
+])
 
 SCM_MAP = {
     'hg': 'mercurial',
     'git': 'git',
 }
 
+# Checking for a feedstock is I/O bound, so many checks can be in flight at
+# once.
+MAX_WORKERS = 16
+
+# The set of feedstocks on conda-forge changes slowly, so lookups are cached
+# on disk between runs.
+CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'invest-env', 'feedstocks.json')
+CHANNELDATA_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'invest-env', 'channeldata.json')
+CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+# (connect, read) timeouts in seconds.  The channel index is a much larger
+# download than a feedstock page.
+FEEDSTOCK_TIMEOUT = (3, 5)
+CHANNELDATA_TIMEOUT = (3, 60)
+
+
+def _make_session():
+    """Create a session that keeps a connection alive for every worker.
+
+    requests only keeps 10 connections per host by default, which is fewer
+    than ``MAX_WORKERS``; extra connections would be thrown away and each
+    one would pay for a new TLS handshake.  Transient server errors are
+    retried with exponential backoff.
+
+    Returns:
+        A ``requests.Session``.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504]))
+    session.mount('https://', adapter)
+    return session
+
+
+def _load_cache(cache_path):
+    """Load a JSON cache file.
+
+    Arguments:
+        cache_path (string): The path to the JSON cache file.
+
+    Returns:
+        The cached dict, or an empty dict if the cache could not be read.
+    """
+    try:
+        with open(cache_path) as cache_file:
+            return json.load(cache_file)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache, cache_path):
+    """Atomically write a dict to a JSON cache file.
+
+    Arguments:
+        cache (dict): The data to cache.
+        cache_path (string): The path to the JSON cache file.
+
+    Returns:
+        ``None``
+    """
+    cache_dir = os.path.dirname(cache_path)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.json')
+    with os.fdopen(fd, 'w') as temp_file:
+        json.dump(cache, temp_file, indent=2, sort_keys=True)
+    os.replace(temp_path, cache_path)
+
+
+def _canonical_name(project_name):
+    """Normalize a project name per PEP 503.
+
+    Names that differ only in case or in runs of ``-``, ``_`` and ``.``
+    refer to the same project, e.g. ``Scikit_Learn`` and ``scikit-learn``.
+
+    Arguments:
+        project_name (string): The project name to normalize.
+
+    Returns:
+        The lowercase, dash-separated project name.
+    """
+    return re.sub(r'[-_.]+', '-', project_name).lower()
+
+
+def _feedstock_exists(session, project_name):
+    """Check whether a package has a feedstock on conda-forge.
+
+    Arguments:
+        session (requests.Session): The session to issue the request with.
+        project_name (string): The canonical name of the package to look
+            up.
+
+    Returns:
+        ``True`` if the feedstock exists, ``False`` if it does not, or
+        ``None`` if GitHub could not be reached or gave any other answer,
+        such as a rate limit or a server error.
+    """
+    conda_forge_url = FEEDSTOCK_URL.format(package=project_name)
+    # Only the status code matters, so skip downloading the page.  GitHub
+    # may redirect to the canonically-cased repository.
+    try:
+        response = session.head(conda_forge_url, allow_redirects=False,
+                                timeout=FEEDSTOCK_TIMEOUT)
+    except requests.exceptions.RequestException as error:
+        print('Could not look up %s, assuming pip: %s' % (
+            conda_forge_url, error), file=sys.stderr)
+        return None
+    if response.status_code in (200, 301):
+        return True
+    if response.status_code == 404:
+        return False
+    print('Unexpected status %s from %s, assuming pip' % (
+        response.status_code, conda_forge_url), file=sys.stderr)
+    return None
+
+
+def _conda_forge_packages(session, cache_path):
+    """Fetch the names of all packages available on conda-forge.
+
+    conda-forge's channeldata.json lists every package in the channel, so a
+    single download answers the lookup for every requirement.  The package
+    names are cached on disk with the response's ETag so that later runs
+    only need a conditional request.
+
+    Arguments:
+        session (requests.Session): The session to issue the request with.
+        cache_path (string): The path to the JSON cache file.
+
+    Returns:
+        A set of canonical package names, or ``None`` if the channel data
+        could not be fetched and nothing was cached.
+    """
+    cached = _load_cache(cache_path)
+    headers = {}
+    if 'etag' in cached and 'packages' in cached:
+        headers['If-None-Match'] = cached['etag']
+
+    try:
+        response = session.get(CHANNELDATA_URL, headers=headers,
+                               timeout=CHANNELDATA_TIMEOUT)
+    except requests.exceptions.RequestException as error:
+        print('Could not fetch %s: %s' % (CHANNELDATA_URL, error),
+              file=sys.stderr)
+        response = None
+
+    if response is not None and response.status_code == 200:
+        try:
+            packages = sorted(
+                _canonical_name(name)
+                for name in response.json()['packages'])
+        except (ValueError, KeyError, TypeError) as error:
+            # e.g. a proxy's HTML page or a truncated download
+            print('Could not read the package list from %s: %s' % (
+                CHANNELDATA_URL, error), file=sys.stderr)
+        else:
+            cached = {
+                'etag': response.headers.get('ETag', ''),
+                'packages': packages,
+            }
+            _save_cache(cached, cache_path)
+
+    if 'packages' not in cached:
+        return None
+    return set(cached['packages'])
+
+
+def _read_requirements(requirements_files):
+    """Read the requirement lines from a set of requirements.txt files.
+
+    Arguments:
+        requirements_files (list): Paths to requirements.txt files.
+
+    Returns:
+        A tuple of two lists of stripped lines: requirements checked out from
+        scm, and all other requirements.  Blank lines and comments are
+        skipped.
+    """
+    lines = []
+    for requirement_file in requirements_files:
+        with open(requirement_file) as requirements:
+            lines.extend(line.strip() for line in requirements)
+
+    scm_prefixes = tuple(SCM_MAP.keys())
+    lines = [line for line in lines if line and not line.startswith('#')]
+    scm_lines = [line for line in lines if line.startswith(scm_prefixes)]
+    requirement_lines = [
+        line for line in lines if not line.startswith(scm_prefixes)]
+    return scm_lines, requirement_lines
+
 
 def build_environment_from_requirements(cli_args):
     """Build a conda environment.yml from requirements.txt files.
@@ -55,39 +285,74 @@ def build_environment_from_requirements(cli_args):
     requirements_files = args.req
 
     pip_requirements = set([])
-    conda_requirements = set(['python=2.7'])
-    for requirement_file in requirements_files:
-        for line in open(requirement_file):
-            line = line.strip()
-
-            # Blank line or comment
-            if len(line) == 0 or line.startswith('#'):
-                continue
-
-            # Checked out from scm
-            if line.startswith(tuple(SCM_MAP.keys())):
-                pip_requirements.add(line)
-                conda_requirements.add(SCM_MAP[line.split('+')[0]])
-                continue
-
-            requirement = pkg_resources.Requirement.parse(line)
-            conda_forge_url = FEEDSTOCK_URL.format(
-                package=requirement.project_name.lower())
-            if (requests.get(conda_forge_url).status_code == 200 and not
-                    line.endswith('# pip-only')):
-                conda_requirements.add(line)
-            else:
-                pip_requirements.add(line)
-
-    conda_deps_string = '\n'.join(['- %s' % dep for dep in
-                                   sorted(conda_requirements,
-                                          key=lambda x: x.lower())])
-    pip_deps_string = '- pip:\n' + '\n'.join(['  - %s' % dep for dep in
-                                              sorted(pip_requirements,
-                                                     key=lambda x: x.lower())])
-    print YML_TEMPLATE.format(
-        conda_dependencies=conda_deps_string,
-        pip_dependencies=pip_deps_string)
+    conda_requirements = set(['python=3.7'])
+
+    scm_lines, requirement_lines = _read_requirements(requirements_files)
+    for line in scm_lines:
+        pip_requirements.add(line)
+        conda_requirements.add(SCM_MAP[line.split('+')[0]])
+
+    # Canonicalize names up front so that a project listed more than once,
+    # or under different spellings, is only looked up once.
+    requirements = [
+        (line, _canonical_name(PROJECT_NAME_RE.match(line).group(1)))
+        for line in requirement_lines]
+
+    session = _make_session()
+    cache = _load_cache(CACHE_PATH)
+    now = time.time()
+    stale_names = sorted(set(
+        project_name for (line, project_name) in requirements
+        if not line.endswith('# pip-only')
+        and project_name not in KNOWN_CONDA_FORGE
+        and now - cache.get(project_name, {}).get(
+            'checked_at', 0) > CACHE_MAX_AGE))
+
+    # Prefer one bulk lookup against the channel index over one request per
+    # package.  Fall back to looking for each feedstock on GitHub if the
+    # channel index is unavailable.
+    conda_forge_packages = None
+    if stale_names:
+        conda_forge_packages = _conda_forge_packages(
+            session, CHANNELDATA_CACHE_PATH)
+
+    if conda_forge_packages is not None:
+        for name in stale_names:
+            cache[name] = {
+                'exists': name in conda_forge_packages, 'checked_at': now}
+        _save_cache(cache, CACHE_PATH)
+    elif stale_names:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=MAX_WORKERS) as executor:
+            feedstocks_exist = executor.map(
+                lambda name: _feedstock_exists(session, name), stale_names)
+            for name, feedstock_exists in zip(stale_names, feedstocks_exist):
+                # Failed lookups aren't cached so they're retried next run.
+                if feedstock_exists is not None:
+                    cache[name] = {
+                        'exists': feedstock_exists, 'checked_at': now}
+        _save_cache(cache, CACHE_PATH)
+
+    for line, project_name in requirements:
+        if line.endswith('# pip-only'):
+            pip_requirements.add(line)
+        elif (project_name in KNOWN_CONDA_FORGE or
+                cache.get(project_name, {}).get('exists', False)):
+            conda_requirements.add(line)
+        else:
+            pip_requirements.add(line)
+
+    # Sorting on the exact string breaks ties between lines that differ only
+    # in case, so the output is the same from one run to the next.
+    def _sort_key(dep):
+        return (dep.lower(), dep)
+
+    conda_deps_string = '\n'.join(
+        '- %s' % dep for dep in sorted(conda_requirements, key=_sort_key))
+    pip_deps_string = '- pip:\n' + '\n'.join(
+        '  - %s' % dep for dep in sorted(pip_requirements, key=_sort_key))
+    print(''.join((_YML_HEAD, conda_deps_string, _YML_MIDDLE,
+                   pip_deps_string, _YML_TAIL)))
 
 
 if __name__ == '__main__':
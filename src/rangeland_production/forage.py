@@ -778,14 +778,12 @@ def execute(args):
     # identifier
     base_align_raster_path_id_map['site_index'] = (
         args['site_param_spatial_index_path'])
-    n_bands = pygeoprocessing.get_raster_info(
-        args['site_param_spatial_index_path'])['n_bands']
-    if n_bands > 1:
+    site_raster_info = pygeoprocessing.get_raster_info(
+        args['site_param_spatial_index_path'])
+    if site_raster_info['n_bands'] > 1:
         raise ValueError(
             'Site spatial index raster must contain only one band')
-    site_datatype = pygeoprocessing.get_raster_info(
-        args['site_param_spatial_index_path'])['datatype']
-    if site_datatype not in [1, 2, 3, 4, 5]:
+    if site_raster_info['datatype'] not in [1, 2, 3, 4, 5]:
         raise ValueError('Site spatial index raster must be integer type')
 
     # get unique values in site param raster
@@ -793,8 +791,7 @@ def execute(args):
     for offset_map, raster_block in pygeoprocessing.iterblocks(
             (args['site_param_spatial_index_path'], 1)):
         site_index_set.update(numpy.unique(raster_block))
-    site_nodata = pygeoprocessing.get_raster_info(
-        args['site_param_spatial_index_path'])['nodata'][0]
+    site_nodata = site_raster_info['nodata'][0]
     if site_nodata in site_index_set:
         site_index_set.remove(site_nodata)
     site_param_table = utils.build_lookup_from_csv(
@@ -849,8 +846,15 @@ def execute(args):
     driver = ogr.GetDriverByName('ESRI Shapefile')
     datasource = driver.Open(args['animal_grazing_areas_path'], 0)
     layer = datasource.GetLayer()
+    # look the field up by index so the name isn't resolved per feature
+    anim_id_index = layer.GetLayerDefn().GetFieldIndex('animal_id')
+    if anim_id_index < 0:
+        raise ValueError(
+            "Animal grazing areas layer must contain the field 'animal_id'")
     for feature in layer:
-        anim_id_list.append(feature.GetField('animal_id'))
+        anim_id_list.append(feature.GetField(anim_id_index))
+    layer = None
+    datasource = None
 
     input_animal_trait_table = utils.build_lookup_from_csv(
         args['animal_trait_path'], 'animal_id')
@@ -1282,9 +1286,9 @@ def raster_multiplication(
         valid_mask = (
             (~numpy.isclose(raster1, raster1_nodata)) &
             (~numpy.isclose(raster2, raster2_nodata)))
-        result = numpy.empty(raster1.shape, dtype=numpy.float32)
-        result[:] = target_path_nodata
-        result[valid_mask] = raster1[valid_mask] * raster2[valid_mask]
+        result = numpy.full(
+            raster1.shape, target_path_nodata, dtype=numpy.float32)
+        numpy.multiply(raster1, raster2, out=result, where=valid_mask)
         return result
     pygeoprocessing.raster_calculator(
         [(path, 1) for path in [raster1, raster2]],
@@ -1313,17 +1317,16 @@ def raster_division(
         valid_mask = (
             (~numpy.isclose(raster1, raster1_nodata)) &
             (~numpy.isclose(raster2, raster2_nodata)))
-        raster1 = raster1.astype(numpy.float32)
-        raster2 = raster2.astype(numpy.float32)
+        raster1 = raster1.astype(numpy.float32, copy=False)
+        raster2 = raster2.astype(numpy.float32, copy=False)
 
-        result = numpy.empty(raster1.shape, dtype=numpy.float32)
-        result[:] = target_path_nodata
-        error_mask = ((raster1 != 0) & (raster2 == 0.) & valid_mask)
+        # nonzero values divided by zero keep the nodata fill
+        result = numpy.full(
+            raster1.shape, target_path_nodata, dtype=numpy.float32)
         zero_mask = ((raster1 == 0.) & (raster2 == 0.) & valid_mask)
         nonzero_mask = ((raster2 != 0.) & valid_mask)
-        result[error_mask] = target_path_nodata
         result[zero_mask] = 0.
-        result[nonzero_mask] = raster1[nonzero_mask] / raster2[nonzero_mask]
+        numpy.divide(raster1, raster2, out=result, where=nonzero_mask)
         return result
     pygeoprocessing.raster_calculator(
         [(path, 1) for path in [raster1, raster2]],
@@ -1357,35 +1360,35 @@ def raster_list_sum(
         None
 
     """
-    def raster_sum_op(*raster_list):
-        """Add the rasters in raster_list without removing nodata values."""
-        invalid_mask = numpy.any(
-            numpy.isclose(numpy.array(raster_list), input_nodata), axis=0)
-        for r in raster_list:
-            numpy.place(r, numpy.isclose(r, input_nodata), [0])
-        sum_of_rasters = numpy.sum(raster_list, axis=0)
-        sum_of_rasters[invalid_mask] = target_nodata
-        return sum_of_rasters
-
-    def raster_sum_op_nodata_remove(*raster_list):
-        """Add the rasters in raster_list, treating nodata as zero."""
-        invalid_mask = numpy.all(
-            numpy.isclose(numpy.array(raster_list), input_nodata), axis=0)
-        for r in raster_list:
-            numpy.place(r, numpy.isclose(r, input_nodata), [0])
-        sum_of_rasters = numpy.sum(raster_list, axis=0)
-        sum_of_rasters[invalid_mask] = target_nodata
-        return sum_of_rasters
-
-    if nodata_remove:
-        pygeoprocessing.raster_calculator(
-            [(path, 1) for path in raster_list], raster_sum_op_nodata_remove,
-            target_path, gdal.GDT_Float32, target_nodata)
+    # add the rasters into the target one at a time, so that only one input
+    # is open alongside the target however many rasters are summed. Pixels
+    # that are nodata in the sum are held as NaN until the last raster.
+    pygeoprocessing.new_raster_from_base(
+        raster_list[0], target_path, gdal.GDT_Float32, [target_nodata],
+        fill_value_list=[numpy.nan if nodata_remove else 0])
+    target_raster = gdal.OpenEx(target_path, gdal.OF_RASTER | gdal.GA_Update)
+    target_band = target_raster.GetRasterBand(1)
+    last_raster_index = len(raster_list) - 1
+    for raster_index, path in enumerate(raster_list):
+        for offset_map, raster_block in pygeoprocessing.iterblocks(
+                (path, 1)):
+            sum_block = target_band.ReadAsArray(**offset_map)
+            valid_mask = ~numpy.isclose(raster_block, input_nodata)
+            if nodata_remove:
+                sum_block[valid_mask & numpy.isnan(sum_block)] = 0.
+            else:
+                sum_block[~valid_mask] = numpy.nan
+            numpy.add(sum_block, raster_block, out=sum_block, where=valid_mask)
+            if raster_index == last_raster_index:
+                sum_block[numpy.isnan(sum_block)] = target_nodata
+            target_band.WriteArray(
+                sum_block, xoff=offset_map['xoff'], yoff=offset_map['yoff'])
 
-    else:
-        pygeoprocessing.raster_calculator(
-            [(path, 1) for path in raster_list], raster_sum_op,
-            target_path, gdal.GDT_Float32, target_nodata)
+    # Making sure the band and dataset is flushed and not in memory
+    target_band.FlushCache()
+    target_band = None
+    gdal.Dataset.__swig_destroy__(target_raster)
+    target_raster = None
 
 
 def raster_sum(
@@ -1419,9 +1422,8 @@ def raster_sum(
         valid_mask = (
             (~numpy.isclose(raster1, raster1_nodata)) &
             (~numpy.isclose(raster2, raster2_nodata)))
-        result = numpy.empty(raster1.shape, dtype=numpy.float32)
-        result[:] = target_nodata
-        result[valid_mask] = raster1[valid_mask] + raster2[valid_mask]
+        result = numpy.full(raster1.shape, target_nodata, dtype=numpy.float32)
+        numpy.add(raster1, raster2, out=result, where=valid_mask)
         return result
 
     def raster_sum_op_nodata_remove(raster1, raster2):
@@ -1475,9 +1477,8 @@ def raster_difference(
         valid_mask = (
             (~numpy.isclose(raster1, raster1_nodata)) &
             (~numpy.isclose(raster2, raster2_nodata)))
-        result = numpy.empty(raster1.shape, dtype=numpy.float32)
-        result[:] = target_nodata
-        result[valid_mask] = raster1[valid_mask] - raster2[valid_mask]
+        result = numpy.full(raster1.shape, target_nodata, dtype=numpy.float32)
+        numpy.subtract(raster1, raster2, out=result, where=valid_mask)
         return result
 
     def raster_difference_op_nodata_remove(raster1, raster2):
@@ -1536,6 +1537,149 @@ def reclassify_nodata(target_path, new_nodata_value):
     os.remove(temp_path)
 
 
+def _valid_mask(exact_nodata_list, close_nodata_list=()):
+    """Identify pixels where none of a set of arrays contains nodata.
+
+    The mask is built up in place, so only one comparison array is allocated
+    at a time, rather than one for each comparison and each `&` between
+    them.
+
+    Parameters:
+        exact_nodata_list (list): list of (array, nodata) tuples, where
+            pixels of array equal to nodata are invalid
+        close_nodata_list (list): list of (array, nodata) tuples, where
+            pixels of array close to nodata (as judged by `numpy.isclose`)
+            are invalid
+
+    Returns:
+        boolean array that is True where every array is valid
+
+    """
+    valid_mask = None
+    for array, nodata in close_nodata_list:
+        array_valid = numpy.asarray(numpy.isclose(array, nodata))
+        numpy.logical_not(array_valid, out=array_valid)
+        if valid_mask is None:
+            valid_mask = array_valid
+        else:
+            valid_mask &= array_valid
+    for array, nodata in exact_nodata_list:
+        if valid_mask is None:
+            valid_mask = (array != nodata)
+        else:
+            valid_mask &= (array != nodata)
+    return valid_mask
+
+
+def _site_param_rasters(
+        site_index_path, site_param_table, param_list, target_dir,
+        target_nodata=_IC_NODATA, target_path_dict=None,
+        target_nodata_dict=None):
+    """Make one raster of each site-level parameter from the site index.
+
+    This gives the same rasters as calling `pygeoprocessing.reclassify_raster`
+    once for each parameter, but the site index raster is read only once.
+    The parameter values are first gathered into one array per parameter,
+    ordered by site code, so that each block of the site index is converted
+    to positions in those arrays once and indexed for every parameter.
+
+    Parameters:
+        site_index_path (string): path to site spatial index raster
+        site_param_table (dict): map of site spatial index to dictionaries
+            that contain site-level parameters
+        param_list (list): names of the site-level parameters that should be
+            made into rasters
+        target_dir (string): directory where the parameter rasters should be
+            created
+        target_nodata (float): nodata value of the parameter rasters
+        target_path_dict (dict): optional map of parameter name to the path
+            where the raster of that parameter should be created instead of
+            in `target_dir`
+        target_nodata_dict (dict): optional map of parameter name to the
+            nodata value of the raster of that parameter, if it should differ
+            from `target_nodata`
+
+    Side effects:
+        creates the raster '<param>.tif' in `target_dir` for each parameter
+            in `param_list` that is not in `target_path_dict`, and the raster
+            at `target_path_dict[param]` for each parameter that is
+
+    Raises:
+        ValueError if a valid value in the site index raster is not a site in
+            `site_param_table`
+
+    Returns:
+        dictionary mapping each parameter in `param_list` to the path of its
+            raster
+
+    """
+    site_codes = sorted(site_param_table.keys())
+    site_code_array = numpy.array(site_codes)
+    param_val_array = numpy.array(
+        [[float(site_param_table[site_code][val]) for site_code in site_codes]
+            for val in param_list], dtype=numpy.float32)
+    site_index_nodata = pygeoprocessing.get_raster_info(
+        site_index_path)['nodata'][0]
+
+    if target_path_dict is None:
+        target_path_dict = {}
+    if target_nodata_dict is None:
+        target_nodata_dict = {}
+
+    param_val_dict = {}
+    target_nodata_list = []
+    target_raster_list = []
+    for val in param_list:
+        target_path = target_path_dict.get(
+            val, os.path.join(target_dir, '{}.tif'.format(val)))
+        param_val_dict[val] = target_path
+        param_nodata = target_nodata_dict.get(val, target_nodata)
+        target_nodata_list.append(param_nodata)
+        pygeoprocessing.new_raster_from_base(
+            site_index_path, target_path, gdal.GDT_Float32, [param_nodata])
+        target_raster_list.append(
+            gdal.OpenEx(target_path, gdal.OF_RASTER | gdal.GA_Update))
+    target_band_list = [
+        target_raster.GetRasterBand(1) for target_raster in
+        target_raster_list]
+
+    # release the target rasters even if a site is missing from the table
+    try:
+        for offset_map, site_index in pygeoprocessing.iterblocks(
+                (site_index_path, 1)):
+            if site_index_nodata is None:
+                valid_mask = numpy.ones(site_index.shape, dtype=bool)
+            else:
+                valid_mask = ~numpy.isclose(site_index, site_index_nodata)
+            valid_site_index = site_index[valid_mask]
+            missing_mask = ~numpy.isin(valid_site_index, site_code_array)
+            if numpy.any(missing_mask):
+                raise ValueError(
+                    "The following site index values were not found in the "
+                    "site parameter table: {}".format(
+                        numpy.unique(valid_site_index[missing_mask])))
+            site_pos = numpy.searchsorted(site_code_array, valid_site_index)
+            for target_band, param_vals, param_nodata in zip(
+                    target_band_list, param_val_array, target_nodata_list):
+                target_block = numpy.full(
+                    site_index.shape, param_nodata, dtype=numpy.float32)
+                target_block[valid_mask] = param_vals[site_pos]
+                target_band.WriteArray(
+                    target_block, xoff=offset_map['xoff'],
+                    yoff=offset_map['yoff'])
+    finally:
+        # Making sure the bands and datasets are flushed and not in memory
+        for target_band in target_band_list:
+            target_band.FlushCache()
+        target_band = None
+        target_band_list = None
+        for target_raster in target_raster_list:
+            gdal.Dataset.__swig_destroy__(target_raster)
+        target_raster = None
+        target_raster_list = None
+    return param_val_dict
+
+
 def weighted_state_variable_sum(
         sv, sv_reg, aligned_inputs, pft_id_set, weighted_sum_path):
     """Calculate weighted sum of state variable across plant functional types.
@@ -2074,18 +2218,11 @@ def _persistent_params(
 
     # temporary intermediate rasters for persistent parameters calculation
     temp_dir = tempfile.mkdtemp(dir=PROCESSING_DIR)
-    param_val_dict = {}
-    for val in[
+    param_val_dict = _site_param_rasters(
+        site_index_path, site_param_table, [
             'peftxa', 'peftxb', 'p1co2a_2', 'p1co2b_2', 'ps1s3_1',
-            'ps1s3_2', 'ps2s3_1', 'ps2s3_2', 'omlech_1', 'omlech_2', 'vlossg']:
-        target_path = os.path.join(temp_dir, '{}.tif'.format(val))
-        param_val_dict[val] = target_path
-        site_to_val = dict(
-            [(site_code, float(table[val])) for (
-                site_code, table) in site_param_table.items()])
-        pygeoprocessing.reclassify_raster(
-            (site_index_path, 1), site_to_val, target_path, gdal.GDT_Float32,
-            _IC_NODATA)
+            'ps1s3_2', 'ps2s3_1', 'ps2s3_2', 'omlech_1', 'omlech_2',
+            'vlossg'], temp_dir)
 
     def calc_wc(afiel_1, awilt_1):
         """Calculate water content of soil layer 1."""
@@ -2113,10 +2250,9 @@ def _persistent_params(
         """
         eftext = numpy.empty(sand.shape, dtype=numpy.float32)
         eftext[:] = _IC_NODATA
-        valid_mask = (
-            (peftxa != _IC_NODATA) &
-            (peftxb != _IC_NODATA) &
-            (~numpy.isclose(sand, sand_nodata)))
+        valid_mask = _valid_mask(
+            [(peftxa, _IC_NODATA), (peftxb, _IC_NODATA)],
+            [(sand, sand_nodata)])
         eftext[valid_mask] = (
             peftxa[valid_mask] + (peftxb[valid_mask] * sand[valid_mask]))
         return eftext
@@ -2147,10 +2283,9 @@ def _persistent_params(
         """
         p1co2_2 = numpy.empty(sand.shape, dtype=numpy.float32)
         p1co2_2[:] = _IC_NODATA
-        valid_mask = (
-            (p1co2a_2 != _IC_NODATA) &
-            (p1co2b_2 != _IC_NODATA) &
-            (~numpy.isclose(sand, sand_nodata)))
+        valid_mask = _valid_mask(
+            [(p1co2a_2, _IC_NODATA), (p1co2b_2, _IC_NODATA)],
+            [(sand, sand_nodata)])
         p1co2_2[valid_mask] = (
             p1co2a_2[valid_mask] + (p1co2b_2[valid_mask] * sand[valid_mask]))
         return p1co2_2
@@ -2180,10 +2315,9 @@ def _persistent_params(
         """
         fps1s3 = numpy.empty(clay.shape, dtype=numpy.float32)
         fps1s3[:] = _IC_NODATA
-        valid_mask = (
-            (ps1s3_1 != _IC_NODATA) &
-            (ps1s3_2 != _IC_NODATA) &
-            (~numpy.isclose(clay, clay_nodata)))
+        valid_mask = _valid_mask(
+            [(ps1s3_1, _IC_NODATA), (ps1s3_2, _IC_NODATA)],
+            [(clay, clay_nodata)])
         fps1s3[valid_mask] = (
             ps1s3_1[valid_mask] + (ps1s3_2[valid_mask] * clay[valid_mask]))
         return fps1s3
@@ -2212,10 +2346,9 @@ def _persistent_params(
         """
         fps2s3 = numpy.empty(clay.shape, dtype=numpy.float32)
         fps2s3[:] = _IC_NODATA
-        valid_mask = (
-            (ps2s3_1 != _IC_NODATA) &
-            (ps2s3_2 != _IC_NODATA) &
-            (~numpy.isclose(clay, clay_nodata)))
+        valid_mask = _valid_mask(
+            [(ps2s3_1, _IC_NODATA), (ps2s3_2, _IC_NODATA)],
+            [(clay, clay_nodata)])
         fps2s3[valid_mask] = (
             ps2s3_1[valid_mask] + (ps2s3_2[valid_mask] * clay[valid_mask]))
         return fps2s3
@@ -2244,10 +2377,9 @@ def _persistent_params(
         """
         orglch = numpy.empty(sand.shape, dtype=numpy.float32)
         orglch[:] = _IC_NODATA
-        valid_mask = (
-            (omlech_1 != _IC_NODATA) &
-            (omlech_2 != _IC_NODATA) &
-            (~numpy.isclose(sand, sand_nodata)))
+        valid_mask = _valid_mask(
+            [(omlech_1, _IC_NODATA), (omlech_2, _IC_NODATA)],
+            [(sand, sand_nodata)])
         orglch[valid_mask] = (
             omlech_1[valid_mask] + (omlech_2[valid_mask] * sand[valid_mask]))
         return orglch
@@ -2273,9 +2405,8 @@ def _persistent_params(
             vlossg, proportion of gross mineralized N that is volatized
 
         """
-        valid_mask = (
-            (vlossg_param != _IC_NODATA) &
-            (~numpy.isclose(clay, clay_nodata)))
+        valid_mask = _valid_mask(
+            [(vlossg_param, _IC_NODATA)], [(clay, clay_nodata)])
         vlossg = numpy.empty(vlossg_param.shape, dtype=numpy.float32)
         vlossg[:] = _IC_NODATA
 
@@ -2309,37 +2440,38 @@ def _aboveground_ratio(anps, tca, pcemic_1, pcemic_2, pcemic_3):
         pcemic_3 (numpy.ndarray): parameter, minimum <iel> content of
             decomposing material that gives minimum C/<iel> of new material
 
+    The inputs may also be scalars, or any mix of arrays and scalars that
+    broadcast together.
+
     Returns:
         agdrat, the C/<iel> ratio of new material
 
     """
-    valid_mask = (
-        (~numpy.isclose(anps, _SV_NODATA)) &
-        (~numpy.isclose(tca, _SV_NODATA)) &
-        (pcemic_1 != _IC_NODATA) &
-        (pcemic_2 != _IC_NODATA) &
-        (pcemic_3 != _IC_NODATA))
-
-    cemicb = numpy.empty(anps.shape, dtype=numpy.float32)
-    cemicb[:] = _IC_NODATA
-    cemicb[valid_mask] = (
-        (pcemic_2[valid_mask] - pcemic_1[valid_mask]) /
-        pcemic_3[valid_mask])
-
-    econt = numpy.empty(anps.shape, dtype=numpy.float32)
-    econt[:] = _TARGET_NODATA
-    econt[valid_mask] = 0
-
-    decompose_mask = ((tca > 0.) & valid_mask)
-    econt[decompose_mask] = anps[decompose_mask] / (tca[decompose_mask] * 2.5)
-
-    agdrat = numpy.empty(anps.shape, dtype=numpy.float32)
-    agdrat[:] = _TARGET_NODATA
-    agdrat[valid_mask] = pcemic_2[valid_mask]
-
-    compute_mask = ((econt <= pcemic_3) & valid_mask)
-    agdrat[compute_mask] = (
-        pcemic_1[compute_mask] + econt[compute_mask] * cemicb[compute_mask])
+    anps, tca, pcemic_1, pcemic_2, pcemic_3 = numpy.broadcast_arrays(
+        anps, tca, pcemic_1, pcemic_2, pcemic_3)
+    valid_mask = _valid_mask(
+        [(pcemic_1, _IC_NODATA), (pcemic_2, _IC_NODATA),
+            (pcemic_3, _IC_NODATA)],
+        [(anps, _SV_NODATA), (tca, _SV_NODATA)])
+
+    anps_valid = anps[valid_mask]
+    tca_valid = tca[valid_mask]
+    pcemic_1_valid = pcemic_1[valid_mask]
+    pcemic_2_valid = pcemic_2[valid_mask]
+    pcemic_3_valid = pcemic_3[valid_mask]
+
+    cemicb = (
+        (pcemic_2_valid - pcemic_1_valid) / pcemic_3_valid).astype(
+            numpy.float32)
+
+    econt = numpy.zeros(anps_valid.shape, dtype=numpy.float32)
+    numpy.divide(
+        anps_valid, tca_valid * 2.5, out=econt, where=(tca_valid > 0.))
+
+    agdrat = numpy.full(anps.shape, _TARGET_NODATA, dtype=numpy.float32)
+    agdrat[valid_mask] = numpy.where(
+        econt <= pcemic_3_valid, pcemic_1_valid + econt * cemicb,
+        pcemic_2_valid)
     return agdrat
 
 
@@ -2413,22 +2545,25 @@ def _structural_ratios(site_index_path, site_param_table, sv_reg, pp_reg):
         None
 
     """
-    # temporary parameter rasters for structural ratios calculations
+    # temporary parameter rasters for structural ratios calculations.
+    # rnewbs(iel,1) = varat1_1(iel) and rnewbs(iel,2) = varat22_1(iel), so
+    # those are made in the same pass, directly at their pp_reg paths
     temp_dir = tempfile.mkdtemp(dir=PROCESSING_DIR)
-    param_val_dict = {}
+    rnewbs_path_dict = {}
     for iel in [1, 2]:
-        for val in[
+        rnewbs_path_dict['varat1_1_{}'.format(iel)] = pp_reg[
+            'rnewbs_{}_1_path'.format(iel)]
+        rnewbs_path_dict['varat22_1_{}'.format(iel)] = pp_reg[
+            'rnewbs_{}_2_path'.format(iel)]
+    param_val_dict = _site_param_rasters(
+        site_index_path, site_param_table, [
+            '{}_{}'.format(val, iel) for iel in [1, 2] for val in [
                 'pcemic1_2', 'pcemic1_1', 'pcemic1_3', 'pcemic2_2',
                 'pcemic2_1', 'pcemic2_3', 'rad1p_1', 'rad1p_2',
-                'rad1p_3', 'varat1_1', 'varat22_1']:
-            target_path = os.path.join(temp_dir, '{}_{}.tif'.format(val, iel))
-            param_val_dict['{}_{}'.format(val, iel)] = target_path
-            site_to_val = dict(
-                [(site_code, float(table['{}_{}'.format(val, iel)])) for
-                    (site_code, table) in site_param_table.items()])
-            pygeoprocessing.reclassify_raster(
-                (site_index_path, 1), site_to_val, target_path,
-                gdal.GDT_Float32, _IC_NODATA)
+                'rad1p_3']] + sorted(rnewbs_path_dict), temp_dir,
+        target_path_dict=rnewbs_path_dict,
+        target_nodata_dict=dict(
+            (val, _TARGET_NODATA) for val in rnewbs_path_dict))
 
     def calc_rnewas_som2(
             pcemic2_2, pcemic2_1, pcemic2_3, struce_1, strucc_1, rad1p_1,
@@ -2521,23 +2656,6 @@ def _structural_ratios(site_index_path, site_param_table, sv_reg, pp_reg):
                 pp_reg['rnewas_{}_1_path'.format(iel)]]],
             calc_rnewas_som2, pp_reg['rnewas_{}_2_path'.format(iel)],
             gdal.GDT_Float32, _TARGET_NODATA)
-        # calculate rnewbs_iel_1 - belowground material to SOM1
-        site_to_varat1_1 = dict([
-            (site_code, float(table['varat1_1_{}'.format(iel)])) for
-            (site_code, table) in site_param_table.items()])
-        pygeoprocessing.reclassify_raster(
-            (site_index_path, 1), site_to_varat1_1,
-            pp_reg['rnewbs_{}_1_path'.format(iel)],
-            gdal.GDT_Float32, _TARGET_NODATA)
-        # calculate rnewbs_iel_2 - belowground material to SOM2
-        # rnewbs(iel,2) = varat22(1,iel)
-        site_to_varat22_1 = dict([
-            (site_code, float(table['varat22_1_{}'.format(iel)])) for
-            (site_code, table) in site_param_table.items()])
-        pygeoprocessing.reclassify_raster(
-            (site_index_path, 1), site_to_varat22_1,
-            pp_reg['rnewbs_{}_2_path'.format(iel)],
-            gdal.GDT_Float32, _TARGET_NODATA)
 
     # clean up temporary files
     shutil.rmtree(temp_dir)
@@ -2671,16 +2789,9 @@ def _yearly_tasks(
 
     # intermediate parameter rasters for this operation
     temp_dir = tempfile.mkdtemp(dir=PROCESSING_DIR)
-    param_val_dict = {}
-    for val in['epnfa_1', 'epnfa_2']:
-        target_path = os.path.join(temp_dir, '{}.tif'.format(val))
-        param_val_dict[val] = target_path
-        site_to_val = dict(
-            [(site_code, float(table[val])) for
-                (site_code, table) in site_param_table.items()])
-        pygeoprocessing.reclassify_raster(
-            (aligned_inputs['site_index'], 1), site_to_val, target_path,
-            gdal.GDT_Float32, _IC_NODATA)
+    param_val_dict = _site_param_rasters(
+        aligned_inputs['site_index'], site_param_table,
+        ['epnfa_1', 'epnfa_2'], temp_dir)
     for val in ['fligni_1_1', 'fligni_2_1', 'fligni_1_2', 'fligni_2_2']:
         for pft_i in pft_id_set:
             target_path = os.path.join(
@@ -2738,25 +2849,17 @@ def calc_latitude(template_raster, latitude_raster_path):
         n_x_block = raster_block.shape[1]
 
         # offset by .5 so we're in the center of the pixel
-        xoff = offset_map['xoff'] + 0.5
         yoff = offset_map['yoff'] + 0.5
 
-        # calculate the projected x and y coordinate bounds for the block
-        x_range = numpy.linspace(
-            geotransform[0] + geotransform[1] * xoff,
-            geotransform[0] + geotransform[1] * (xoff + n_x_block - 1),
-            n_x_block)
+        # calculate the projected y coordinate of each row in the block
         y_range = numpy.linspace(
             geotransform[3] + geotransform[5] * yoff,
             geotransform[3] + geotransform[5] * (yoff + n_y_block - 1),
             n_y_block)
 
-        # we'll use this to avoid generating any nodata points
-        valid_mask = raster_block != base_raster_info['nodata']
-
-        # these indexes correspond to projected coordinates
-        # y_vector is what we want, an array of latitude coordinates
-        x_vector, y_vector = numpy.meshgrid(x_range, y_range)
+        # latitude only varies by row, so repeat the column of y
+        # coordinates across the block instead of building a full meshgrid
+        y_vector = numpy.repeat(y_range[:, numpy.newaxis], n_x_block, axis=1)
 
         target_band.WriteArray(
             y_vector, xoff=offset_map['xoff'], yoff=offset_map['yoff'])
@@ -2787,22 +2890,26 @@ def _calc_daylength(template_raster, month, daylength_path):
 
     """
     def daylength(month):
+        # Julian day at beginning of each month
+        jday_list = [
+            1, 32, 61, 92, 122, 153, 183, 214, 245, 275, 306, 337]
+        jday = jday_list[month - 1]
+
+        # declination depends only on the month, so calculate it once
+        # instead of once per block
+        declin = 0.4014 * numpy.sin(6.283185 * (jday - 77.0) / 365)
+        tan_declin = numpy.tan(declin)
+
         def _daylength(latitude):
             """Estimate hours of daylength for a given month and latitude."""
-            # Julian day at beginning of each month
-            jday_list = [
-                1, 32, 61, 92, 122, 153, 183, 214, 245, 275, 306, 337]
-            jday = jday_list[month - 1]
-
             # Convert latitude from degrees to radians
             rlatitude = latitude * (numpy.pi / 180.0)
 
-            declin = 0.4014 * numpy.sin(6.283185 * (jday - 77.0) / 365)
-            temp = 1.0 - (-numpy.tan(rlatitude) * numpy.tan(declin))**2
+            par2 = -numpy.tan(rlatitude) * tan_declin
+            temp = 1.0 - par2**2
             temp[temp < 0] = 0
 
             par1 = numpy.sqrt(temp)
-            par2 = -numpy.tan(rlatitude) * numpy.tan(declin)
 
             ahou = numpy.arctan2(par1, par2)
             hours_of_daylength = (ahou / numpy.pi) * 24
@@ -2846,44 +2953,46 @@ def _shortwave_radiation(template_raster, month, shwave_path):
 
     """
     def shwave(month):
+        # Julian date in middle of each month of the year
+        jday_list = [
+            16, 46, 75, 106, 136, 167, 197, 228, 259, 289, 320, 350]
+        jday = jday_list[month - 1]
+        transcof = 0.8
+
+        # declination depends only on the month, so calculate it and its
+        # trigonometric functions once instead of once per block
+        declin = 0.401426 * numpy.sin(6.283185 * (jday - 77.0) / 365.0)
+        tan_declin = numpy.tan(declin)
+        sin_declin = numpy.sin(declin)
+        cos_declin = numpy.cos(declin)
+
         def _shwave(latitude):
             """Calculate shortwave radiation outside the atmosphere.
 
             Parameters:
                 latitude (float): latitude of current site in degrees
-                month (int): current month of the year, such that month=1
-                    indicates January
 
             Returns:
                 shwave, short wave solar radiation outside the atmosphere
 
             """
-            # Julian date in middle of each month of the year
-            jday_list = [
-                16, 46, 75, 106, 136, 167, 197, 228, 259, 289, 320, 350]
-            jday = jday_list[month - 1]
-            transcof = 0.8
-
             # Convert latitude from degrees to radians
             rlatitude = latitude * (numpy.pi / 180.0)
 
             # short wave solar radiation on a clear day
-            declin = 0.401426 * numpy.sin(6.283185 * (jday - 77.0) / 365.0)
-
-            temp = 1.0 - (-numpy.tan(rlatitude) * numpy.tan(declin))**2
+            par2 = -numpy.tan(rlatitude) * tan_declin
+            temp = 1.0 - par2**2
             temp[temp < 0.] = 0.
 
             par1 = numpy.sqrt(temp)
-            par2 = (-numpy.tan(rlatitude) * numpy.tan(declin))
 
             ahou = numpy.arctan2(par1, par2)
             ahou[ahou < 0.] = 0.
 
             solrad = (
                 917.0 * transcof * (
-                    ahou * numpy.sin(rlatitude) * numpy.sin(declin) +
-                    numpy.cos(rlatitude) *
-                    numpy.cos(declin) * numpy.sin(ahou)))
+                    ahou * numpy.sin(rlatitude) * sin_declin +
+                    numpy.cos(rlatitude) * cos_declin * numpy.sin(ahou)))
 
             # short wave radiation outside the atmosphere
             shwave = solrad / transcof
@@ -2952,37 +3061,30 @@ def _reference_evapotranspiration(
         const2 = 17.8
         langleys2watts = 54.0
 
-        valid_mask = (
-            (~numpy.isclose(max_temp, maxtmp_nodata)) &
-            (~numpy.isclose(min_temp, mintmp_nodata)) &
-            (shwave != _TARGET_NODATA) &
-            (fwloss_4 != _IC_NODATA))
-        trange = numpy.empty(fwloss_4.shape, dtype=numpy.float32)
-        trange[:] = _TARGET_NODATA
-        trange[valid_mask] = max_temp[valid_mask] - min_temp[valid_mask]
-        tmean = numpy.empty(fwloss_4.shape, dtype=numpy.float32)
-        tmean[:] = _IC_NODATA
-        tmean[valid_mask] = (max_temp[valid_mask] + min_temp[valid_mask]) / 2.0
+        valid_mask = _valid_mask(
+            [(shwave, _TARGET_NODATA), (fwloss_4, _IC_NODATA)],
+            [(max_temp, maxtmp_nodata), (min_temp, mintmp_nodata)])
+        # intermediate values are only needed for valid pixels, so they are
+        # computed on the compacted arrays
+        max_temp_valid = max_temp[valid_mask]
+        min_temp_valid = min_temp[valid_mask]
+        trange = (max_temp_valid - min_temp_valid).astype(numpy.float32)
+        tmean = ((max_temp_valid + min_temp_valid) / 2.0).astype(
+            numpy.float32)
 
         # daily reference evapotranspiration
-        daypet = numpy.empty(fwloss_4.shape, dtype=numpy.float32)
-        daypet[:] = _TARGET_NODATA
-        in1 = const1 * (tmean[valid_mask] + const2)
-        in2 = numpy.sqrt(trange[valid_mask])
-        in3 = (shwave[valid_mask] / langleys2watts)
-        daypet[valid_mask] = (
-            const1 * (tmean[valid_mask] + const2) *
-            numpy.sqrt(trange[valid_mask]) *
-            (shwave[valid_mask] / langleys2watts))
+        daypet = (
+            const1 * (tmean + const2) * numpy.sqrt(trange) *
+            (shwave[valid_mask] / langleys2watts)).astype(numpy.float32)
 
         # monthly reference evapotranspiration, from mm to cm,
         # bounded to be at least 0.5
         monpet = (daypet * 30.) / 10.
         monpet[monpet <= 0.5] = 0.5
 
-        pevap = numpy.empty(fwloss_4.shape, dtype=numpy.float32)
-        pevap[:] = _TARGET_NODATA
-        pevap[valid_mask] = monpet[valid_mask] * fwloss_4[valid_mask]
+        pevap = numpy.full(
+            fwloss_4.shape, _TARGET_NODATA, dtype=numpy.float32)
+        pevap[valid_mask] = monpet * fwloss_4[valid_mask]
         return pevap
 
     maxtmp_nodata = pygeoprocessing.get_raster_info(
@@ -3199,24 +3301,24 @@ def _potential_production(
             (pprpts_1 != _IC_NODATA) &
             (pprpts_2 != _IC_NODATA) &
             (pprpts_3 != _IC_NODATA))
-        h2ogef_prior = numpy.empty(pevap.shape, dtype=numpy.float32)
-        h2ogef_prior[:] = _TARGET_NODATA
-        h2ogef_prior[valid_mask] = numpy.where(
-            pevap[valid_mask] >= 0.01,
-            (avh2o_1[valid_mask] + precip[valid_mask])/pevap[valid_mask],
-            0.01)
+        pevap_valid = pevap[valid_mask]
+        pprpts_3_valid = pprpts_3[valid_mask]
+        h2ogef_prior = numpy.where(
+            pevap_valid >= 0.01,
+            (avh2o_1[valid_mask] + precip[valid_mask])/pevap_valid,
+            0.01).astype(numpy.float32)
 
         intcpt = (
             pprpts_1[valid_mask] + (pprpts_2[valid_mask] * wc[valid_mask]))
-        slope = 1. / (pprpts_3[valid_mask] - intcpt)
+        slope = 1. / (pprpts_3_valid - intcpt)
 
-        h2ogef_1 = numpy.empty(pevap.shape, dtype=numpy.float32)
-        h2ogef_1[:] = _TARGET_NODATA
-        h2ogef_1[valid_mask] = (
-            1.0 + slope *
-            (h2ogef_prior[valid_mask] - pprpts_3[valid_mask]))
+        h2ogef_1_valid = (
+            1.0 + slope * (h2ogef_prior - pprpts_3_valid)).astype(
+                numpy.float32)
 
-        h2ogef_1[valid_mask] = numpy.clip(h2ogef_1[valid_mask], 0.01, 1.)
+        h2ogef_1 = numpy.full(
+            pevap.shape, _TARGET_NODATA, dtype=numpy.float32)
+        h2ogef_1[valid_mask] = numpy.clip(h2ogef_1_valid, 0.01, 1.)
         return h2ogef_1
 
     def calc_biof(sum_stdedc, sum_aglivc, strucc_1, pmxbio, biok5):
@@ -3249,37 +3351,31 @@ def _potential_production(
             (pmxbio != _IC_NODATA) &
             (biok5 != _IC_NODATA))
 
-        bioc = numpy.empty(sum_stdedc.shape, dtype=numpy.float32)
-        bioc[:] = _IC_NODATA
-        bioc[valid_mask] = numpy.where(
-            ((sum_stdedc[valid_mask] + 0.1*strucc_1[valid_mask]) <= 0.), 0.01,
-            (sum_stdedc[valid_mask] + 0.1*strucc_1[valid_mask]))
-        bioc[valid_mask] = numpy.where(
-            (bioc[valid_mask] > pmxbio[valid_mask]), pmxbio[valid_mask],
-            bioc[valid_mask])
+        pmxbio_valid = pmxbio[valid_mask]
+        litter_valid = (
+            sum_stdedc[valid_mask] + 0.1*strucc_1[valid_mask])
+        bioc = numpy.where(
+            litter_valid <= 0., 0.01, litter_valid).astype(numpy.float32)
+        bioc = numpy.where(
+            bioc > pmxbio_valid, pmxbio_valid, bioc).astype(numpy.float32)
 
-        bioprd = numpy.empty(sum_stdedc.shape, dtype=numpy.float32)
-        bioprd[:] = _IC_NODATA
-        bioprd[valid_mask] = 1. - (
-            bioc[valid_mask] / (biok5[valid_mask] + bioc[valid_mask]))
+        bioprd = (1. - (bioc / (biok5[valid_mask] + bioc))).astype(
+            numpy.float32)
 
         temp1 = 1. - bioprd
         temp2 = temp1 * 0.75
         temp3 = temp1 * 0.25
 
-        ratlc = numpy.empty(sum_stdedc.shape, dtype=numpy.float32)
-        ratlc[:] = _IC_NODATA
-        ratlc[valid_mask] = sum_aglivc[valid_mask] / bioc[valid_mask]
+        ratlc = (sum_aglivc[valid_mask] / bioc).astype(numpy.float32)
 
-        biof = numpy.empty(sum_stdedc.shape, dtype=numpy.float32)
-        biof[:] = _TARGET_NODATA
+        biof = numpy.full(
+            sum_stdedc.shape, _TARGET_NODATA, dtype=numpy.float32)
         biof[valid_mask] = numpy.where(
-            ratlc[valid_mask] <= 1.,
-            (bioprd[valid_mask] + (temp2[valid_mask] * ratlc[valid_mask])),
+            ratlc <= 1.,
+            (bioprd + (temp2 * ratlc)),
             numpy.where(
-                ratlc[valid_mask] <= 2.,
-                (bioprd[valid_mask] + temp2[valid_mask]) +
-                temp3[valid_mask] * (ratlc[valid_mask] - 1.),
+                ratlc <= 2.,
+                (bioprd + temp2) + temp3 * (ratlc - 1.),
                 1.))
         return biof
 
@@ -3362,12 +3458,16 @@ def _potential_production(
                 aligned_inputs['site_index'], target_path, gdal.GDT_Float32,
                 [_IC_NODATA], fill_value_list=[fill_val])
 
+    # the climate inputs for this month are shared by every PFT
+    max_temp_path = aligned_inputs['max_temp_{}'.format(current_month)]
+    min_temp_path = aligned_inputs['min_temp_{}'.format(current_month)]
+    precip_path = aligned_inputs['precip_{}'.format(month_index)]
     maxtmp_nodata = pygeoprocessing.get_raster_info(
-        aligned_inputs['max_temp_{}'.format(current_month)])['nodata'][0]
+        max_temp_path)['nodata'][0]
     mintmp_nodata = pygeoprocessing.get_raster_info(
-        aligned_inputs['min_temp_{}'.format(current_month)])['nodata'][0]
+        min_temp_path)['nodata'][0]
     precip_nodata = pygeoprocessing.get_raster_info(
-        aligned_inputs['precip_{}'.format(month_index)])['nodata'][0]
+        precip_path)['nodata'][0]
 
     # calculate intermediate quantities that do not differ between PFTs:
     # sum of aglivc (standing live biomass) and stdedc (standing dead biomass)
@@ -3382,9 +3482,9 @@ def _potential_production(
         [(path, 1) for path in [
             temp_val_dict['sum_aglivc'],
             param_val_dict['pmxbio'],
-            aligned_inputs['max_temp_{}'.format(current_month)],
+            max_temp_path,
             param_val_dict['pmxtmp'],
-            aligned_inputs['min_temp_{}'.format(current_month)],
+            min_temp_path,
             param_val_dict['pmntmp']]],
         calc_ctemp, temp_val_dict['ctemp'], gdal.GDT_Float32, _IC_NODATA)
 
@@ -3394,8 +3494,8 @@ def _potential_production(
 
     # pet, reference evapotranspiration modified by fwloss parameter
     _reference_evapotranspiration(
-        aligned_inputs['max_temp_{}'.format(current_month)],
-        aligned_inputs['min_temp_{}'.format(current_month)],
+        max_temp_path,
+        min_temp_path,
         temp_val_dict['shwave'],
         param_val_dict['fwloss_4'],
         temp_val_dict['pevap'])
@@ -3405,8 +3505,8 @@ def _potential_production(
         # potprd, the limiting effect of temperature
         pygeoprocessing.raster_calculator(
             [(path, 1) for path in [
-                aligned_inputs['min_temp_{}'.format(current_month)],
-                aligned_inputs['max_temp_{}'.format(current_month)],
+                min_temp_path,
+                max_temp_path,
                 temp_val_dict['ctemp'],
                 param_val_dict['ppdf_1_{}'.format(pft_i)],
                 param_val_dict['ppdf_2_{}'.format(pft_i)],
@@ -3420,7 +3520,7 @@ def _potential_production(
             [(path, 1) for path in [
                 temp_val_dict['pevap'],
                 prev_sv_reg['avh2o_1_{}_path'.format(pft_i)],
-                aligned_inputs['precip_{}'.format(month_index)],
+                precip_path,
                 pp_reg['wc_path'],
                 param_val_dict['pprpts_1'],
                 param_val_dict['pprpts_2'],
@@ -4258,45 +4358,44 @@ def grazing_effect_on_aboveground_production(tgprod, fracrc, flgrem, grzeff):
         grzeff (numpy.ndarray): parameter, the effect of defoliation on
             production and root:shoot ratio
 
+    The inputs may also be scalars, or any mix of arrays and scalars that
+    broadcast together.
+
     Returns:
         agprod, aboveground production impacted by grazing
 
     """
+    tgprod, fracrc, flgrem, grzeff = numpy.broadcast_arrays(
+        tgprod, fracrc, flgrem, grzeff)
     valid_mask = (
         (tgprod != _TARGET_NODATA) &
         (fracrc != _TARGET_NODATA) &
         (flgrem != _TARGET_NODATA) &
         (grzeff != _IC_NODATA))
 
-    agprod_prior = numpy.empty(tgprod.shape, dtype=numpy.float32)
-    agprod_prior[:] = _TARGET_NODATA
-    agprod_prior[valid_mask] = (
-        tgprod[valid_mask] * (1. - fracrc[valid_mask]))
-
-    linear_effect = numpy.empty(tgprod.shape, dtype=numpy.float32)
-    linear_effect[:] = _TARGET_NODATA
-    linear_effect[valid_mask] = numpy.maximum(
-        (1. - (2.21*flgrem[valid_mask])) * agprod_prior[valid_mask],
-        0.02)
-
-    quadratic_effect = numpy.empty(tgprod.shape, dtype=numpy.float32)
-    quadratic_effect[:] = _TARGET_NODATA
-    quadratic_effect[valid_mask] = (
-        (1. + 2.6*flgrem[valid_mask] -
-            (5.83*(numpy.power(flgrem[valid_mask], 2)))) *
-        agprod_prior[valid_mask])
-    quadratic_effect[valid_mask] = numpy.maximum(
-        quadratic_effect[valid_mask], 0.02)
-
-    no_effect_mask = (valid_mask & numpy.isin(grzeff, [0, 3, 4]))
-    linear_mask = (valid_mask & numpy.isin(grzeff, [1, 6]))
-    quadratic_mask = (valid_mask & numpy.isin(grzeff, [2, 5]))
-
-    agprod = numpy.empty(tgprod.shape, dtype=numpy.float32)
-    agprod[:] = _TARGET_NODATA
-    agprod[no_effect_mask] = agprod_prior[no_effect_mask]
-    agprod[linear_mask] = linear_effect[linear_mask]
-    agprod[quadratic_mask] = quadratic_effect[quadratic_mask]
+    flgrem_valid = flgrem[valid_mask]
+    grzeff_valid = grzeff[valid_mask]
+
+    agprod_prior = (
+        tgprod[valid_mask] * (1. - fracrc[valid_mask])).astype(
+            numpy.float32)
+
+    linear_effect = numpy.maximum(
+        (1. - (2.21*flgrem_valid)) * agprod_prior, 0.02).astype(
+            numpy.float32)
+
+    quadratic_effect = (
+        (1. + 2.6*flgrem_valid - (5.83*(numpy.power(flgrem_valid, 2)))) *
+        agprod_prior).astype(numpy.float32)
+    quadratic_effect = numpy.maximum(quadratic_effect, 0.02)
+
+    agprod = numpy.full(tgprod.shape, _TARGET_NODATA, dtype=numpy.float32)
+    agprod[valid_mask] = numpy.select(
+        [numpy.isin(grzeff_valid, [0, 3, 4]),
+            numpy.isin(grzeff_valid, [1, 6]),
+            numpy.isin(grzeff_valid, [2, 5])],
+        [agprod_prior, linear_effect, quadratic_effect],
+        default=_TARGET_NODATA)
     return agprod
 
 
@@ -4322,43 +4421,42 @@ def grazing_effect_on_root_shoot(fracrc, flgrem, grzeff, gremb):
             production and root:shoot ratio
         grzemb (numpy.ndarray): parameter, grazing effect multiplier
 
+    The inputs may also be scalars, or any mix of arrays and scalars that
+    broadcast together.
+
     Returns:
         rtsh, root:shoot ratio impacted by grazing
 
     """
+    fracrc, flgrem, grzeff, gremb = numpy.broadcast_arrays(
+        fracrc, flgrem, grzeff, gremb)
     valid_mask = (
         (fracrc != _TARGET_NODATA) &
         (flgrem != _TARGET_NODATA) &
         (grzeff != _IC_NODATA) &
         (gremb != _IC_NODATA))
 
-    rtsh_prior = numpy.empty(fracrc.shape, dtype=numpy.float32)
-    rtsh_prior[:] = _TARGET_NODATA
-    rtsh_prior[valid_mask] = (
-        fracrc[valid_mask] / (1. - fracrc[valid_mask]))
-
-    quadratic_effect = numpy.empty(fracrc.shape, dtype=numpy.float32)
-    quadratic_effect[:] = _TARGET_NODATA
-    quadratic_effect[valid_mask] = numpy.maximum(
-        rtsh_prior[valid_mask] + 3.05 * flgrem[valid_mask] -
-        11.78 * numpy.power(flgrem[valid_mask], 2),
-        0.01)
-
-    linear_effect = numpy.empty(fracrc.shape, dtype=numpy.float32)
-    linear_effect[:] = _TARGET_NODATA
-    linear_effect[valid_mask] = numpy.maximum(
-        1. - (flgrem[valid_mask] * gremb[valid_mask]),
-        0.01)
-
-    no_effect_mask = (valid_mask & numpy.isin(grzeff, [0, 1]))
-    quadratic_mask = (valid_mask & numpy.isin(grzeff, [2, 3]))
-    linear_mask = (valid_mask & numpy.isin(grzeff, [4, 5, 6]))
-
-    rtsh = numpy.empty(fracrc.shape, dtype=numpy.float32)
-    rtsh[:] = _TARGET_NODATA
-    rtsh[no_effect_mask] = rtsh_prior[no_effect_mask]
-    rtsh[quadratic_mask] = quadratic_effect[quadratic_mask]
-    rtsh[linear_mask] = linear_effect[linear_mask]
+    fracrc_valid = fracrc[valid_mask]
+    flgrem_valid = flgrem[valid_mask]
+    grzeff_valid = grzeff[valid_mask]
+
+    rtsh_prior = (fracrc_valid / (1. - fracrc_valid)).astype(numpy.float32)
+
+    quadratic_effect = numpy.maximum(
+        rtsh_prior + 3.05 * flgrem_valid -
+        11.78 * numpy.power(flgrem_valid, 2),
+        0.01).astype(numpy.float32)
+
+    linear_effect = numpy.maximum(
+        1. - (flgrem_valid * gremb[valid_mask]), 0.01).astype(numpy.float32)
+
+    rtsh = numpy.full(fracrc.shape, _TARGET_NODATA, dtype=numpy.float32)
+    rtsh[valid_mask] = numpy.select(
+        [numpy.isin(grzeff_valid, [0, 1]),
+            numpy.isin(grzeff_valid, [2, 3]),
+            numpy.isin(grzeff_valid, [4, 5, 6])],
+        [rtsh_prior, quadratic_effect, linear_effect],
+        default=_TARGET_NODATA)
     return rtsh
 
 
@@ -4382,10 +4480,9 @@ def calc_tgprod_final(rtsh, agprod):
     valid_mask = (
         (rtsh != _TARGET_NODATA) &
         (agprod != _TARGET_NODATA))
-    tgprod = numpy.empty(rtsh.shape, dtype=numpy.float32)
-    tgprod[:] = _TARGET_NODATA
-    tgprod[valid_mask] = (
-        agprod[valid_mask] + (rtsh[valid_mask] * agprod[valid_mask]))
+    agprod_valid = agprod[valid_mask]
+    tgprod = numpy.full(rtsh.shape, _TARGET_NODATA, dtype=numpy.float32)
+    tgprod[valid_mask] = agprod_valid + (rtsh[valid_mask] * agprod_valid)
     return tgprod
 
 
@@ -5991,19 +6088,19 @@ def esched(return_type):
         outofa[valid_mask] = (
             anps[valid_mask] * (cflow[valid_mask] / tca[valid_mask]))
 
-        immobil_ratio = numpy.zeros(cflow.shape)
+        immobil_ratio = numpy.zeros(cflow.shape, dtype=numpy.float32)
         nonzero_mask = ((outofa > 0) & valid_mask)
         immobil_ratio[nonzero_mask] = (
             cflow[nonzero_mask] / outofa[nonzero_mask])
 
-        immflo = numpy.zeros(cflow.shape)
+        immflo = numpy.zeros(cflow.shape, dtype=numpy.float32)
         immflo[valid_mask] = (
             cflow[valid_mask] / rcetob[valid_mask] - outofa[valid_mask])
 
-        labile_supply = numpy.zeros(cflow.shape)
+        labile_supply = numpy.zeros(cflow.shape, dtype=numpy.float32)
         labile_supply[valid_mask] = labile[valid_mask] - immflo[valid_mask]
 
-        atob = numpy.zeros(cflow.shape)
+        atob = numpy.zeros(cflow.shape, dtype=numpy.float32)
         atob[valid_mask] = cflow[valid_mask] / rcetob[valid_mask]
 
         # immobilization
@@ -6885,7 +6982,7 @@ def calc_c_leach(amov_2, tcflow, omlech_3, orglch):
     cleach[:] = _TARGET_NODATA
     cleach[valid_mask] = 0
 
-    linten = numpy.zeros(amov_2.shape)
+    linten = numpy.zeros(amov_2.shape, dtype=numpy.float32)
     linten[valid_mask] = numpy.minimum(
         (1. - (omlech_3[valid_mask] - amov_2[valid_mask]) /
             omlech_3[valid_mask]), 1.)
@@ -6930,7 +7027,7 @@ def remove_leached_iel(
             (som1c_2 > 0) &
             (som1e_2_1 > 0) &
             (cleach != _TARGET_NODATA))
-        rceof1_1 = numpy.zeros(som1c_2.shape)
+        rceof1_1 = numpy.zeros(som1c_2.shape, dtype=numpy.float32)
         rceof1_1[valid_mask] = som1c_2[valid_mask] / som1e_2_1[valid_mask] * 2.
         orgflow = numpy.empty(som1c_2.shape, dtype=numpy.float32)
         orgflow[:] = _IC_NODATA
@@ -6945,7 +7042,7 @@ def remove_leached_iel(
             (som1c_2 > 0) &
             (som1e_2_2 > 0) &
             (cleach != _TARGET_NODATA))
-        rceof1_2 = numpy.zeros(som1c_2.shape)
+        rceof1_2 = numpy.zeros(som1c_2.shape, dtype=numpy.float32)
         rceof1_2[valid_mask] = (
             som1c_2[valid_mask] / som1e_2_2[valid_mask] * 35.)
         orgflow = numpy.empty(som1c_2.shape, dtype=numpy.float32)
@@ -7005,7 +7102,7 @@ def calc_pflow(pstatv, rate_param, defac):
         (~numpy.isclose(pstatv, _SV_NODATA)) &
         (rate_param != _IC_NODATA) &
         (defac != _TARGET_NODATA))
-    pflow = numpy.empty(pstatv.shape, dtype=numpy.float64)
+    pflow = numpy.empty(pstatv.shape, dtype=numpy.float32)
     pflow[:] = _IC_NODATA
     pflow[valid_mask] = (
         pstatv[valid_mask] * rate_param[valid_mask] * defac[valid_mask] *
@@ -7036,7 +7133,7 @@ def calc_pflow_to_secndy(minerl_lyr_2, pmnsec_2, fsol, defac):
         (pmnsec_2 != _IC_NODATA) &
         (fsol != _TARGET_NODATA) &
         (defac != _TARGET_NODATA))
-    fmnsec = numpy.empty(minerl_lyr_2.shape, dtype=numpy.float64)
+    fmnsec = numpy.empty(minerl_lyr_2.shape, dtype=numpy.float32)
     fmnsec[:] = _IC_NODATA
     fmnsec[valid_mask] = (
         pmnsec_2[valid_mask] * minerl_lyr_2[valid_mask] *
@@ -8393,7 +8490,7 @@ def _decomposition(
             [(path, 1) for path in [
                 sv_reg['secndy_2_path'], param_val_dict['psecmn_2'],
                 temp_val_dict['defac']]],
-            calc_pflow, temp_val_dict['pflow'], gdal.GDT_Float64,
+            calc_pflow, temp_val_dict['pflow'], gdal.GDT_Float32,
             _IC_NODATA)
         shutil.copyfile(
             delta_sv_dict['secndy_2'], temp_val_dict['d_statv_temp'])
@@ -8415,7 +8512,7 @@ def _decomposition(
                     sv_reg['minerl_{}_2_path'.format(lyr)],
                     param_val_dict['pmnsec_2'], temp_val_dict['fsol'],
                     temp_val_dict['defac']]],
-                calc_pflow_to_secndy, temp_val_dict['pflow'], gdal.GDT_Float64,
+                calc_pflow_to_secndy, temp_val_dict['pflow'], gdal.GDT_Float32,
                 _IC_NODATA)
             shutil.copyfile(
                 delta_sv_dict['minerl_{}_2'.format(lyr)],
@@ -8436,7 +8533,7 @@ def _decomposition(
             [(path, 1) for path in [
                 sv_reg['secndy_2_path'], param_val_dict['psecoc1'],
                 temp_val_dict['defac']]],
-            calc_pflow, temp_val_dict['pflow'], gdal.GDT_Float64,
+            calc_pflow, temp_val_dict['pflow'], gdal.GDT_Float32,
             _IC_NODATA)
         shutil.copyfile(
             delta_sv_dict['secndy_2'], temp_val_dict['d_statv_temp'])
@@ -8456,7 +8553,7 @@ def _decomposition(
             [(path, 1) for path in [
                 sv_reg['occlud_path'], param_val_dict['psecoc2'],
                 temp_val_dict['defac']]],
-            calc_pflow, temp_val_dict['pflow'], gdal.GDT_Float64,
+            calc_pflow, temp_val_dict['pflow'], gdal.GDT_Float32,
             _IC_NODATA)
         shutil.copyfile(
             delta_sv_dict['occlud'], temp_val_dict['d_statv_temp'])
@@ -14155,19 +14252,23 @@ def validate(args, limit_to=None):
             if limit_to not in (key, None):
                 continue
 
-            spatial_file = gdal.OpenEx(args[key], filetype)
+            spatial_file = gdal.OpenEx(
+                args[key], filetype | gdal.OF_READONLY |
+                gdal.OF_VERBOSE_ERROR)
             if spatial_file is None:
                 validation_error_list.append(
                     ([key], 'Must be a %s' % filetype_string))
                 continue
 
-            else:
+            try:
+                # read the projection from the dataset that's already open
+                # rather than opening the file again
                 if filetype_string == 'vector':
-                    input_proj = pygeoprocessing.get_vector_info(
-                        args[key])['projection_wkt']
+                    layer_srs = spatial_file.GetLayer().GetSpatialRef()
+                    input_proj = (
+                        layer_srs.ExportToWkt() if layer_srs else '')
                 else:
-                    input_proj = pygeoprocessing.get_raster_info(
-                        args[key])['projection_wkt']
+                    input_proj = spatial_file.GetProjection()
                 input_srs = osr.SpatialReference()
                 input_srs.ImportFromWkt(input_proj)
                 if not bool(input_srs.IsGeographic()):
@@ -14187,7 +14288,10 @@ def validate(args, limit_to=None):
                         validation_error_list.append((
                                 ['animal_grazing_areas_path'],
                                 'does not have a `num_animal` field defined.'))
-            del spatial_file
+                    graz_areas_layer = None
+            finally:
+                # release the dataset even if a check fails
+                spatial_file = None
 
     for key in numeric_key_list:
         if limit_to not in (key, None):
@@ -225,13 +225,16 @@ def sandbox_tempdir(suffix='', prefix='tmp', dir=None):
         ``None``"""
     sandbox = tempfile.mkdtemp(suffix=suffix, prefix=prefix, dir=dir)
 
+    def _log_removal_error(function, path, excinfo):
+        LOGGER.warning('Could not remove %s from sandbox %s', path, sandbox,
+                       exc_info=excinfo)
+
     try:
         yield sandbox
     finally:
-        try:
-            shutil.rmtree(sandbox)
-        except OSError:
-            LOGGER.exception('Could not remove sandbox %s', sandbox)
+        # Keep removing the rest of the sandbox if a single file can't be
+        # removed, such as one still held open by GDAL on Windows.
+        shutil.rmtree(sandbox, onerror=_log_removal_error)
 
 
 def make_suffix_string(args, suffix_key):
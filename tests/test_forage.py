@@ -5,14 +5,19 @@ import tempfile
 import shutil
 import os
 import math
+import zlib
 
 import numpy
 import pandas
 from osgeo import osr
 from osgeo import gdal
+from osgeo import gdal_array
 
 import pygeoprocessing
 
+from rangeland_production import forage
+from rangeland_production import utils
+
 SAMPLE_DATA = "C:/Users/ginge/Dropbox/sample_inputs"
 REGRESSION_DATA = "C:/Users/ginge/Documents/NatCap/regression_test_data"
 PROCESSING_DIR = None
@@ -25,7 +30,27 @@ _SV_NODATA = -1.0
 NROWS = 3
 NCOLS = 3
 
-numpy.random.seed(100)
+# every test raster shares a coordinate system and driver, so build them once
+_WGS84_SRS = osr.SpatialReference()
+_WGS84_SRS.SetWellKnownGeogCS('WGS84')
+_WGS84_WKT = _WGS84_SRS.ExportToWkt()
+_GTIFF_DRIVER = gdal.GetDriverByName('GTiff')
+_RANDOM_RASTER_GEOTRANSFORM = [0, 0.0001, 0, 44.5, 0, 0.0001]
+_CONSTANT_RASTER_GEOTRANSFORM = [0, 1, 0, 44.5, 0, 1]
+# rasters written by the test helpers are a handful of pixels, so skip the
+# default 256x256 tiling and compression
+_FIXTURE_CREATION_TUPLE = ('GTIFF', ('TILED=NO', 'COMPRESS=NONE'))
+# rasters up to this many pixels are checked in one read rather than by block
+_MAX_PIXELS_READ_WHOLE = 2**20
+# tmpfs mount on Linux where the test workspace is created, if writable
+_SHARED_MEMORY_DIR = '/dev/shm'
+
+# each test reseeds `_RNG` in `setUp` from this seed and the test's name, so
+# a test's random inputs don't depend on which tests ran before it
+_RANDOM_SEED = 100
+_RNG = numpy.random.default_rng(_RANDOM_SEED)
+# float32 buffers reused by `create_random_raster`, keyed by (nrows, ncols)
+_RANDOM_ARRAY_BUFFERS = {}
 
 
 def create_random_raster(
@@ -48,22 +73,29 @@ def create_random_raster(
         None
 
     """
-    geotransform = [0, 0.0001, 0, 44.5, 0, 0.0001]
     n_bands = 1
     datatype = gdal.GDT_Float32
-    projection = osr.SpatialReference()
-    projection.SetWellKnownGeogCS('WGS84')
-    driver = gdal.GetDriverByName('GTiff')
-    target_raster = driver.Create(
+    target_raster = _GTIFF_DRIVER.Create(
         target_path.encode('utf-8'), ncols, nrows, n_bands,
         datatype)
-    target_raster.SetProjection(projection.ExportToWkt())
-    target_raster.SetGeoTransform(geotransform)
+    target_raster.SetProjection(_WGS84_WKT)
+    target_raster.SetGeoTransform(_RANDOM_RASTER_GEOTRANSFORM)
     target_band = target_raster.GetRasterBand(1)
     target_band.SetNoDataValue(_TARGET_NODATA)
-
-    random_array = numpy.random.uniform(
-        lower_bound, upper_bound, (nrows, ncols))
+    if lower_bound == upper_bound:
+        # many fixtures are constant; they don't need a random draw
+        target_band.Fill(lower_bound)
+        target_raster = None
+        return
+
+    # WriteArray copies the buffer, so one buffer per shape can be reused
+    if (nrows, ncols) not in _RANDOM_ARRAY_BUFFERS:
+        _RANDOM_ARRAY_BUFFERS[(nrows, ncols)] = numpy.empty(
+            (nrows, ncols), dtype=numpy.float32)
+    random_array = _RANDOM_ARRAY_BUFFERS[(nrows, ncols)]
+    _RNG.random(out=random_array, dtype=numpy.float32)
+    random_array *= (upper_bound - lower_bound)
+    random_array += lower_bound
     target_band.WriteArray(random_array)
     target_raster = None
 
@@ -87,66 +119,61 @@ def create_complementary_raster(
         None
 
     """
-    def complement_op(input1, input2):
-        """Generate an array that adds to 1 with input1 and input2."""
-        result_raster = numpy.empty(input1.shape, dtype=numpy.float32)
-        result_raster[:] = _TARGET_NODATA
-        valid_mask = (
-            (input1 != _TARGET_NODATA)
-            & (input2 != _TARGET_NODATA))
-
-        result_raster[valid_mask] = (
-            1. - (input1[valid_mask] + input2[valid_mask]))
-        return result_raster
-
-    pygeoprocessing.raster_calculator(
-        [(path, 1) for path in [raster1_path, raster2_path]],
-        complement_op, result_raster_path, gdal.GDT_Float32,
-        _TARGET_NODATA)
+    # the test rasters are tiny, so read them whole rather than paying for
+    # raster_calculator's block iteration
+    raster1 = gdal.OpenEx(raster1_path, gdal.OF_RASTER)
+    input1 = raster1.GetRasterBand(1).ReadAsArray()
+    raster2 = gdal.OpenEx(raster2_path, gdal.OF_RASTER)
+    input2 = raster2.GetRasterBand(1).ReadAsArray()
+    raster2 = None
+
+    result_array = numpy.full(
+        input1.shape, _TARGET_NODATA, dtype=numpy.float32)
+    valid_mask = (
+        (input1 != _TARGET_NODATA)
+        & (input2 != _TARGET_NODATA))
+    result_array[valid_mask] = (
+        1. - (input1[valid_mask] + input2[valid_mask]))
+
+    target_raster = _GTIFF_DRIVER.Create(
+        result_raster_path.encode('utf-8'), raster1.RasterXSize,
+        raster1.RasterYSize, 1, gdal.GDT_Float32)
+    target_raster.SetProjection(raster1.GetProjection())
+    target_raster.SetGeoTransform(raster1.GetGeoTransform())
+    raster1 = None
+    target_band = target_raster.GetRasterBand(1)
+    target_band.SetNoDataValue(_TARGET_NODATA)
+    target_band.WriteArray(result_array)
+    target_band = None
+    target_raster = None
 
 
 def insert_nodata_values_into_raster(target_raster, nodata_value):
     """Insert nodata at arbitrary locations in `target_raster`."""
-    def insert_op(prior_copy):
-        modified_copy = prior_copy
-        if (prior_copy.shape[0] * prior_copy.shape[1]) == 1:
-            n_vals = 1
-        else:
-            n_vals = numpy.random.randint(
-                1, (prior_copy.shape[0] * prior_copy.shape[1]))
-        insertions = 0
-        while insertions < n_vals:
-            row = numpy.random.randint(0, prior_copy.shape[0])
-            col = numpy.random.randint(0, prior_copy.shape[1])
-            modified_copy[row, col] = nodata_value
-            insertions += 1
-        return modified_copy
-
-    prior_copy = os.path.join(
-        os.path.dirname(target_raster), 'prior_to_insert_nodata.tif')
-    shutil.copyfile(target_raster, prior_copy)
-
-    pygeoprocessing.raster_calculator(
-        [(prior_copy, 1)],
-        insert_op, target_raster,
-        gdal.GDT_Float32, nodata_value)
-
-    os.remove(prior_copy)
+    raster = gdal.OpenEx(target_raster, gdal.OF_RASTER | gdal.GA_Update)
+    band = raster.GetRasterBand(1)
+    modified_array = band.ReadAsArray()
+    if modified_array.size == 1:
+        n_vals = 1
+    else:
+        n_vals = _RNG.integers(1, modified_array.size)
+    flat_index = _RNG.choice(modified_array.size, size=n_vals, replace=False)
+    modified_array.flat[flat_index] = nodata_value
+    band.SetNoDataValue(nodata_value)
+    band.WriteArray(modified_array)
+    band = None
+    raster = None
 
 
 def create_constant_raster(target_path, fill_value, n_cols=1, n_rows=1):
     """Create a single-pixel raster with value `fill_value`."""
-    geotransform = [0, 1, 0, 44.5, 0, 1]
     n_bands = 1
     datatype = gdal.GDT_Float32
-    projection = osr.SpatialReference()
-    projection.SetWellKnownGeogCS('WGS84')
-    driver = gdal.GetDriverByName('GTiff')
-    target_raster = driver.Create(
+    target_raster = _GTIFF_DRIVER.Create(
         target_path.encode('utf-8'), n_cols, n_rows, n_bands,
         datatype)
-    target_raster.SetProjection(projection.ExportToWkt())
-    target_raster.SetGeoTransform(geotransform)
+    target_raster.SetProjection(_WGS84_WKT)
+    target_raster.SetGeoTransform(_CONSTANT_RASTER_GEOTRANSFORM)
     target_band = target_raster.GetRasterBand(1)
     target_band.SetNoDataValue(_TARGET_NODATA)
     target_band.Fill(fill_value)
@@ -156,14 +183,10 @@ def create_constant_raster(target_path, fill_value, n_cols=1, n_rows=1):
 def insert_nodata_values_into_array(target_array, nodata_value):
     """Insert nodata at arbitrary locations in `target_array`."""
     modified_array = target_array
-    n_vals = numpy.random.randint(
+    n_vals = _RNG.integers(
         0, (target_array.shape[0] * target_array.shape[1]))
-    insertions = 0
-    while insertions < n_vals:
-        row = numpy.random.randint(0, target_array.shape[0])
-        col = numpy.random.randint(0, target_array.shape[1])
-        modified_array[row, col] = nodata_value
-        insertions += 1
+    flat_index = _RNG.choice(target_array.size, size=n_vals, replace=False)
+    modified_array.flat[flat_index] = nodata_value
     return modified_array
 
 
@@ -207,7 +230,7 @@ def calc_raster_difference_stats(
     pygeoprocessing.raster_calculator(
         [(path, 1) for path in [raster1_path, raster2_path]],
         raster_difference_op, target_path, gdal.GDT_Float32,
-        _TARGET_NODATA)
+        _TARGET_NODATA, raster_driver_creation_tuple=_FIXTURE_CREATION_TUPLE)
 
     zonal_stats = pygeoprocessing.zonal_statistics(
         (target_path, 1), aggregate_vector_path)
@@ -1001,18 +1024,47 @@ def nutrient_uptake_point(
 class foragetests(unittest.TestCase):
     """Regression tests for InVEST forage model."""
 
+    # read buffers shared across tests by `assert_raster_single_value`,
+    # keyed by (n_rows, n_cols, GDAL datatype)
+    _read_buffers = {}
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a temporary workspace shared by all tests."""
+        # the test rasters are small, so keep them in memory-backed storage
+        # where it's available
+        if (os.path.isdir(_SHARED_MEMORY_DIR) and
+                os.access(_SHARED_MEMORY_DIR, os.W_OK)):
+            cls.class_workspace_dir = tempfile.mkdtemp(dir=_SHARED_MEMORY_DIR)
+        else:
+            cls.class_workspace_dir = tempfile.mkdtemp()
+        cls._soil_fixtures = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared workspace and soil fixtures."""
+        shutil.rmtree(cls.class_workspace_dir)
+
     def setUp(self):
-        """Create temporary workspace directory."""
-        self.workspace_dir = "C:/Users/ginge/Desktop/temp_test_dir"
+        """Create a workspace directory for this test."""
+        self.workspace_dir = os.path.join(
+            self.class_workspace_dir, self._testMethodName)
         os.makedirs(self.workspace_dir)
         global PROCESSING_DIR
-        PROCESSING_DIR = os.path.join(self.workspace_dir, "temporary_files")
+        PROCESSING_DIR = self.workspace_path("temporary_files")
         os.makedirs(PROCESSING_DIR)
+        global _RNG
+        _RNG = numpy.random.default_rng(numpy.random.SeedSequence(
+            [_RANDOM_SEED, zlib.crc32(self.id().encode('utf-8'))]))
 
     def tearDown(self):
-        """Clean up remaining files."""
+        """Clean up this test's workspace."""
         shutil.rmtree(self.workspace_dir)
 
+    def workspace_path(self, filename):
+        """Return the path to `filename` inside this test's workspace."""
+        return os.path.join(self.workspace_dir, filename)
+
     @staticmethod
     def generate_base_args(workspace_dir):
         """Generate a base sample args dict for forage model."""
@@ -1080,24 +1132,32 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        for offset_map, raster_block in pygeoprocessing.iterblocks(
-                (raster_to_test, 1)):
-            if len(raster_block[raster_block != nodata_value]) == 0:
+        n_cols, n_rows = pygeoprocessing.get_raster_info(
+            raster_to_test)['raster_size']
+        if n_cols * n_rows <= _MAX_PIXELS_READ_WHOLE:
+            raster_blocks = [
+                pygeoprocessing.raster_to_numpy_array(raster_to_test)]
+        else:
+            raster_blocks = (
+                raster_block for _, raster_block in
+                pygeoprocessing.iterblocks((raster_to_test, 1)))
+        for raster_block in raster_blocks:
+            valid_values = raster_block[raster_block != nodata_value]
+            if valid_values.size == 0:
                 continue
-            min_val = numpy.amin(
-                raster_block[raster_block != nodata_value])
-            self.assertGreaterEqual(
-                min_val, minimum_acceptable_value,
-                msg="Raster contains values smaller than acceptable "
-                + "minimum: {}, {} (acceptable min: {})".format(
-                    raster_to_test, min_val, minimum_acceptable_value))
-            max_val = numpy.amax(
-                raster_block[raster_block != nodata_value])
-            self.assertLessEqual(
-                max_val, maximum_acceptable_value,
-                msg="Raster contains values larger than acceptable "
-                + "maximum: {}, {} (acceptable max: {})".format(
-                    raster_to_test, max_val, maximum_acceptable_value))
+            # the failure messages are only formatted for a failing block
+            min_val = valid_values.min()
+            if not min_val >= minimum_acceptable_value:
+                self.fail(
+                    "Raster contains values smaller than acceptable "
+                    + "minimum: {}, {} (acceptable min: {})".format(
+                        raster_to_test, min_val, minimum_acceptable_value))
+            max_val = valid_values.max()
+            if not max_val <= maximum_acceptable_value:
+                self.fail(
+                    "Raster contains values larger than acceptable "
+                    + "maximum: {}, {} (acceptable max: {})".format(
+                        raster_to_test, max_val, maximum_acceptable_value))
 
     def assert_all_values_in_array_within_range(
             self, array_to_test, minimum_acceptable_value,
@@ -1115,22 +1175,21 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        if len(array_to_test[array_to_test != nodata_value]) == 0:
+        valid_values = array_to_test[array_to_test != nodata_value]
+        if valid_values.size == 0:
             return
-        min_val = numpy.amin(
-            array_to_test[array_to_test != nodata_value])
-        self.assertGreaterEqual(
-            min_val, minimum_acceptable_value,
-            msg="Array contains values smaller than acceptable minimum: " +
-            "min value: {}, acceptable min: {}".format(
-                min_val, minimum_acceptable_value))
-        max_val = numpy.amax(
-            array_to_test[array_to_test != nodata_value])
-        self.assertLessEqual(
-            max_val, maximum_acceptable_value,
-            msg="Array contains values larger than acceptable maximum: " +
-            "max value: {}, acceptable max: {}".format(
-                max_val, maximum_acceptable_value))
+        min_val = valid_values.min()
+        if not min_val >= minimum_acceptable_value:
+            self.fail(
+                "Array contains values smaller than acceptable minimum: " +
+                "min value: {}, acceptable min: {}".format(
+                    min_val, minimum_acceptable_value))
+        max_val = valid_values.max()
+        if not max_val <= maximum_acceptable_value:
+            self.fail(
+                "Array contains values larger than acceptable maximum: " +
+                "max value: {}, acceptable max: {}".format(
+                    max_val, maximum_acceptable_value))
 
     def assert_sorted_lists_equal(self, string_list_1, string_list_2):
         """Test that `string_list_1` and `string_list_2` are equal.
@@ -1147,15 +1206,78 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        self.assertEqual(len(string_list_1), len(string_list_2))
-        for i in range(len(string_list_1)):
-            self.assertEqual(string_list_1[i], string_list_2[i])
+        self.assertListEqual(list(string_list_1), list(string_list_2))
+
+    def assert_raster_single_value(
+            self, raster_to_test, expected_value, delta, raster_label):
+        """Test that `raster_to_test` holds one value near `expected_value`.
+
+        Every pixel in `raster_to_test`, including nodata, must hold the same
+        value, and that value must be within `delta` of `expected_value`.
+        `raster_label` names the raster in the failure message.
+
+        Raises:
+            AssertionError if the raster contains more than one unique value
+            AssertionError if the value is not within `delta` of
+                `expected_value`
+
+        Returns:
+            None
+
+        """
+        raster = gdal.OpenEx(raster_to_test, gdal.OF_RASTER)
+        band = raster.GetRasterBand(1)
+        buffer_key = (raster.RasterYSize, raster.RasterXSize, band.DataType)
+        if buffer_key not in self._read_buffers:
+            self._read_buffers[buffer_key] = numpy.empty(
+                buffer_key[:2],
+                dtype=gdal_array.GDALTypeCodeToNumericTypeCode(
+                    band.DataType))
+        raster_array = band.ReadAsArray(
+            buf_obj=self._read_buffers[buffer_key])
+        band = None
+        raster = None
+        self.assertEqual(
+            raster_array.min(), raster_array.max(),
+            msg="One unique value expected in {}".format(raster_label))
+        self.assertAlmostEqual(
+            float(raster_array.flat[0]), expected_value, delta=delta,
+            msg="Test result does not match expected value")
+
+    def build_soil_fixtures(self, sand, silt, clay, ompc, bulkd):
+        """Create constant soil rasters shared by tests with the same values.
+
+        The rasters are created once per set of values, in the workspace
+        shared by the test class, so tests must not modify them.
+
+        Parameters:
+            sand (float): proportion sand
+            silt (float): proportion silt
+            clay (float): proportion clay
+            ompc (float): organic matter
+            bulkd (float): bulk density
+
+        Returns:
+            dictionary of raster paths indexed by 'sand', 'silt', 'clay',
+            'ompc' and 'bulkd'
+
+        """
+        fixture_values = (sand, silt, clay, ompc, bulkd)
+        if fixture_values not in self._soil_fixtures:
+            fixture_dir = tempfile.mkdtemp(dir=self.class_workspace_dir)
+            fixture_paths = {}
+            for name, value in zip(
+                    ['sand', 'silt', 'clay', 'ompc', 'bulkd'],
+                    fixture_values):
+                fixture_paths[name] = os.path.join(
+                    fixture_dir, '{}.tif'.format(name))
+                create_constant_raster(fixture_paths[name], value)
+            self._soil_fixtures[fixture_values] = fixture_paths
+        return self._soil_fixtures[fixture_values]
 
     @unittest.skip("did not run the whole model, running unit tests only")
     def test_model_runs(self):
         """Test forage model."""
-        from rangeland_production import forage
-
         if not os.path.exists(SAMPLE_DATA):
             self.fail(
                 "Sample input directory not found at %s" % SAMPLE_DATA)
@@ -1180,30 +1302,19 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         fill_value = 0
-        template_raster = os.path.join(
-            self.workspace_dir, 'template_raster.tif')
+        template_raster = self.workspace_path('template_raster.tif')
 
         create_constant_raster(template_raster, fill_value)
 
         month = 5
-        shwave_path = os.path.join(self.workspace_dir, 'shwave.tif')
+        shwave_path = self.workspace_path('shwave.tif')
         forage._shortwave_radiation(template_raster, month, shwave_path)
 
         # assert the value in the raster `shwave_path` is equal to value
         # calculated by hand
-        result_set = set()
-        for offset_map, raster_block in pygeoprocessing.iterblocks(
-                (shwave_path, 1)):
-            result_set.update(numpy.unique(raster_block))
-        self.assertEqual(
-            len(result_set), 1,
-            msg="One unique value expected in shortwave radiation raster")
-        test_result = list(result_set)[0]
-        self.assertAlmostEqual(
-            test_result, 990.7401, delta=0.01,
-            msg="Test result does not match expected value")
+        self.assert_raster_single_value(
+            shwave_path, 990.7401, 0.01, "shortwave radiation raster")
 
     def test_calc_ompc(self):
         """Test `_calc_ompc`.
@@ -1221,13 +1332,11 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        som1c_2_path = os.path.join(self.workspace_dir, 'som1c_2.tif')
-        som2c_2_path = os.path.join(self.workspace_dir, 'som2c_2.tif')
-        som3c_path = os.path.join(self.workspace_dir, 'som3c.tif')
-        bulk_d_path = os.path.join(self.workspace_dir, 'bulkd.tif')
-        edepth_path = os.path.join(self.workspace_dir, 'edepth.tif')
+        som1c_2_path = self.workspace_path('som1c_2.tif')
+        som2c_2_path = self.workspace_path('som2c_2.tif')
+        som3c_path = self.workspace_path('som3c.tif')
+        bulk_d_path = self.workspace_path('bulkd.tif')
+        edepth_path = self.workspace_path('edepth.tif')
 
         create_constant_raster(som1c_2_path, 42.109)
         create_constant_raster(som2c_2_path, 959.1091)
@@ -1235,7 +1344,7 @@ class foragetests(unittest.TestCase):
         create_constant_raster(bulk_d_path, 1.5)
         create_constant_raster(edepth_path, 0.2)
 
-        ompc_path = os.path.join(self.workspace_dir, 'ompc.tif')
+        ompc_path = self.workspace_path('ompc.tif')
 
         forage._calc_ompc(
             som1c_2_path, som2c_2_path, som3c_path, bulk_d_path, edepth_path,
@@ -1243,17 +1352,8 @@ class foragetests(unittest.TestCase):
 
         # assert the value in the raster `ompc_path` is equal to value
         # calculated by hand
-        result_set = set()
-        for offset_map, raster_block in pygeoprocessing.iterblocks(
-                (ompc_path, 1)):
-            result_set.update(numpy.unique(raster_block))
-        self.assertEqual(
-            len(result_set), 1,
-            msg="One unique value expected in organic matter raster")
-        test_result = list(result_set)[0]
-        self.assertAlmostEqual(
-            test_result, 0.913304, delta=0.0001,
-            msg="Test result does not match expected value")
+        self.assert_raster_single_value(
+            ompc_path, 0.913304, 0.0001, "organic matter raster")
 
     def test_calc_afiel(self):
         """Test `_calc_afiel`.
@@ -1271,38 +1371,18 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        sand_path = os.path.join(self.workspace_dir, 'sand.tif')
-        silt_path = os.path.join(self.workspace_dir, 'silt.tif')
-        clay_path = os.path.join(self.workspace_dir, 'clay.tif')
-        ompc_path = os.path.join(self.workspace_dir, 'ompc.tif')
-        bulkd_path = os.path.join(self.workspace_dir, 'bulkd.tif')
-
-        create_constant_raster(sand_path, 0.39)
-        create_constant_raster(silt_path, 0.41)
-        create_constant_raster(clay_path, 0.2)
-        create_constant_raster(ompc_path, 0.913304)
-        create_constant_raster(bulkd_path, 1.5)
+        soil_paths = self.build_soil_fixtures(0.39, 0.41, 0.2, 0.913304, 1.5)
 
-        afiel_path = os.path.join(self.workspace_dir, 'afiel.tif')
+        afiel_path = self.workspace_path('afiel.tif')
 
         forage._calc_afiel(
-            sand_path, silt_path, clay_path, ompc_path, bulkd_path, afiel_path)
+            soil_paths['sand'], soil_paths['silt'], soil_paths['clay'],
+            soil_paths['ompc'], soil_paths['bulkd'], afiel_path)
 
         # assert the value in the raster `afiel_path` is equal to value
         # calculated by hand
-        result_set = set()
-        for offset_map, raster_block in pygeoprocessing.iterblocks(
-                (afiel_path, 1)):
-            result_set.update(numpy.unique(raster_block))
-        self.assertEqual(
-            len(result_set), 1,
-            msg="One unique value expected in field capacity raster")
-        test_result = list(result_set)[0]
-        self.assertAlmostEqual(
-            test_result, 0.30895, delta=0.0001,
-            msg="Test result does not match expected value")
+        self.assert_raster_single_value(
+            afiel_path, 0.30895, 0.0001, "field capacity raster")
 
     def test_calc_awilt(self):
         """Test `_calc_awilt`.
@@ -1320,38 +1400,18 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        sand_path = os.path.join(self.workspace_dir, 'sand.tif')
-        silt_path = os.path.join(self.workspace_dir, 'silt.tif')
-        clay_path = os.path.join(self.workspace_dir, 'clay.tif')
-        ompc_path = os.path.join(self.workspace_dir, 'ompc.tif')
-        bulkd_path = os.path.join(self.workspace_dir, 'bulkd.tif')
+        soil_paths = self.build_soil_fixtures(0.39, 0.41, 0.2, 0.913304, 1.5)
 
-        create_constant_raster(sand_path, 0.39)
-        create_constant_raster(silt_path, 0.41)
-        create_constant_raster(clay_path, 0.2)
-        create_constant_raster(ompc_path, 0.913304)
-        create_constant_raster(bulkd_path, 1.5)
-
-        awilt_path = os.path.join(self.workspace_dir, 'awilt.tif')
+        awilt_path = self.workspace_path('awilt.tif')
 
         forage._calc_awilt(
-            sand_path, silt_path, clay_path, ompc_path, bulkd_path, awilt_path)
+            soil_paths['sand'], soil_paths['silt'], soil_paths['clay'],
+            soil_paths['ompc'], soil_paths['bulkd'], awilt_path)
 
         # assert the value in the raster `awilt_path` is equal to value
         # calculated by hand
-        result_set = set()
-        for offset_map, raster_block in pygeoprocessing.iterblocks(
-                (awilt_path, 1)):
-            result_set.update(numpy.unique(raster_block))
-        self.assertEqual(
-            len(result_set), 1,
-            msg="One unique value expected in wilting point raster")
-        test_result = list(result_set)[0]
-        self.assertAlmostEqual(
-            test_result, 0.201988, delta=0.0001,
-            msg="Test result does not match expected value")
+        self.assert_raster_single_value(
+            awilt_path, 0.201988, 0.0001, "wilting point raster")
 
     def test_afiel_awilt(self):
         """Test `_afiel_awilt`.
@@ -1373,38 +1433,20 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         site_param_table = {1: {'edepth': 0.2}}
         pp_reg = {
-            'afiel_1_path': os.path.join(self.workspace_dir, 'afiel_1.tif'),
-            'afiel_2_path': os.path.join(self.workspace_dir, 'afiel_2.tif'),
-            'afiel_3_path': os.path.join(self.workspace_dir, 'afiel_3.tif'),
-            'afiel_4_path': os.path.join(self.workspace_dir, 'afiel_4.tif'),
-            'afiel_5_path': os.path.join(self.workspace_dir, 'afiel_5.tif'),
-            'afiel_6_path': os.path.join(self.workspace_dir, 'afiel_6.tif'),
-            'afiel_7_path': os.path.join(self.workspace_dir, 'afiel_7.tif'),
-            'afiel_8_path': os.path.join(self.workspace_dir, 'afiel_8.tif'),
-            'afiel_9_path': os.path.join(self.workspace_dir, 'afiel_9.tif'),
-            'awilt_1_path': os.path.join(self.workspace_dir, 'awilt_1.tif'),
-            'awilt_2_path': os.path.join(self.workspace_dir, 'awilt_2.tif'),
-            'awilt_3_path': os.path.join(self.workspace_dir, 'awilt_3.tif'),
-            'awilt_4_path': os.path.join(self.workspace_dir, 'awilt_4.tif'),
-            'awilt_5_path': os.path.join(self.workspace_dir, 'awilt_5.tif'),
-            'awilt_6_path': os.path.join(self.workspace_dir, 'awilt_6.tif'),
-            'awilt_7_path': os.path.join(self.workspace_dir, 'awilt_7.tif'),
-            'awilt_8_path': os.path.join(self.workspace_dir, 'awilt_8.tif'),
-            'awilt_9_path': os.path.join(self.workspace_dir, 'awilt_9.tif')
-            }
-
-        site_index_path = os.path.join(self.workspace_dir, 'site_index.tif')
-        som1c_2_path = os.path.join(self.workspace_dir, 'som1c_2.tif')
-        som2c_2_path = os.path.join(self.workspace_dir, 'som2c_2.tif')
-        som3c_path = os.path.join(self.workspace_dir, 'som3c.tif')
-        sand_path = os.path.join(self.workspace_dir, 'sand.tif')
-        silt_path = os.path.join(self.workspace_dir, 'silt.tif')
-        clay_path = os.path.join(self.workspace_dir, 'clay.tif')
-        bulk_d_path = os.path.join(self.workspace_dir, 'bulkd.tif')
+            '{}_{}_path'.format(param, lyr): self.workspace_path(
+                '{}_{}.tif'.format(param, lyr))
+            for param in ['afiel', 'awilt'] for lyr in range(1, 10)}
+
+        site_index_path = self.workspace_path('site_index.tif')
+        som1c_2_path = self.workspace_path('som1c_2.tif')
+        som2c_2_path = self.workspace_path('som2c_2.tif')
+        som3c_path = self.workspace_path('som3c.tif')
+        sand_path = self.workspace_path('sand.tif')
+        silt_path = self.workspace_path('silt.tif')
+        clay_path = self.workspace_path('clay.tif')
+        bulk_d_path = self.workspace_path('bulkd.tif')
 
         create_random_raster(site_index_path, 1, 1)
         create_random_raster(som1c_2_path, 35., 55.)
@@ -1424,7 +1466,7 @@ class foragetests(unittest.TestCase):
             som2c_2_path, som3c_path, sand_path, silt_path, clay_path,
             bulk_d_path, pp_reg)
 
-        for key, path in pp_reg.items():
+        for path in pp_reg.values():
             self.assert_all_values_in_raster_within_range(
                 path, minimum_acceptable_value,
                 maximum_acceptable_value, nodata_value)
@@ -1437,7 +1479,7 @@ class foragetests(unittest.TestCase):
                 site_index_path, site_param_table, som1c_2_path,
                 som2c_2_path, som3c_path, sand_path, silt_path, clay_path,
                 bulk_d_path, pp_reg)
-            for key, path in pp_reg.items():
+            for path in pp_reg.values():
                 self.assert_all_values_in_raster_within_range(
                     path, minimum_acceptable_value,
                     maximum_acceptable_value, nodata_value)
@@ -1476,6 +1518,97 @@ class foragetests(unittest.TestCase):
             pp_reg['awilt_6_path'], known_awilt_6 - tolerance,
             known_awilt_6 + tolerance, nodata_value)
 
+    def test_site_param_rasters(self):
+        """Test `_site_param_rasters`.
+
+        Use the function `_site_param_rasters` to make rasters of two
+        site-level parameters from a site index raster containing three sites
+        and nodata. Test that the rasters match the result of reclassifying
+        the site index raster one parameter at a time, including a raster
+        with its own target path and nodata value. Test that a site index
+        value missing from the site parameter table raises ValueError.
+
+        Raises:
+            AssertionError if a parameter raster differs from the
+                reclassified site index raster
+            AssertionError if a site missing from the site parameter table
+                does not raise ValueError
+
+        Returns:
+            None
+
+        """
+        site_index_nodata = -1
+        site_index_array = _RNG.integers(1, 4, size=(10, 10)).astype(
+            numpy.float32)
+        insert_nodata_values_into_array(site_index_array, site_index_nodata)
+        # make sure that site 3 is present in the site index
+        site_index_array[0, 0] = 3
+        site_index_path = self.workspace_path('site_index.tif')
+        site_index_raster = _GTIFF_DRIVER.Create(
+            site_index_path.encode('utf-8'), 10, 10, 1, gdal.GDT_Float32)
+        site_index_raster.SetProjection(_WGS84_WKT)
+        site_index_raster.SetGeoTransform(_CONSTANT_RASTER_GEOTRANSFORM)
+        site_index_band = site_index_raster.GetRasterBand(1)
+        site_index_band.SetNoDataValue(site_index_nodata)
+        site_index_band.WriteArray(site_index_array)
+        site_index_band = None
+        site_index_raster = None
+
+        site_param_table = dict(
+            (site, {
+                'omlech_1': _RNG.uniform(0.01, 0.05),
+                'omlech_2': _RNG.uniform(0.06, 0.18)})
+            for site in [1, 2, 3])
+        param_dir = self.workspace_path('params')
+        os.makedirs(param_dir)
+        param_val_dict = forage._site_param_rasters(
+            site_index_path, site_param_table, ['omlech_1', 'omlech_2'],
+            param_dir)
+
+        for val in ['omlech_1', 'omlech_2']:
+            expected_path = self.workspace_path('{}_expected.tif'.format(val))
+            pygeoprocessing.reclassify_raster(
+                (site_index_path, 1), dict(
+                    (site, float(table[val])) for (site, table) in
+                    site_param_table.items()),
+                expected_path, gdal.GDT_Float32, forage._IC_NODATA)
+            numpy.testing.assert_array_equal(
+                pygeoprocessing.raster_to_numpy_array(param_val_dict[val]),
+                pygeoprocessing.raster_to_numpy_array(expected_path))
+
+        # one parameter raster at its own path, with its own nodata value
+        omlech_2_path = self.workspace_path('omlech_2_target.tif')
+        param_val_dict = forage._site_param_rasters(
+            site_index_path, site_param_table, ['omlech_1', 'omlech_2'],
+            param_dir, target_path_dict={'omlech_2': omlech_2_path},
+            target_nodata_dict={'omlech_2': _TARGET_NODATA})
+        self.assertEqual(param_val_dict['omlech_2'], omlech_2_path)
+        self.assertEqual(
+            pygeoprocessing.get_raster_info(omlech_2_path)['nodata'][0],
+            _TARGET_NODATA)
+        expected_path = self.workspace_path('omlech_2_expected.tif')
+        pygeoprocessing.reclassify_raster(
+            (site_index_path, 1), dict(
+                (site, float(table['omlech_2'])) for (site, table) in
+                site_param_table.items()),
+            expected_path, gdal.GDT_Float32, _TARGET_NODATA)
+        numpy.testing.assert_array_equal(
+            pygeoprocessing.raster_to_numpy_array(omlech_2_path),
+            pygeoprocessing.raster_to_numpy_array(expected_path))
+
+        # site 3 is missing from the site parameter table
+        del site_param_table[3]
+        with self.assertRaises(ValueError):
+            forage._site_param_rasters(
+                site_index_path, site_param_table, ['omlech_1', 'omlech_2'],
+                param_dir)
+
+        # no sites in the site parameter table
+        with self.assertRaises(ValueError):
+            forage._site_param_rasters(
+                site_index_path, {}, ['omlech_1', 'omlech_2'], param_dir)
+
     def test_persistent_params(self):
         """Test `persistent_params`.
 
@@ -1496,38 +1629,36 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         site_param_table = {
             1: {
-                'peftxa': numpy.random.uniform(0.15, 0.35),
-                'peftxb': numpy.random.uniform(0.65, 0.85),
-                'p1co2a_2': numpy.random.uniform(0.1, 0.2),
-                'p1co2b_2': numpy.random.uniform(0.58, 0.78),
-                'ps1s3_1': numpy.random.uniform(0.58, 0.78),
-                'ps1s3_2': numpy.random.uniform(0.02, 0.04),
-                'ps2s3_1': numpy.random.uniform(0.58, 0.78),
-                'ps2s3_2': numpy.random.uniform(0.001, 0.005),
-                'omlech_1': numpy.random.uniform(0.01, 0.05),
-                'omlech_2': numpy.random.uniform(0.06, 0.18),
+                'peftxa': _RNG.uniform(0.15, 0.35),
+                'peftxb': _RNG.uniform(0.65, 0.85),
+                'p1co2a_2': _RNG.uniform(0.1, 0.2),
+                'p1co2b_2': _RNG.uniform(0.58, 0.78),
+                'ps1s3_1': _RNG.uniform(0.58, 0.78),
+                'ps1s3_2': _RNG.uniform(0.02, 0.04),
+                'ps2s3_1': _RNG.uniform(0.58, 0.78),
+                'ps2s3_2': _RNG.uniform(0.001, 0.005),
+                'omlech_1': _RNG.uniform(0.01, 0.05),
+                'omlech_2': _RNG.uniform(0.06, 0.18),
                 'vlossg': 1},
                 }
 
         pp_reg = {
-            'afiel_1_path': os.path.join(self.workspace_dir, 'afiel_1.tif'),
-            'awilt_1_path': os.path.join(self.workspace_dir, 'awilt.tif'),
-            'wc_path': os.path.join(self.workspace_dir, 'wc.tif'),
-            'eftext_path': os.path.join(self.workspace_dir, 'eftext.tif'),
-            'p1co2_2_path': os.path.join(self.workspace_dir, 'p1co2_2.tif'),
-            'fps1s3_path': os.path.join(self.workspace_dir, 'fps1s3.tif'),
-            'fps2s3_path': os.path.join(self.workspace_dir, 'fps2s3.tif'),
-            'orglch_path': os.path.join(self.workspace_dir, 'orglch.tif'),
-            'vlossg_path': os.path.join(self.workspace_dir, 'vlossg.tif'),
+            'afiel_1_path': self.workspace_path('afiel_1.tif'),
+            'awilt_1_path': self.workspace_path('awilt.tif'),
+            'wc_path': self.workspace_path('wc.tif'),
+            'eftext_path': self.workspace_path('eftext.tif'),
+            'p1co2_2_path': self.workspace_path('p1co2_2.tif'),
+            'fps1s3_path': self.workspace_path('fps1s3.tif'),
+            'fps2s3_path': self.workspace_path('fps2s3.tif'),
+            'orglch_path': self.workspace_path('orglch.tif'),
+            'vlossg_path': self.workspace_path('vlossg.tif'),
         }
 
-        site_index_path = os.path.join(self.workspace_dir, 'site_index.tif')
-        sand_path = os.path.join(self.workspace_dir, 'sand.tif')
-        clay_path = os.path.join(self.workspace_dir, 'clay.tif')
+        site_index_path = self.workspace_path('site_index.tif')
+        sand_path = self.workspace_path('sand.tif')
+        clay_path = self.workspace_path('clay.tif')
 
         create_random_raster(site_index_path, 1, 1)
         create_random_raster(sand_path, 0., 0.5)
@@ -1573,14 +1704,16 @@ class foragetests(unittest.TestCase):
                 },
         }
 
+        range_checks = [
+            (pp_reg[path], ranges['minimum_acceptable_value'],
+             ranges['maximum_acceptable_value'], ranges['nodata_value'])
+            for path, ranges in acceptable_range_dict.items()]
+
         forage._persistent_params(
             site_index_path, site_param_table, sand_path, clay_path, pp_reg)
 
-        for path, ranges in acceptable_range_dict.items():
-            self.assert_all_values_in_raster_within_range(
-                pp_reg[path], ranges['minimum_acceptable_value'],
-                ranges['maximum_acceptable_value'],
-                ranges['nodata_value'])
+        for range_check in range_checks:
+            self.assert_all_values_in_raster_within_range(*range_check)
 
         for input_raster in [
                 site_index_path, sand_path, clay_path]:
@@ -1589,11 +1722,8 @@ class foragetests(unittest.TestCase):
                 site_index_path, site_param_table, sand_path, clay_path,
                 pp_reg)
 
-            for path, ranges in acceptable_range_dict.items():
-                self.assert_all_values_in_raster_within_range(
-                    pp_reg[path], ranges['minimum_acceptable_value'],
-                    ranges['maximum_acceptable_value'],
-                    ranges['nodata_value'])
+            for range_check in range_checks:
+                self.assert_all_values_in_raster_within_range(*range_check)
 
         # known inputs
         site_param_table[1]['peftxa'] = 0.2
@@ -1674,16 +1804,15 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         array_shape = (10, 10)
         tolerance = 0.0001
 
-        tca = numpy.random.uniform(300, 700, array_shape)
-        anps = numpy.random.uniform(1, numpy.amin(tca), array_shape)
-        pcemic_1 = numpy.random.uniform(12, 20, array_shape)
-        pcemic_2 = numpy.random.uniform(3, 11, array_shape)
-        pcemic_3 = numpy.random.uniform(0.001, 0.1, array_shape)
+        tca = _RNG.uniform(300, 700, array_shape).astype(numpy.float32)
+        anps = _RNG.uniform(1, numpy.amin(tca), array_shape).astype(
+            numpy.float32)
+        pcemic_1 = _RNG.uniform(12, 20, array_shape).astype(numpy.float32)
+        pcemic_2 = _RNG.uniform(3, 11, array_shape).astype(numpy.float32)
+        pcemic_3 = _RNG.uniform(0.001, 0.1, array_shape).astype(numpy.float32)
 
         minimum_acceptable_agdrat = 2.285
         maximum_acceptable_agdrat = numpy.amax(pcemic_1)
@@ -1724,17 +1853,9 @@ class foragetests(unittest.TestCase):
         point_agdrat = agdrat_point(anps, tca, pcemic_1, pcemic_2, pcemic_3)
         self.assertAlmostEqual(known_agdrat, point_agdrat)
 
-        tca_ar = numpy.full(array_shape, tca)
-        anps_ar = numpy.full(array_shape, anps)
-        pcemic_1_ar = numpy.full(array_shape, pcemic_1)
-        pcemic_2_ar = numpy.full(array_shape, pcemic_2)
-        pcemic_3_ar = numpy.full(array_shape, pcemic_3)
-
         agdrat = forage._aboveground_ratio(
-            anps_ar, tca_ar, pcemic_1_ar, pcemic_2_ar, pcemic_3_ar)
-        self.assert_all_values_in_array_within_range(
-            agdrat, point_agdrat - tolerance, point_agdrat + tolerance,
-            agdrat_nodata)
+            anps, tca, pcemic_1, pcemic_2, pcemic_3)
+        self.assertAlmostEqual(float(agdrat), point_agdrat, delta=tolerance)
 
         # known inputs: econt < pcemic_3
         tca = 413.
@@ -1744,17 +1865,9 @@ class foragetests(unittest.TestCase):
         pcemic_3 = 0.11
         point_agdrat = agdrat_point(anps, tca, pcemic_1, pcemic_2, pcemic_3)
 
-        tca_ar = numpy.full(array_shape, tca)
-        anps_ar = numpy.full(array_shape, anps)
-        pcemic_1_ar = numpy.full(array_shape, pcemic_1)
-        pcemic_2_ar = numpy.full(array_shape, pcemic_2)
-        pcemic_3_ar = numpy.full(array_shape, pcemic_3)
-
         agdrat = forage._aboveground_ratio(
-            anps_ar, tca_ar, pcemic_1_ar, pcemic_2_ar, pcemic_3_ar)
-        self.assert_all_values_in_array_within_range(
-            agdrat, point_agdrat - tolerance, point_agdrat + tolerance,
-            agdrat_nodata)
+            anps, tca, pcemic_1, pcemic_2, pcemic_3)
+        self.assertAlmostEqual(float(agdrat), point_agdrat, delta=tolerance)
 
     def test_structural_ratios(self):
         """Test `_structural_ratios`.
@@ -1780,66 +1893,54 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         site_param_table = {
             1: {
-                'pcemic1_2_1': numpy.random.uniform(5, 12),
-                'pcemic1_1_1': numpy.random.uniform(13, 23),
-                'pcemic1_3_1': numpy.random.uniform(0.01, 0.05),
-                'pcemic2_2_1': numpy.random.uniform(5, 12),
-                'pcemic2_1_1': numpy.random.uniform(13, 23),
-                'pcemic2_3_1': numpy.random.uniform(0.01, 0.05),
-                'rad1p_1_1': numpy.random.uniform(8, 16),
-                'rad1p_2_1': numpy.random.uniform(2, 5),
-                'rad1p_3_1': numpy.random.uniform(2, 5),
-                'varat1_1_1': numpy.random.uniform(12, 16),
-                'varat22_1_1': numpy.random.uniform(15, 25),
-
-                'pcemic1_2_2': numpy.random.uniform(90, 110),
-                'pcemic1_1_2': numpy.random.uniform(170, 230),
-                'pcemic1_3_2': numpy.random.uniform(0.0005, 0.0025),
-                'pcemic2_2_2': numpy.random.uniform(75, 125),
-                'pcemic2_1_2': numpy.random.uniform(200, 300),
-                'pcemic2_3_2': numpy.random.uniform(0.0005, 0.0025),
-                'rad1p_1_2': numpy.random.uniform(200, 300),
-                'rad1p_2_2': numpy.random.uniform(3, 7),
-                'rad1p_3_2': numpy.random.uniform(50, 150),
-                'varat1_1_2': numpy.random.uniform(125, 175),
-                'varat22_1_2': numpy.random.uniform(350, 450)},
+                'pcemic1_2_1': _RNG.uniform(5, 12),
+                'pcemic1_1_1': _RNG.uniform(13, 23),
+                'pcemic1_3_1': _RNG.uniform(0.01, 0.05),
+                'pcemic2_2_1': _RNG.uniform(5, 12),
+                'pcemic2_1_1': _RNG.uniform(13, 23),
+                'pcemic2_3_1': _RNG.uniform(0.01, 0.05),
+                'rad1p_1_1': _RNG.uniform(8, 16),
+                'rad1p_2_1': _RNG.uniform(2, 5),
+                'rad1p_3_1': _RNG.uniform(2, 5),
+                'varat1_1_1': _RNG.uniform(12, 16),
+                'varat22_1_1': _RNG.uniform(15, 25),
+
+                'pcemic1_2_2': _RNG.uniform(90, 110),
+                'pcemic1_1_2': _RNG.uniform(170, 230),
+                'pcemic1_3_2': _RNG.uniform(0.0005, 0.0025),
+                'pcemic2_2_2': _RNG.uniform(75, 125),
+                'pcemic2_1_2': _RNG.uniform(200, 300),
+                'pcemic2_3_2': _RNG.uniform(0.0005, 0.0025),
+                'rad1p_1_2': _RNG.uniform(200, 300),
+                'rad1p_2_2': _RNG.uniform(3, 7),
+                'rad1p_3_2': _RNG.uniform(50, 150),
+                'varat1_1_2': _RNG.uniform(125, 175),
+                'varat22_1_2': _RNG.uniform(350, 450)},
                 }
 
         sv_reg = {
-            'strucc_1_path': os.path.join(self.workspace_dir, 'strucc_1.tif'),
-            'struce_1_1_path': os.path.join(
-                self.workspace_dir, 'struce_1_1.tif'),
-            'struce_1_2_path': os.path.join(
-                self.workspace_dir, 'struce_1_2.tif'),
+            'strucc_1_path': self.workspace_path('strucc_1.tif'),
+            'struce_1_1_path': self.workspace_path('struce_1_1.tif'),
+            'struce_1_2_path': self.workspace_path('struce_1_2.tif'),
 
         }
-        site_index_path = os.path.join(self.workspace_dir, 'site_index.tif')
+        site_index_path = self.workspace_path('site_index.tif')
         create_random_raster(site_index_path, 1, 1)
         create_random_raster(sv_reg['strucc_1_path'], 120, 1800)
         create_random_raster(sv_reg['struce_1_1_path'], 0.5, 10)
         create_random_raster(sv_reg['struce_1_2_path'], 0.1, 0.50)
 
         pp_reg = {
-            'rnewas_1_1_path': os.path.join(
-                self.workspace_dir, 'rnewas_1_1.tif'),
-            'rnewas_1_2_path': os.path.join(
-                self.workspace_dir, 'rnewas_1_2.tif'),
-            'rnewas_2_1_path': os.path.join(
-                self.workspace_dir, 'rnewas_2_1.tif'),
-            'rnewas_2_2_path': os.path.join(
-                self.workspace_dir, 'rnewas_2_2.tif'),
-            'rnewbs_1_1_path': os.path.join(
-                self.workspace_dir, 'rnewbs_1_1.tif'),
-            'rnewbs_1_2_path': os.path.join(
-                self.workspace_dir, 'rnewbs_1_2.tif'),
-            'rnewbs_2_1_path': os.path.join(
-                self.workspace_dir, 'rnewbs_2_1.tif'),
-            'rnewbs_2_2_path': os.path.join(
-                self.workspace_dir, 'rnewbs_2_2.tif'),
+            'rnewas_1_1_path': self.workspace_path('rnewas_1_1.tif'),
+            'rnewas_1_2_path': self.workspace_path('rnewas_1_2.tif'),
+            'rnewas_2_1_path': self.workspace_path('rnewas_2_1.tif'),
+            'rnewas_2_2_path': self.workspace_path('rnewas_2_2.tif'),
+            'rnewbs_1_1_path': self.workspace_path('rnewbs_1_1.tif'),
+            'rnewbs_1_2_path': self.workspace_path('rnewbs_1_2.tif'),
+            'rnewbs_2_1_path': self.workspace_path('rnewbs_2_1.tif'),
+            'rnewbs_2_2_path': self.workspace_path('rnewbs_2_2.tif'),
         }
 
         minimum_acceptable_value = 1
@@ -1849,7 +1950,7 @@ class foragetests(unittest.TestCase):
         forage._structural_ratios(
             site_index_path, site_param_table, sv_reg, pp_reg)
 
-        for key, path in pp_reg.items():
+        for path in pp_reg.values():
             self.assert_all_values_in_raster_within_range(
                 path, minimum_acceptable_value,
                 maximum_acceptable_value, nodata_value)
@@ -1861,7 +1962,7 @@ class foragetests(unittest.TestCase):
             forage._structural_ratios(
                 site_index_path, site_param_table, sv_reg, pp_reg)
 
-            for key, path in pp_reg.items():
+            for path in pp_reg.values():
                 self.assert_all_values_in_raster_within_range(
                     path, minimum_acceptable_value,
                     maximum_acceptable_value, nodata_value)
@@ -1891,13 +1992,11 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        month_index = numpy.random.randint(0, 100)
+        month_index = _RNG.integers(0, 100)
         site_param_table = {
             1: {
-                'epnfa_1': numpy.random.uniform(0, 1),
-                'epnfa_2': numpy.random.uniform(0, 0.5),
+                'epnfa_1': _RNG.uniform(0, 1),
+                'epnfa_2': _RNG.uniform(0, 0.5),
 
                 }
             }
@@ -1911,21 +2010,18 @@ class foragetests(unittest.TestCase):
         }
         pft_id_set = [1]
         complete_aligned_inputs = {
-            'precip_{}'.format(month): os.path.join(
-                self.workspace_dir, 'precip_{}.tif'.format(month)) for
+            'precip_{}'.format(month): self.workspace_path(
+                'precip_{}.tif'.format(month)) for
             month in range(month_index, month_index + 12)
         }
-        complete_aligned_inputs['site_index'] = os.path.join(
-            self.workspace_dir, 'site_index.tif')
+        complete_aligned_inputs['site_index'] = self.workspace_path(
+            'site_index.tif')
 
         year_reg = {
-            'annual_precip_path': os.path.join(
-                self.workspace_dir, 'annual_precip.tif'),
-            'baseNdep_path': os.path.join(self.workspace_dir, 'baseNdep.tif'),
-            'pltlig_above_1': os.path.join(
-                self.workspace_dir, 'pltlig_above.tif'),
-            'pltlig_below_1': os.path.join(
-                self.workspace_dir, 'pltlig_below.tif'),
+            'annual_precip_path': self.workspace_path('annual_precip.tif'),
+            'baseNdep_path': self.workspace_path('baseNdep.tif'),
+            'pltlig_above_1': self.workspace_path('pltlig_above.tif'),
+            'pltlig_below_1': self.workspace_path('pltlig_below.tif'),
         }
 
         create_random_raster(complete_aligned_inputs['site_index'], 1, 1)
@@ -1938,7 +2034,7 @@ class foragetests(unittest.TestCase):
         # fewer than 12 months of precip rasters
         modified_inputs = complete_aligned_inputs.copy()
         removed_key = modified_inputs.pop('precip_{}'.format(
-            numpy.random.randint(month_index, month_index + 12)))
+            _RNG.integers(month_index, month_index + 12)))
         with self.assertRaises(ValueError):
             forage._yearly_tasks(
                 modified_inputs, site_param_table, veg_trait_table,
@@ -2069,19 +2165,17 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        max_temp_path = os.path.join(self.workspace_dir, 'max_temp.tif')
-        min_temp_path = os.path.join(self.workspace_dir, 'min_temp.tif')
-        shwave_path = os.path.join(self.workspace_dir, 'shwave.tif')
-        fwloss_4_path = os.path.join(self.workspace_dir, 'fwloss_4.tif')
+        max_temp_path = self.workspace_path('max_temp.tif')
+        min_temp_path = self.workspace_path('min_temp.tif')
+        shwave_path = self.workspace_path('shwave.tif')
+        fwloss_4_path = self.workspace_path('fwloss_4.tif')
 
         create_random_raster(max_temp_path, 21, 40)
         create_random_raster(min_temp_path, -20, 20)
         create_random_raster(shwave_path, 0, 1125)
         create_random_raster(fwloss_4_path, 0, 1)
 
-        pevap_path = os.path.join(self.workspace_dir, 'pevap.tif')
+        pevap_path = self.workspace_path('pevap.tif')
 
         minimum_acceptable_ET = 0
         maximum_acceptable_ET = 32
@@ -2144,20 +2238,17 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         month_index = 10
         current_month = 6
         pft_id_set = set([1, 2])
 
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site_index.tif'),
-            'max_temp_{}'.format(current_month): os.path.join(
-                self.workspace_dir, 'max_temp.tif'),
-            'min_temp_{}'.format(current_month): os.path.join(
-                self.workspace_dir, 'min_temp.tif'),
-            'precip_{}'.format(month_index): os.path.join(
-                self.workspace_dir, 'precip.tif'),
+            'site_index': self.workspace_path('site_index.tif'),
+            'max_temp_{}'.format(current_month): self.workspace_path(
+                'max_temp.tif'),
+            'min_temp_{}'.format(current_month): self.workspace_path(
+                'min_temp.tif'),
+            'precip_{}'.format(month_index): self.workspace_path('precip.tif'),
         }
         create_random_raster(aligned_inputs['site_index'], 1, 1)
         create_random_raster(
@@ -2168,61 +2259,61 @@ class foragetests(unittest.TestCase):
             aligned_inputs['precip_{}'.format(month_index)], 0, 6)
 
         for pft_i in pft_id_set:
-            aligned_inputs['pft_{}'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'pft_{}.tif'.format(pft_i))
+            aligned_inputs['pft_{}'.format(pft_i)] = self.workspace_path(
+                'pft_{}.tif'.format(pft_i))
             create_random_raster(
                 aligned_inputs['pft_{}'.format(pft_i)], 0, 1)
 
         site_param_table = {
             1: {
-                'pmxbio': numpy.random.uniform(500, 700),
-                'pmxtmp': numpy.random.uniform(-0.0025, 0),
-                'pmntmp': numpy.random.uniform(0, 0.01),
-                'fwloss_4': numpy.random.uniform(0, 1),
-                'pprpts_1': numpy.random.uniform(0, 1),
-                'pprpts_2': numpy.random.uniform(0.5, 1.5),
-                'pprpts_3': numpy.random.uniform(0, 1),
+                'pmxbio': _RNG.uniform(500, 700),
+                'pmxtmp': _RNG.uniform(-0.0025, 0),
+                'pmntmp': _RNG.uniform(0, 0.01),
+                'fwloss_4': _RNG.uniform(0, 1),
+                'pprpts_1': _RNG.uniform(0, 1),
+                'pprpts_2': _RNG.uniform(0.5, 1.5),
+                'pprpts_3': _RNG.uniform(0, 1),
             }
         }
         veg_trait_table = {}
         for pft_i in pft_id_set:
             veg_trait_table[pft_i] = {
-                'ppdf_1': numpy.random.uniform(10, 30),
-                'ppdf_2': numpy.random.uniform(31, 50),
-                'ppdf_3': numpy.random.uniform(0, 1),
-                'ppdf_4': numpy.random.uniform(0, 10),
-                'biok5': numpy.random.uniform(0, 2000),
-                'prdx_1': numpy.random.uniform(0.1, 0.6),
+                'ppdf_1': _RNG.uniform(10, 30),
+                'ppdf_2': _RNG.uniform(31, 50),
+                'ppdf_3': _RNG.uniform(0, 1),
+                'ppdf_4': _RNG.uniform(0, 10),
+                'biok5': _RNG.uniform(0, 2000),
+                'prdx_1': _RNG.uniform(0.1, 0.6),
                 'growth_months': ['3', '4', '5', '6'],
             }
 
         sv_reg = {
-            'strucc_1_path': os.path.join(self.workspace_dir, 'strucc_1.tif'),
+            'strucc_1_path': self.workspace_path('strucc_1.tif'),
         }
         create_random_raster(sv_reg['strucc_1_path'], 0, 200)
         for pft_i in pft_id_set:
-            sv_reg['aglivc_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'aglivc_{}.tif'.format(pft_i))
+            sv_reg['aglivc_{}_path'.format(pft_i)] = self.workspace_path(
+                'aglivc_{}.tif'.format(pft_i))
             create_random_raster(sv_reg['aglivc_{}_path'.format(pft_i)], 0, 50)
-            sv_reg['stdedc_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'stdedc_{}.tif'.format(pft_i))
+            sv_reg['stdedc_{}_path'.format(pft_i)] = self.workspace_path(
+                'stdedc_{}.tif'.format(pft_i))
             create_random_raster(sv_reg['stdedc_{}_path'.format(pft_i)], 0, 50)
-            sv_reg['avh2o_1_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'avh2o_1_{}.tif'.format(pft_i))
+            sv_reg['avh2o_1_{}_path'.format(pft_i)] = self.workspace_path(
+                'avh2o_1_{}.tif'.format(pft_i))
             create_random_raster(
                 sv_reg['avh2o_1_{}_path'.format(pft_i)], 0, 3.5)
 
         pp_reg = {
-            'wc_path': os.path.join(self.workspace_dir, 'wc.tif')
+            'wc_path': self.workspace_path('wc.tif')
         }
         create_random_raster(pp_reg['wc_path'], 0.01, 0.9)
 
         month_reg = {}
         for pft_i in pft_id_set:
-            month_reg['h2ogef_1_{}'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'h2ogef_1_{}.tif'.format(pft_i))
-            month_reg['tgprod_pot_prod_{}'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'tgprod_pot_prod_{}.tif'.format(pft_i))
+            month_reg['h2ogef_1_{}'.format(pft_i)] = self.workspace_path(
+                'h2ogef_1_{}.tif'.format(pft_i))
+            month_reg['tgprod_pot_prod_{}'.format(pft_i)] = (
+                self.workspace_path('tgprod_pot_prod_{}.tif'.format(pft_i)))
 
         minimum_acceptable_h2ogef_1 = 0.009
         maximum_acceptable_h2ogef_1 = 1
@@ -2315,17 +2406,14 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         sv_reg = {
-            'minerl_1_1_path': os.path.join(
-                self.workspace_dir, 'minerl_1_1.tif')
+            'minerl_1_1_path': self.workspace_path('minerl_1_1.tif')
         }
         param_val_dict = {
-            'favail_4': os.path.join(self.workspace_dir, 'favail_4.tif'),
-            'favail_5': os.path.join(self.workspace_dir, 'favail_5.tif'),
-            'favail_6': os.path.join(self.workspace_dir, 'favail_6.tif'),
-            'favail_2': os.path.join(self.workspace_dir, 'favail_2.tif'),
+            'favail_4': self.workspace_path('favail_4.tif'),
+            'favail_5': self.workspace_path('favail_5.tif'),
+            'favail_6': self.workspace_path('favail_6.tif'),
+            'favail_2': self.workspace_path('favail_2.tif'),
         }
 
         create_random_raster(sv_reg['minerl_1_1_path'], 3, 8)
@@ -2385,18 +2473,16 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        num_rasters = numpy.random.randint(1, 10)
+        num_rasters = _RNG.integers(1, 10)
         raster_list = [
-            os.path.join(self.workspace_dir, '{}.tif'.format(r)) for r in
+            self.workspace_path('{}.tif'.format(r)) for r in
             range(num_rasters)]
 
         for input_raster in raster_list:
             create_random_raster(input_raster, 1, 1)
 
         input_nodata = -999
-        target_path = os.path.join(self.workspace_dir, 'result.tif')
+        target_path = self.workspace_path('result.tif')
         target_nodata = -9.99
 
         # input rasters include no nodata values
@@ -2430,11 +2516,9 @@ class foragetests(unittest.TestCase):
         input_array = input_band.ReadAsArray()
         result_array = result_band.ReadAsArray()
 
-        sum_input_mask = numpy.sum(input_array[input_array == input_nodata])
-        sum_result_mask = numpy.sum(input_array[result_array == target_nodata])
-
-        self.assertEqual(
-            sum_input_mask, sum_result_mask,
+        self.assertTrue(
+            numpy.array_equal(
+                input_array == input_nodata, result_array == target_nodata),
             msg="Result raster must contain nodata values in same " +
             "position as input")
 
@@ -2448,14 +2532,11 @@ class foragetests(unittest.TestCase):
             nodata_remove=True)
 
         # assert that minimum value in target_path is num_rasters - 1
-        for offset_map, raster_block in pygeoprocessing.iterblocks(
-                (target_path, 1)):
-            if len(raster_block[raster_block != target_nodata]) == 0:
-                continue
-            min_val = numpy.amin(
-                raster_block[raster_block != target_nodata])
+        result_array = pygeoprocessing.raster_to_numpy_array(target_path)
+        valid_values = result_array[result_array != target_nodata]
+        if valid_values.size > 0:
             self.assertGreaterEqual(
-                min_val, (num_rasters - 1),
+                valid_values.min(), (num_rasters - 1),
                 msg="Raster appears to contain nodata values")
 
     def test_weighted_state_variable_sum(self):
@@ -2474,8 +2555,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         sv = 'state_variable'
         pft_id_set = [2, 5, 7]
         percent_cover_dict = {
@@ -2491,18 +2570,17 @@ class foragetests(unittest.TestCase):
         sv_reg = {}
         aligned_inputs = {}
         for pft_i in pft_id_set:
-            aligned_inputs['pft_{}'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'pft_{}.tif'.format(pft_i))
+            aligned_inputs['pft_{}'.format(pft_i)] = self.workspace_path(
+                'pft_{}.tif'.format(pft_i))
             create_constant_raster(
                 aligned_inputs['pft_{}'.format(pft_i)],
                 percent_cover_dict[pft_i])
-            sv_reg['{}_{}_path'.format(sv, pft_i)] = os.path.join(
-                self.workspace_dir, '{}_{}.tif'.format(sv, pft_i))
+            sv_reg['{}_{}_path'.format(sv, pft_i)] = self.workspace_path(
+                '{}_{}.tif'.format(sv, pft_i))
             create_constant_raster(
                 sv_reg['{}_{}_path'.format(sv, pft_i)],
                 sv_value_dict[pft_i])
-        weighted_sum_path = os.path.join(
-            self.workspace_dir, 'weighted_sum.tif')
+        weighted_sum_path = self.workspace_path('weighted_sum.tif')
 
         tolerance = 0.0001
 
@@ -2555,32 +2633,30 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        pft_i = numpy.random.randint(0, 4)
+        pft_i = _RNG.integers(0, 4)
         pft_param_dict = {
-            'snfxmx_1': numpy.random.uniform(0, 1),
-            'nlaypg': numpy.random.randint(1, 10),
+            'snfxmx_1': _RNG.uniform(0, 1),
+            'nlaypg': _RNG.integers(1, 10),
         }
         sv_reg = {
-            'bglivc_{}_path'.format(pft_i): os.path.join(
-                self.workspace_dir, 'bglivc_path.tif'),
-            'crpstg_1_{}_path'.format(pft_i): os.path.join(
-                self.workspace_dir, 'crpstg_1_{}.tif'.format(pft_i)),
-            'crpstg_2_{}_path'.format(pft_i): os.path.join(
-                self.workspace_dir, 'crpstg_2_{}.tif'.format(pft_i)),
+            'bglivc_{}_path'.format(pft_i): self.workspace_path(
+                'bglivc_path.tif'),
+            'crpstg_1_{}_path'.format(pft_i): self.workspace_path(
+                'crpstg_1_{}.tif'.format(pft_i)),
+            'crpstg_2_{}_path'.format(pft_i): self.workspace_path(
+                'crpstg_2_{}.tif'.format(pft_i)),
         }
 
         site_param_table = {
             1: {
-                'rictrl': numpy.random.uniform(0.005, 0.02),
-                'riint': numpy.random.uniform(0.6, 1),
+                'rictrl': _RNG.uniform(0.005, 0.02),
+                'riint': _RNG.uniform(0.6, 1),
                 }
             }
-        site_index_path = os.path.join(self.workspace_dir, 'site_index.tif')
-        favail_path = os.path.join(self.workspace_dir, 'favail.tif')
-        tgprod_path = os.path.join(self.workspace_dir, 'tgprod.tif')
-        availm_path = os.path.join(self.workspace_dir, 'availm.tif')
+        site_index_path = self.workspace_path('site_index.tif')
+        favail_path = self.workspace_path('favail.tif')
+        tgprod_path = self.workspace_path('tgprod.tif')
+        availm_path = self.workspace_path('availm.tif')
 
         create_random_raster(site_index_path, 1, 1)
         create_random_raster(sv_reg['bglivc_{}_path'.format(pft_i)], 90, 180)
@@ -2590,7 +2666,7 @@ class foragetests(unittest.TestCase):
         create_random_raster(tgprod_path, 0, 675)
         create_random_raster(availm_path, 0, 55)
 
-        eavail_path = os.path.join(self.workspace_dir, 'eavail.tif')
+        eavail_path = self.workspace_path('eavail.tif')
 
         minimum_acceptable_eavail = 0
         maximum_acceptable_evail = 323
@@ -2642,7 +2718,7 @@ class foragetests(unittest.TestCase):
         tolerance = 0.0001
 
         iel = 1
-        eavail_path = os.path.join(self.workspace_dir, 'eavail_N.tif')
+        eavail_path = self.workspace_path('eavail_N.tif')
         forage._calc_available_nutrient(
             pft_i, iel, pft_param_dict, sv_reg, site_param_table,
             site_index_path, availm_path, favail_path, tgprod_path,
@@ -2653,7 +2729,7 @@ class foragetests(unittest.TestCase):
             known_N_avail + tolerance, _TARGET_NODATA)
 
         iel = 2
-        eavail_path = os.path.join(self.workspace_dir, 'eavail_P.tif')
+        eavail_path = self.workspace_path('eavail_P.tif')
         forage._calc_available_nutrient(
             pft_i, iel, pft_param_dict, sv_reg, site_param_table,
             site_index_path, availm_path, favail_path, tgprod_path,
@@ -2682,18 +2758,12 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        biomass_production_path = os.path.join(
-            self.workspace_dir, 'biomass_production.tif')
-        fraction_allocated_to_roots_path = os.path.join(
-            self.workspace_dir, 'fraction_allocated_to_roots.tif')
-        cercrp_min_above_path = os.path.join(
-            self.workspace_dir, 'cercrp_min_above.tif')
-        cercrp_min_below_path = os.path.join(
-            self.workspace_dir, 'cercrp_min_below.tif')
-        demand_path = os.path.join(
-            self.workspace_dir, 'demand.tif')
+        biomass_production_path = self.workspace_path('biomass_production.tif')
+        fraction_allocated_to_roots_path = self.workspace_path(
+            'fraction_allocated_to_roots.tif')
+        cercrp_min_above_path = self.workspace_path('cercrp_min_above.tif')
+        cercrp_min_below_path = self.workspace_path('cercrp_min_below.tif')
+        demand_path = self.workspace_path('demand.tif')
 
         # run with random inputs
         create_random_raster(biomass_production_path, 0, 675)
@@ -2765,20 +2835,19 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         array_shape = (10, 10)
 
-        annual_precip = numpy.random.uniform(22, 100, array_shape)
-        frtcindx = numpy.random.randint(0, 2, array_shape)
-        bgppa = numpy.random.uniform(100, 200, array_shape)
-        bgppb = numpy.random.uniform(2, 12, array_shape)
-        agppa = numpy.random.uniform(-40, -10, array_shape)
-        agppb = numpy.random.uniform(2, 12, array_shape)
-        cfrtcw_1 = numpy.random.uniform(0.4, 0.8, array_shape)
-        cfrtcw_2 = numpy.random.uniform(0.01, 0.38, array_shape)
-        cfrtcn_1 = numpy.random.uniform(0.4, 0.8, array_shape)
-        cfrtcn_2 = numpy.random.uniform(0.01, 0.38, array_shape)
+        annual_precip = _RNG.uniform(22, 100, array_shape).astype(
+            numpy.float32)
+        frtcindx = _RNG.integers(0, 2, array_shape)
+        bgppa = _RNG.uniform(100, 200, array_shape).astype(numpy.float32)
+        bgppb = _RNG.uniform(2, 12, array_shape).astype(numpy.float32)
+        agppa = _RNG.uniform(-40, -10, array_shape).astype(numpy.float32)
+        agppb = _RNG.uniform(2, 12, array_shape).astype(numpy.float32)
+        cfrtcw_1 = _RNG.uniform(0.4, 0.8, array_shape).astype(numpy.float32)
+        cfrtcw_2 = _RNG.uniform(0.01, 0.38, array_shape).astype(numpy.float32)
+        cfrtcn_1 = _RNG.uniform(0.4, 0.8, array_shape).astype(numpy.float32)
+        cfrtcn_2 = _RNG.uniform(0.01, 0.38, array_shape).astype(numpy.float32)
 
         minimum_acceptable_fracrc_p = 0.205
         maximum_acceptable_fracrc_p = 0.97297
@@ -2851,20 +2920,17 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        pramn_1_path = os.path.join(self.workspace_dir, 'pramn_1.tif')
-        pramn_2_path = os.path.join(self.workspace_dir, 'pramn_2.tif')
-        aglivc_path = os.path.join(self.workspace_dir, 'aglivc.tif')
-        biomax_path = os.path.join(self.workspace_dir, 'biomax.tif')
-        pramx_1_path = os.path.join(self.workspace_dir, 'pramx_1.tif')
-        pramx_2_path = os.path.join(self.workspace_dir, 'pramx_2.tif')
-        prbmn_1_path = os.path.join(self.workspace_dir, 'prbmn_1.tif')
-        prbmn_2_path = os.path.join(self.workspace_dir, 'prbmn_2.tif')
-        prbmx_1_path = os.path.join(self.workspace_dir, 'prbmx_1.tif')
-        prbmx_2_path = os.path.join(self.workspace_dir, 'prbmx_2.tif')
-        annual_precip_path = os.path.join(
-            self.workspace_dir, 'annual_precip.tif')
+        pramn_1_path = self.workspace_path('pramn_1.tif')
+        pramn_2_path = self.workspace_path('pramn_2.tif')
+        aglivc_path = self.workspace_path('aglivc.tif')
+        biomax_path = self.workspace_path('biomax.tif')
+        pramx_1_path = self.workspace_path('pramx_1.tif')
+        pramx_2_path = self.workspace_path('pramx_2.tif')
+        prbmn_1_path = self.workspace_path('prbmn_1.tif')
+        prbmn_2_path = self.workspace_path('prbmn_2.tif')
+        prbmx_1_path = self.workspace_path('prbmx_1.tif')
+        prbmx_2_path = self.workspace_path('prbmx_2.tif')
+        annual_precip_path = self.workspace_path('annual_precip.tif')
         create_random_raster(pramn_1_path, 20, 50)
         create_random_raster(pramn_2_path, 52, 70)
         create_random_raster(aglivc_path, 20, 400)
@@ -2877,21 +2943,17 @@ class foragetests(unittest.TestCase):
         create_random_raster(prbmx_2_path, 0, 0.4)
         create_random_raster(annual_precip_path, 22, 100)
 
-        pft_i = numpy.random.randint(0, 5)
-        iel = numpy.random.randint(1, 3)
+        pft_i = _RNG.integers(0, 5)
+        iel = _RNG.integers(1, 3)
 
         month_reg = {
-            'cercrp_min_above_{}_{}'.format(iel, pft_i): os.path.join(
-                self.workspace_dir,
+            'cercrp_min_above_{}_{}'.format(iel, pft_i): self.workspace_path(
                 'cercrp_min_above_{}_{}.tif'.format(iel, pft_i)),
-            'cercrp_max_above_{}_{}'.format(iel, pft_i): os.path.join(
-                self.workspace_dir,
+            'cercrp_max_above_{}_{}'.format(iel, pft_i): self.workspace_path(
                 'cercrp_max_above_{}_{}.tif'.format(iel, pft_i)),
-            'cercrp_min_below_{}_{}'.format(iel, pft_i): os.path.join(
-                self.workspace_dir,
+            'cercrp_min_below_{}_{}'.format(iel, pft_i): self.workspace_path(
                 'cercrp_min_below_{}_{}.tif'.format(iel, pft_i)),
-            'cercrp_max_below_{}_{}'.format(iel, pft_i): os.path.join(
-                self.workspace_dir,
+            'cercrp_max_below_{}_{}'.format(iel, pft_i): self.workspace_path(
                 'cercrp_max_below_{}_{}.tif'.format(iel, pft_i)),
         }
 
@@ -2991,20 +3053,18 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
-        frtcindx_path = os.path.join(self.workspace_dir, 'frtcindx.tif')
-        fracrc_p_path = os.path.join(self.workspace_dir, 'fracrc_p.tif')
-        totale_1_path = os.path.join(self.workspace_dir, 'totale_1.tif')
-        totale_2_path = os.path.join(self.workspace_dir, 'totale_2.tif')
-        demand_1_path = os.path.join(self.workspace_dir, 'demand_1.tif')
-        demand_2_path = os.path.join(self.workspace_dir, 'demand_2.tif')
-        h2ogef_1_path = os.path.join(self.workspace_dir, 'h2ogef_1.tif')
-        cfrtcw_1_path = os.path.join(self.workspace_dir, 'cfrtcw_1.tif')
-        cfrtcw_2_path = os.path.join(self.workspace_dir, 'cfrtcw_2.tif')
-        cfrtcn_1_path = os.path.join(self.workspace_dir, 'cfrtcn_1.tif')
-        cfrtcn_2_path = os.path.join(self.workspace_dir, 'cfrtcn_2.tif')
-        fracrc_r_path = os.path.join(self.workspace_dir, 'fracrc_r.tif')
+        frtcindx_path = self.workspace_path('frtcindx.tif')
+        fracrc_p_path = self.workspace_path('fracrc_p.tif')
+        totale_1_path = self.workspace_path('totale_1.tif')
+        totale_2_path = self.workspace_path('totale_2.tif')
+        demand_1_path = self.workspace_path('demand_1.tif')
+        demand_2_path = self.workspace_path('demand_2.tif')
+        h2ogef_1_path = self.workspace_path('h2ogef_1.tif')
+        cfrtcw_1_path = self.workspace_path('cfrtcw_1.tif')
+        cfrtcw_2_path = self.workspace_path('cfrtcw_2.tif')
+        cfrtcn_1_path = self.workspace_path('cfrtcn_1.tif')
+        cfrtcn_2_path = self.workspace_path('cfrtcn_2.tif')
+        fracrc_r_path = self.workspace_path('fracrc_r.tif')
 
         create_random_raster(fracrc_p_path, 0.2, 0.95)
         create_random_raster(totale_1_path, 0, 320)
@@ -3116,131 +3176,40 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         array_shape = (3, 3)
 
-        # known values
-        tgprod = numpy.full(array_shape, 500)
+        # known values; fracrc is an array so nodata can be inserted into it
+        tgprod = 500
         fracrc = numpy.full(array_shape, 0.62)
-        flgrem = numpy.full(array_shape, 0.16)
-        gremb = numpy.full(array_shape, 0.02)
+        flgrem = 0.16
+        gremb = 0.02
 
         tolerance = 0.0001
 
-        grzeff = numpy.full(array_shape, 1)
-        agprod_grzeff_1 = 122.816
-        rtsh_grzeff_1 = 1.63158
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_1 - tolerance, agprod_grzeff_1 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_1 - tolerance, rtsh_grzeff_1 + tolerance,
-            _TARGET_NODATA)
-
-        grzeff = numpy.full(array_shape, 2)
-        agprod_grzeff_2 = 240.6828
-        rtsh_grzeff_2 = 1.818
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_2 - tolerance, agprod_grzeff_2 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_2 - tolerance, rtsh_grzeff_2 + tolerance,
-            _TARGET_NODATA)
-
-        grzeff = numpy.full(array_shape, 3)
-        agprod_grzeff_3 = 190
-        rtsh_grzeff_3 = 1.818
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_3 - tolerance, agprod_grzeff_3 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_3 - tolerance, rtsh_grzeff_3 + tolerance,
-            _TARGET_NODATA)
-
-        grzeff = numpy.full(array_shape, 4)
-        agprod_grzeff_4 = 190
-        rtsh_grzeff_4 = 0.9968
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_4 - tolerance, agprod_grzeff_4 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_4 - tolerance, rtsh_grzeff_4 + tolerance,
-            _TARGET_NODATA)
-
-        grzeff = numpy.full(array_shape, 5)
-        agprod_grzeff_5 = 240.6828
-        rtsh_grzeff_5 = 0.9968
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_5 - tolerance, agprod_grzeff_5 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_5 - tolerance, rtsh_grzeff_5 + tolerance,
-            _TARGET_NODATA)
-
-        grzeff = numpy.full(array_shape, 6)
-        agprod_grzeff_6 = 122.816
-        rtsh_grzeff_6 = 0.9968
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_6 - tolerance, agprod_grzeff_6 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_6 - tolerance, rtsh_grzeff_6 + tolerance,
-            _TARGET_NODATA)
+        def check_grzeff_values(grzeff_values, known_agprod, known_rtsh):
+            """Test all values of grzeff at once, one layer per value."""
+            # the other inputs broadcast against one grzeff value per layer
+            grzeff = numpy.array(grzeff_values).reshape(-1, 1, 1)
+            agprod = forage.grazing_effect_on_aboveground_production(
+                tgprod, fracrc, flgrem, grzeff)
+            rtsh = forage.grazing_effect_on_root_shoot(
+                fracrc, flgrem, grzeff, gremb)
+            for i in range(len(grzeff_values)):
+                self.assert_all_values_in_array_within_range(
+                    agprod[i], known_agprod[i] - tolerance,
+                    known_agprod[i] + tolerance, _TARGET_NODATA)
+                self.assert_all_values_in_array_within_range(
+                    rtsh[i], known_rtsh[i] - tolerance,
+                    known_rtsh[i] + tolerance, _TARGET_NODATA)
+
+        check_grzeff_values(
+            [1, 2, 3, 4, 5, 6],
+            [122.816, 240.6828, 190, 190, 240.6828, 122.816],
+            [1.63158, 1.818, 1.818, 0.9968, 0.9968, 0.9968])
 
         insert_nodata_values_into_array(fracrc, _TARGET_NODATA)
 
-        grzeff = numpy.full(array_shape, 4)
-        agprod_grzeff_4 = 190
-        rtsh_grzeff_4 = 0.9968
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_4 - tolerance, agprod_grzeff_4 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_4 - tolerance, rtsh_grzeff_4 + tolerance,
-            _TARGET_NODATA)
-
-        grzeff = numpy.full(array_shape, 2)
-        agprod_grzeff_2 = 240.6828
-        rtsh_grzeff_2 = 1.818
-        agprod = forage.grazing_effect_on_aboveground_production(
-            tgprod, fracrc, flgrem, grzeff)
-        rtsh = forage.grazing_effect_on_root_shoot(
-            fracrc, flgrem, grzeff, gremb)
-        self.assert_all_values_in_array_within_range(
-            agprod, agprod_grzeff_2 - tolerance, agprod_grzeff_2 + tolerance,
-            _TARGET_NODATA)
-        self.assert_all_values_in_array_within_range(
-            rtsh, rtsh_grzeff_2 - tolerance, rtsh_grzeff_2 + tolerance,
-            _TARGET_NODATA)
+        check_grzeff_values([4, 2], [190, 240.6828], [0.9968, 1.818])
 
     def test_calc_tgprod_final(self):
         """Test `calc_tgprod_final`.
@@ -3257,8 +3226,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         array_size = (3, 3)
         # known values
         rtsh = numpy.full(array_size, 0.72)
@@ -3355,8 +3322,6 @@ class foragetests(unittest.TestCase):
             }
             return results_dict
 
-        from rangeland_production import forage
-
         # shortwave radiation and pet calculated by hand
         CURRENT_MONTH = 10
         SHWAVE = 437.04
@@ -3385,19 +3350,18 @@ class foragetests(unittest.TestCase):
                 'fwloss_4': FWLOSS_4,
             }
         }
-        site_index_path = os.path.join(self.workspace_dir, 'site_index.tif')
-        precip_path = os.path.join(self.workspace_dir, 'precip.tif')
-        tave_path = os.path.join(self.workspace_dir, 'tave.tif')
-        max_temp_path = os.path.join(self.workspace_dir, 'max_temp.tif')
-        min_temp_path = os.path.join(self.workspace_dir, 'min_temp.tif')
-        prev_snow_path = os.path.join(self.workspace_dir, 'prev_snow.tif')
-        prev_snlq_path = os.path.join(self.workspace_dir, 'prev_snlq.tif')
-        snowmelt_path = os.path.join(self.workspace_dir, 'snowmelt.tif')
-        snow_path = os.path.join(self.workspace_dir, 'snow.tif')
-        snlq_path = os.path.join(self.workspace_dir, 'snlq.tif')
-        inputs_after_snow_path = os.path.join(
-            self.workspace_dir, 'inputs_after_snow.tif')
-        pet_rem_path = os.path.join(self.workspace_dir, 'pet_rem.tif')
+        site_index_path = self.workspace_path('site_index.tif')
+        precip_path = self.workspace_path('precip.tif')
+        tave_path = self.workspace_path('tave.tif')
+        max_temp_path = self.workspace_path('max_temp.tif')
+        min_temp_path = self.workspace_path('min_temp.tif')
+        prev_snow_path = self.workspace_path('prev_snow.tif')
+        prev_snlq_path = self.workspace_path('prev_snlq.tif')
+        snowmelt_path = self.workspace_path('snowmelt.tif')
+        snow_path = self.workspace_path('snow.tif')
+        snlq_path = self.workspace_path('snlq.tif')
+        inputs_after_snow_path = self.workspace_path('inputs_after_snow.tif')
+        pet_rem_path = self.workspace_path('pet_rem.tif')
 
         # raster inputs
         nrows = 1
@@ -3666,8 +3630,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         array_size = (3, 3)
         # known values
         sum_aglivc = numpy.full(array_size, 200.)
@@ -3695,8 +3657,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         array_size = (3, 3)
         # known values
         aliv = numpy.full(array_size, 545)
@@ -3787,7 +3747,6 @@ class foragetests(unittest.TestCase):
             }
             return results_dict
 
-        from rangeland_production import forage
         array_size = (10, 10)
 
         # snow cover, runoff losses only
@@ -4097,7 +4056,6 @@ class foragetests(unittest.TestCase):
             }
             return results_dict
 
-        from rangeland_production import forage
         array_size = (10, 10)
 
         # high transpiration limited by water inputs
@@ -4247,7 +4205,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_size = (10, 10)
         tolerance = 0.00001
 
@@ -4328,7 +4285,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_size = (10, 10)
         tolerance = 0.0000001
 
@@ -4375,7 +4331,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_size = (10, 10)
         tolerance = 0.00001
 
@@ -4480,7 +4435,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_size = (10, 10)
         tolerance = 0.00001
 
@@ -4525,7 +4479,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_size = (10, 10)
         tolerance = 0.00001
 
@@ -4609,14 +4562,12 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         raster1_val = 10
         raster2_val = 3
         known_result = 7
-        raster1_path = os.path.join(self.workspace_dir, 'raster1.tif')
-        raster2_path = os.path.join(self.workspace_dir, 'raster2.tif')
-        target_path = os.path.join(self.workspace_dir, 'target.tif')
+        raster1_path = self.workspace_path('raster1.tif')
+        raster2_path = self.workspace_path('raster2.tif')
+        target_path = self.workspace_path('target.tif')
         create_random_raster(raster1_path, raster1_val, raster1_val)
         create_random_raster(raster2_path, raster2_val, raster2_val)
 
@@ -4662,14 +4613,12 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         raster1_val = 10
         raster2_val = 3
         known_result = raster1_val + raster2_val
-        raster1_path = os.path.join(self.workspace_dir, 'raster1.tif')
-        raster2_path = os.path.join(self.workspace_dir, 'raster2.tif')
-        target_path = os.path.join(self.workspace_dir, 'target.tif')
+        raster1_path = self.workspace_path('raster1.tif')
+        raster2_path = self.workspace_path('raster2.tif')
+        target_path = self.workspace_path('target.tif')
         create_random_raster(raster1_path, raster1_val, raster1_val)
         create_random_raster(raster2_path, raster2_val, raster2_val)
 
@@ -4910,16 +4859,13 @@ class foragetests(unittest.TestCase):
             ncols = 1
             # aligned inputs
             aligned_inputs = {
-                'max_temp_{}'.format(current_month): os.path.join(
-                    self.workspace_dir,
+                'max_temp_{}'.format(current_month): self.workspace_path(
                     'max_temp_{}.tif'.format(current_month)),
-                'min_temp_{}'.format(current_month): os.path.join(
-                    self.workspace_dir,
+                'min_temp_{}'.format(current_month): self.workspace_path(
                     'min_temp_{}.tif'.format(current_month)),
-                'precip_{}'.format(month_index): os.path.join(
-                    self.workspace_dir, 'precip.tif'),
-                'site_index': os.path.join(
-                    self.workspace_dir, 'site_index.tif'),
+                'precip_{}'.format(month_index): self.workspace_path(
+                    'precip.tif'),
+                'site_index': self.workspace_path('site_index.tif'),
             }
             create_random_raster(
                 aligned_inputs['max_temp_{}'.format(current_month)], max_temp,
@@ -4934,8 +4880,8 @@ class foragetests(unittest.TestCase):
                 aligned_inputs['site_index'], 1, 1, nrows=nrows, ncols=ncols)
             for pft_i in pft_dict:
                 cover = pft_dict[pft_i]['cover']
-                aligned_inputs['pft_{}'.format(pft_i)] = os.path.join(
-                    self.workspace_dir, 'pft_{}.tif'.format(pft_i))
+                aligned_inputs['pft_{}'.format(pft_i)] = self.workspace_path(
+                    'pft_{}.tif'.format(pft_i))
                 create_random_raster(
                     aligned_inputs['pft_{}'.format(pft_i)], cover, cover,
                     nrows=nrows, ncols=ncols)
@@ -4967,12 +4913,10 @@ class foragetests(unittest.TestCase):
                 }
             # previous state variables
             prev_sv_reg = {
-                'strucc_1_path': os.path.join(
-                    self.workspace_dir, 'strucc_1_prev.tif'),
-                'metabc_1_path': os.path.join(
-                    self.workspace_dir, 'metabc_1_prev.tif'),
-                'snow_path': os.path.join(self.workspace_dir, 'snow_prev.tif'),
-                'snlq_path': os.path.join(self.workspace_dir, 'snlq_prev.tif'),
+                'strucc_1_path': self.workspace_path('strucc_1_prev.tif'),
+                'metabc_1_path': self.workspace_path('metabc_1_prev.tif'),
+                'snow_path': self.workspace_path('snow_prev.tif'),
+                'snlq_path': self.workspace_path('snlq_prev.tif'),
             }
             create_random_raster(
                 prev_sv_reg['strucc_1_path'], strucc_1, strucc_1, nrows=nrows,
@@ -4987,16 +4931,16 @@ class foragetests(unittest.TestCase):
                 prev_sv_reg['snlq_path'], snlq, snlq, nrows=nrows,
                 ncols=ncols)
             for lyr in range(1, nlaypg_max + 1):
-                prev_sv_reg['asmos_{}_path'.format(lyr)] = os.path.join(
-                    self.workspace_dir, 'asmos_{}_prev.tif'.format(lyr))
+                prev_sv_reg['asmos_{}_path'.format(lyr)] = self.workspace_path(
+                    'asmos_{}_prev.tif'.format(lyr))
                 create_random_raster(
                     prev_sv_reg['asmos_{}_path'.format(lyr)], asmos, asmos,
                     nrows=nrows, ncols=ncols)
             for pft_i in pft_dict:
-                prev_sv_reg['aglivc_{}_path'.format(pft_i)] = os.path.join(
-                    self.workspace_dir, 'aglivc_{}_prev.tif'.format(pft_i))
-                prev_sv_reg['stdedc_{}_path'.format(pft_i)] = os.path.join(
-                    self.workspace_dir, 'stdedc_{}_prev.tif'.format(pft_i))
+                prev_sv_reg['aglivc_{}_path'.format(pft_i)] = (
+                    self.workspace_path('aglivc_{}_prev.tif'.format(pft_i)))
+                prev_sv_reg['stdedc_{}_path'.format(pft_i)] = (
+                    self.workspace_path('stdedc_{}_prev.tif'.format(pft_i)))
                 create_random_raster(
                     prev_sv_reg['aglivc_{}_path'.format(pft_i)],
                     pft_dict[pft_i]['aglivc'], pft_dict[pft_i]['aglivc'],
@@ -5007,24 +4951,23 @@ class foragetests(unittest.TestCase):
                     nrows=nrows, ncols=ncols)
             # current state variables
             sv_reg = {
-                'snow_path': os.path.join(self.workspace_dir, 'snow.tif'),
-                'snlq_path': os.path.join(self.workspace_dir, 'snlq.tif'),
-                'avh2o_3_path': os.path.join(
-                    self.workspace_dir, 'avh2o_3.tif'),
+                'snow_path': self.workspace_path('snow.tif'),
+                'snlq_path': self.workspace_path('snlq.tif'),
+                'avh2o_3_path': self.workspace_path('avh2o_3.tif'),
             }
             for lyr in range(1, nlaypg_max + 1):
-                sv_reg['asmos_{}_path'.format(lyr)] = os.path.join(
-                    self.workspace_dir, 'asmos_{}_path'.format(lyr))
+                sv_reg['asmos_{}_path'.format(lyr)] = self.workspace_path(
+                    'asmos_{}_path'.format(lyr))
             for pft_i in pft_dict:
-                sv_reg['avh2o_1_{}_path'.format(pft_i)] = os.path.join(
-                    self.workspace_dir, 'avh2o_1_{}.tif'.format(pft_i))
+                sv_reg['avh2o_1_{}_path'.format(pft_i)] = self.workspace_path(
+                    'avh2o_1_{}.tif'.format(pft_i))
             # persistent parameters
             pp_reg = {}
             for lyr in range(1, nlaypg_max + 1):
-                pp_reg['afiel_{}_path'.format(lyr)] = os.path.join(
-                    self.workspace_dir, 'afiel_{}.tif'.format(lyr))
-                pp_reg['awilt_{}_path'.format(lyr)] = os.path.join(
-                    self.workspace_dir, 'awilt_{}.tif'.format(lyr))
+                pp_reg['afiel_{}_path'.format(lyr)] = self.workspace_path(
+                    'afiel_{}.tif'.format(lyr))
+                pp_reg['awilt_{}_path'.format(lyr)] = self.workspace_path(
+                    'awilt_{}.tif'.format(lyr))
                 create_random_raster(
                     pp_reg['afiel_{}_path'.format(lyr)], afiel, afiel,
                     nrows=nrows, ncols=ncols)
@@ -5033,21 +4976,21 @@ class foragetests(unittest.TestCase):
                     nrows=nrows, ncols=ncols)
             # monthly shared quantities
             month_reg = {
-                'amov_1': os.path.join(self.workspace_dir, 'amov_1.tif'),
-                'amov_2': os.path.join(self.workspace_dir, 'amov_2.tif'),
-                'amov_3': os.path.join(self.workspace_dir, 'amov_3.tif'),
-                'amov_4': os.path.join(self.workspace_dir, 'amov_4.tif'),
-                'amov_5': os.path.join(self.workspace_dir, 'amov_5.tif'),
-                'amov_6': os.path.join(self.workspace_dir, 'amov_6.tif'),
-                'amov_7': os.path.join(self.workspace_dir, 'amov_7.tif'),
-                'amov_8': os.path.join(self.workspace_dir, 'amov_8.tif'),
-                'amov_9': os.path.join(self.workspace_dir, 'amov_9.tif'),
-                'amov_10': os.path.join(self.workspace_dir, 'amov_10.tif'),
-                'snowmelt': os.path.join(self.workspace_dir, 'snowmelt.tif')
+                'amov_1': self.workspace_path('amov_1.tif'),
+                'amov_2': self.workspace_path('amov_2.tif'),
+                'amov_3': self.workspace_path('amov_3.tif'),
+                'amov_4': self.workspace_path('amov_4.tif'),
+                'amov_5': self.workspace_path('amov_5.tif'),
+                'amov_6': self.workspace_path('amov_6.tif'),
+                'amov_7': self.workspace_path('amov_7.tif'),
+                'amov_8': self.workspace_path('amov_8.tif'),
+                'amov_9': self.workspace_path('amov_9.tif'),
+                'amov_10': self.workspace_path('amov_10.tif'),
+                'snowmelt': self.workspace_path('snowmelt.tif')
             }
             for pft_i in pft_dict:
-                month_reg['tgprod_{}'.format(pft_i)] = os.path.join(
-                    self.workspace_dir, 'tgprod_{}.tif'.format(pft_i))
+                month_reg['tgprod_{}'.format(pft_i)] = self.workspace_path(
+                    'tgprod_{}.tif'.format(pft_i))
                 create_random_raster(
                     month_reg['tgprod_{}'.format(pft_i)],
                     pft_dict[pft_i]['tgprod'], pft_dict[pft_i]['tgprod'],
@@ -5065,7 +5008,6 @@ class foragetests(unittest.TestCase):
                 'pft_id_set': pft_id_set,
             }
             return input_dict
-        from rangeland_production import forage
 
         # no snow, no snowfall
         pet = 4.9680004
@@ -5301,9 +5243,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-
-        from rangeland_production import forage
-
         array_shape = (10, 10)
         tolerance = 0.00000001
 
@@ -5600,7 +5539,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00000001
 
         # immobilization
@@ -5618,15 +5556,15 @@ class foragetests(unittest.TestCase):
             'mineral_flow')(cflow, tca, rcetob, anps, labile)
 
         # raster inputs
-        cflow_path = os.path.join(self.workspace_dir, 'cflow.tif')
-        tca_path = os.path.join(self.workspace_dir, 'tca.tif')
-        rcetob_path = os.path.join(self.workspace_dir, 'rcetob.tif')
-        anps_path = os.path.join(self.workspace_dir, 'anps.tif')
-        labile_path = os.path.join(self.workspace_dir, 'labile.tif')
+        cflow_path = self.workspace_path('cflow.tif')
+        tca_path = self.workspace_path('tca.tif')
+        rcetob_path = self.workspace_path('rcetob.tif')
+        anps_path = self.workspace_path('anps.tif')
+        labile_path = self.workspace_path('labile.tif')
         # output paths
-        mat_leaving_a_path = os.path.join(self.workspace_dir, 'leavinga.tif')
-        mat_arriving_b_path = os.path.join(self.workspace_dir, 'arrivingb.tif')
-        mineral_flow_path = os.path.join(self.workspace_dir, 'mineralflow.tif')
+        mat_leaving_a_path = self.workspace_path('leavinga.tif')
+        mat_arriving_b_path = self.workspace_path('arrivingb.tif')
+        mineral_flow_path = self.workspace_path('mineralflow.tif')
 
         create_random_raster(cflow_path, cflow, cflow)
         create_random_raster(tca_path, tca, tca)
@@ -5854,7 +5792,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00000001
 
         # immobilization
@@ -5880,17 +5817,15 @@ class foragetests(unittest.TestCase):
             gromin = 0
 
         # raster inputs
-        cflow_path = os.path.join(self.workspace_dir, 'cflow.tif')
-        tca_path = os.path.join(self.workspace_dir, 'tca.tif')
-        rcetob_path = os.path.join(self.workspace_dir, 'rcetob.tif')
-        anps_path = os.path.join(self.workspace_dir, 'anps.tif')
-        labile_path = os.path.join(self.workspace_dir, 'labile.tif')
-        d_estatv_donating_path = os.path.join(
-            self.workspace_dir, 'estatv_donating.tif')
-        d_estatv_receiving_path = os.path.join(
-            self.workspace_dir, 'estatv_receiving.tif')
-        d_minerl_path = os.path.join(self.workspace_dir, 'minerl.tif')
-        gromin_path = os.path.join(self.workspace_dir, 'gromin.tif')
+        cflow_path = self.workspace_path('cflow.tif')
+        tca_path = self.workspace_path('tca.tif')
+        rcetob_path = self.workspace_path('rcetob.tif')
+        anps_path = self.workspace_path('anps.tif')
+        labile_path = self.workspace_path('labile.tif')
+        d_estatv_donating_path = self.workspace_path('estatv_donating.tif')
+        d_estatv_receiving_path = self.workspace_path('estatv_receiving.tif')
+        d_minerl_path = self.workspace_path('minerl.tif')
+        gromin_path = self.workspace_path('gromin.tif')
 
         create_random_raster(cflow_path, cflow, cflow)
         create_random_raster(tca_path, tca, tca)
@@ -6027,8 +5962,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         tolerance = 0.00001
 
         # known values
@@ -6038,10 +5971,10 @@ class foragetests(unittest.TestCase):
         fsol_point = fsfunc_point(minerl_1_2, pslsrb, sorpmx)
 
         # raster inputs
-        minerl_1_2_path = os.path.join(self.workspace_dir, 'minerl_1_2.tif')
-        sorpmx_path = os.path.join(self.workspace_dir, 'sorpmx.tif')
-        pslsrb_path = os.path.join(self.workspace_dir, 'pslsrb.tif')
-        fsol_path = os.path.join(self.workspace_dir, 'fsol.tif')
+        minerl_1_2_path = self.workspace_path('minerl_1_2.tif')
+        sorpmx_path = self.workspace_path('sorpmx.tif')
+        pslsrb_path = self.workspace_path('pslsrb.tif')
+        fsol_path = self.workspace_path('fsol.tif')
 
         create_random_raster(minerl_1_2_path, minerl_1_2, minerl_1_2)
         create_random_raster(sorpmx_path, sorpmx, sorpmx)
@@ -6107,7 +6040,6 @@ class foragetests(unittest.TestCase):
             else:
                 tcflow_strucc_1 = 0
             return tcflow_strucc_1
-        from rangeland_production import forage
 
         array_shape = (10, 10)
         tolerance = 0.0000001
@@ -6248,10 +6180,8 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         fill_value = 0
-        target_path = os.path.join(self.workspace_dir, 'target_raster.tif')
+        target_path = self.workspace_path('target_raster.tif')
         create_random_raster(target_path, fill_value, fill_value)
         insert_nodata_values_into_raster(target_path, _TARGET_NODATA)
 
@@ -6324,7 +6254,6 @@ class foragetests(unittest.TestCase):
             mineral_flow = co2_loss * estatv / cstatv
             return mineral_flow
 
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.0000000001
 
@@ -6372,7 +6301,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.0000001
 
@@ -6437,7 +6365,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.0000001
 
@@ -6493,7 +6420,6 @@ class foragetests(unittest.TestCase):
             else:
                 tcflow_metabc_1 = 0.
             return tcflow_metabc_1
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.00001
 
@@ -6633,7 +6559,6 @@ class foragetests(unittest.TestCase):
             else:
                 tcflow_metabc_2 = 0.
             return tcflow_metabc_2
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.00001
 
@@ -6758,7 +6683,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.00001
 
@@ -6873,7 +6797,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.00001
 
@@ -6968,7 +6891,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (10, 10)
         tolerance = 0.00001
 
@@ -7040,7 +6962,6 @@ class foragetests(unittest.TestCase):
                 by hand
 
         """
-        from rangeland_production import forage
         nrows = 10
         ncols = 10
         tolerance = 0.00001
@@ -7054,11 +6975,10 @@ class foragetests(unittest.TestCase):
         d_som1e_2_iel_after = 49.2688491
 
         # raster inputs
-        som1c_2_path = os.path.join(self.workspace_dir, 'som1c_2.tif')
-        som1e_2_iel_path = os.path.join(self.workspace_dir, 'som1e_2_iel.tif')
-        cleach_path = os.path.join(self.workspace_dir, 'cleach.tif')
-        d_som1e_2_iel_path = os.path.join(
-            self.workspace_dir, 'd_som1e_2_iel.tif')
+        som1c_2_path = self.workspace_path('som1c_2.tif')
+        som1e_2_iel_path = self.workspace_path('som1e_2_iel.tif')
+        cleach_path = self.workspace_path('cleach.tif')
+        d_som1e_2_iel_path = self.workspace_path('d_som1e_2_iel.tif')
         create_random_raster(som1c_2_path, som1c_2, som1c_2)
         create_random_raster(som1e_2_iel_path, som1e_2_iel, som1e_2_iel)
         create_random_raster(cleach_path, cleach, cleach)
@@ -7095,11 +7015,10 @@ class foragetests(unittest.TestCase):
         d_som1e_2_iel_after = 50.16564852
 
         # raster inputs
-        som1c_2_path = os.path.join(self.workspace_dir, 'som1c_2.tif')
-        som1e_2_iel_path = os.path.join(self.workspace_dir, 'som1e_2_iel.tif')
-        cleach_path = os.path.join(self.workspace_dir, 'cleach.tif')
-        d_som1e_2_iel_path = os.path.join(
-            self.workspace_dir, 'd_som1e_2_iel.tif')
+        som1c_2_path = self.workspace_path('som1c_2.tif')
+        som1e_2_iel_path = self.workspace_path('som1e_2_iel.tif')
+        cleach_path = self.workspace_path('cleach.tif')
+        d_som1e_2_iel_path = self.workspace_path('d_som1e_2_iel.tif')
         create_random_raster(som1c_2_path, som1c_2, som1c_2)
         create_random_raster(som1e_2_iel_path, som1e_2_iel, som1e_2_iel)
         create_random_raster(cleach_path, cleach, cleach)
@@ -7278,7 +7197,6 @@ class foragetests(unittest.TestCase):
                 'mod_strlig_lyr': strlig_lyr + d_strlig_lyr,
             }
             return result_dict
-        from rangeland_production import forage
         tolerance = 0.0001
 
         # known inputs
@@ -7306,30 +7224,22 @@ class foragetests(unittest.TestCase):
         metabe_lyr_2 = 0.0555
 
         # raster inputs
-        cpart_path = os.path.join(self.workspace_dir, 'cpart.tif')
-        epart_1_path = os.path.join(self.workspace_dir, 'epart_1.tif')
-        epart_2_path = os.path.join(self.workspace_dir, 'epart_2.tif')
-        frlign_path = os.path.join(self.workspace_dir, 'frlign.tif')
-        site_index_path = os.path.join(self.workspace_dir, 'site_index.tif')
+        cpart_path = self.workspace_path('cpart.tif')
+        epart_1_path = self.workspace_path('epart_1.tif')
+        epart_2_path = self.workspace_path('epart_2.tif')
+        frlign_path = self.workspace_path('frlign.tif')
+        site_index_path = self.workspace_path('site_index.tif')
 
         sv_reg = {
-            'minerl_1_1_path': os.path.join(
-                self.workspace_dir, 'minerl_1_1.tif'),
-            'minerl_1_2_path': os.path.join(
-                self.workspace_dir, 'minerl_1_2.tif'),
-            'metabc_1_path': os.path.join(
-                self.workspace_dir, 'metabc.tif'),
-            'strucc_1_path': os.path.join(
-                self.workspace_dir, 'strucc.tif'),
-            'struce_1_1_path': os.path.join(
-                self.workspace_dir, 'struce_1_1.tif'),
-            'metabe_1_1_path': os.path.join(
-                self.workspace_dir, 'metabe_1_1.tif'),
-            'struce_1_2_path': os.path.join(
-                self.workspace_dir, 'struce_1_2.tif'),
-            'metabe_1_2_path': os.path.join(
-                self.workspace_dir, 'metabe_1_2.tif'),
-            'strlig_1_path': os.path.join(self.workspace_dir, 'strlig.tif')
+            'minerl_1_1_path': self.workspace_path('minerl_1_1.tif'),
+            'minerl_1_2_path': self.workspace_path('minerl_1_2.tif'),
+            'metabc_1_path': self.workspace_path('metabc.tif'),
+            'strucc_1_path': self.workspace_path('strucc.tif'),
+            'struce_1_1_path': self.workspace_path('struce_1_1.tif'),
+            'metabe_1_1_path': self.workspace_path('metabe_1_1.tif'),
+            'struce_1_2_path': self.workspace_path('struce_1_2.tif'),
+            'metabe_1_2_path': self.workspace_path('metabe_1_2.tif'),
+            'strlig_1_path': self.workspace_path('strlig.tif')
         }
 
         create_constant_raster(cpart_path, cpart)
@@ -7425,7 +7335,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.000001
         array_shape = (10, 10)
 
@@ -7471,7 +7380,6 @@ class foragetests(unittest.TestCase):
         Returns:
             None
         """
-        from rangeland_production import forage
         tolerance = 0.00001
         array_shape = (10, 10)
 
@@ -7515,7 +7423,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.0001
         array_shape = (10, 10)
 
@@ -7649,7 +7556,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
         array_shape = (10, 10)
 
@@ -7700,7 +7606,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
         prev_sv_dir = tempfile.mkdtemp(dir=self.workspace_dir)
         cur_sv_dir = tempfile.mkdtemp(dir=self.workspace_dir)
@@ -7785,7 +7690,7 @@ class foragetests(unittest.TestCase):
             'crpstg_2_2_path': os.path.join(cur_sv_dir, 'crpstg_2_2.tif'),
         }
         month_reg = {
-            'bgwfunc': os.path.join(self.workspace_dir, 'bgwfunc.tif'),
+            'bgwfunc': self.workspace_path('bgwfunc.tif'),
         }
         create_constant_raster(month_reg['bgwfunc'], bgwfunc)
         create_constant_raster(sv_reg['stdedc_1_path'], stdedc)
@@ -7882,7 +7787,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (3, 3)
         tolerance = 0.00001
 
@@ -8199,7 +8103,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known values: iel=1, some uptake from soil, some plant N fixation
@@ -8267,38 +8170,37 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         pft_i = 1
-        percent_cover_path = os.path.join(self.workspace_dir, 'perc_cover.tif')
-        eup_above_iel_path = os.path.join(self.workspace_dir, 'eup_above.tif')
-        eup_below_iel_path = os.path.join(self.workspace_dir, 'eup_below.tif')
-        plantNfix_path = os.path.join(self.workspace_dir, 'plantNfix.tif')
-        availm_path = os.path.join(self.workspace_dir, 'availm.tif')
-        eavail_path = os.path.join(self.workspace_dir, 'eavail.tif')
-        pslsrb_path = os.path.join(self.workspace_dir, 'pslsrb.tif')
-        sorpmx_path = os.path.join(self.workspace_dir, 'sorpmx.tif')
-        delta_aglive_iel_path = os.path.join(
-            self.workspace_dir, 'delta_aglive.tif')
+        percent_cover_path = self.workspace_path('perc_cover.tif')
+        eup_above_iel_path = self.workspace_path('eup_above.tif')
+        eup_below_iel_path = self.workspace_path('eup_below.tif')
+        plantNfix_path = self.workspace_path('plantNfix.tif')
+        availm_path = self.workspace_path('availm.tif')
+        eavail_path = self.workspace_path('eavail.tif')
+        pslsrb_path = self.workspace_path('pslsrb.tif')
+        sorpmx_path = self.workspace_path('sorpmx.tif')
+        delta_aglive_iel_path = self.workspace_path('delta_aglive.tif')
 
         sv_reg = {
-            'aglive_{}_{}_path'.format(iel, pft_i): os.path.join(
-                self.workspace_dir, 'aglive.tif'),
-            'bglive_{}_{}_path'.format(iel, pft_i): os.path.join(
-                self.workspace_dir, 'bglive.tif'),
-            'crpstg_{}_{}_path'.format(iel, pft_i): os.path.join(
-                self.workspace_dir, 'crpstg.tif'),
-            'minerl_1_{}_path'.format(iel): os.path.join(
-                self.workspace_dir, 'minerl_1.tif'),
-            'minerl_2_{}_path'.format(iel): os.path.join(
-                self.workspace_dir, 'minerl_2.tif'),
-            'minerl_3_{}_path'.format(iel): os.path.join(
-                self.workspace_dir, 'minerl_3.tif'),
-            'minerl_4_{}_path'.format(iel): os.path.join(
-                self.workspace_dir, 'minerl_4.tif'),
-            'minerl_5_{}_path'.format(iel): os.path.join(
-                self.workspace_dir, 'minerl_5.tif'),
-            'minerl_6_{}_path'.format(iel): os.path.join(
-                self.workspace_dir, 'minerl_6.tif'),
-            'minerl_7_{}_path'.format(iel): os.path.join(
-                self.workspace_dir, 'minerl_7.tif'),
+            'aglive_{}_{}_path'.format(iel, pft_i): self.workspace_path(
+                'aglive.tif'),
+            'bglive_{}_{}_path'.format(iel, pft_i): self.workspace_path(
+                'bglive.tif'),
+            'crpstg_{}_{}_path'.format(iel, pft_i): self.workspace_path(
+                'crpstg.tif'),
+            'minerl_1_{}_path'.format(iel): self.workspace_path(
+                'minerl_1.tif'),
+            'minerl_2_{}_path'.format(iel): self.workspace_path(
+                'minerl_2.tif'),
+            'minerl_3_{}_path'.format(iel): self.workspace_path(
+                'minerl_3.tif'),
+            'minerl_4_{}_path'.format(iel): self.workspace_path(
+                'minerl_4.tif'),
+            'minerl_5_{}_path'.format(iel): self.workspace_path(
+                'minerl_5.tif'),
+            'minerl_6_{}_path'.format(iel): self.workspace_path(
+                'minerl_6.tif'),
+            'minerl_7_{}_path'.format(iel): self.workspace_path(
+                'minerl_7.tif'),
         }
         create_constant_raster(percent_cover_path, percent_cover)
         create_constant_raster(eup_above_iel_path, eup_above_iel)
@@ -8383,7 +8285,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (3, 3)
         tolerance = 0.00000001
 
@@ -8475,7 +8376,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         array_shape = (3, 3)
         tolerance = 0.00001
 
@@ -8520,7 +8420,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known values
@@ -8536,9 +8435,9 @@ class foragetests(unittest.TestCase):
         initial_minerl_2 = 14.38
 
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'pft_1': os.path.join(self.workspace_dir, 'pft_1.tif'),
-            'pft_2': os.path.join(self.workspace_dir, 'pft_2.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'pft_1': self.workspace_path('pft_1.tif'),
+            'pft_2': self.workspace_path('pft_2.tif'),
         }
         create_constant_raster(aligned_inputs['site_index'], 1)
         create_constant_raster(aligned_inputs['pft_1'], 0.3)
@@ -8570,26 +8469,16 @@ class foragetests(unittest.TestCase):
             }
         }
         sv_reg = {
-            'minerl_1_1_path': os.path.join(
-                self.workspace_dir, 'minerl_1_1.tif'),
-            'minerl_2_1_path': os.path.join(
-                self.workspace_dir, 'minerl_2_1.tif'),
-            'minerl_3_1_path': os.path.join(
-                self.workspace_dir, 'minerl_3_1.tif'),
-            'minerl_4_1_path': os.path.join(
-                self.workspace_dir, 'minerl_4_1.tif'),
-            'minerl_5_1_path': os.path.join(
-                self.workspace_dir, 'minerl_5_1.tif'),
-            'minerl_1_2_path': os.path.join(
-                self.workspace_dir, 'minerl_1_2.tif'),
-            'minerl_2_2_path': os.path.join(
-                self.workspace_dir, 'minerl_2_2.tif'),
-            'minerl_3_2_path': os.path.join(
-                self.workspace_dir, 'minerl_3_2.tif'),
-            'minerl_4_2_path': os.path.join(
-                self.workspace_dir, 'minerl_4_2.tif'),
-            'minerl_5_2_path': os.path.join(
-                self.workspace_dir, 'minerl_5_2.tif'),
+            'minerl_1_1_path': self.workspace_path('minerl_1_1.tif'),
+            'minerl_2_1_path': self.workspace_path('minerl_2_1.tif'),
+            'minerl_3_1_path': self.workspace_path('minerl_3_1.tif'),
+            'minerl_4_1_path': self.workspace_path('minerl_4_1.tif'),
+            'minerl_5_1_path': self.workspace_path('minerl_5_1.tif'),
+            'minerl_1_2_path': self.workspace_path('minerl_1_2.tif'),
+            'minerl_2_2_path': self.workspace_path('minerl_2_2.tif'),
+            'minerl_3_2_path': self.workspace_path('minerl_3_2.tif'),
+            'minerl_4_2_path': self.workspace_path('minerl_4_2.tif'),
+            'minerl_5_2_path': self.workspace_path('minerl_5_2.tif'),
         }
         for lyr in range(1, 6):
             create_constant_raster(
@@ -8599,75 +8488,67 @@ class foragetests(unittest.TestCase):
                 sv_reg['minerl_{}_2_path'.format(lyr)],
                 initial_minerl_2)
         for pft_i in [1, 2]:
-            sv_reg['aglivc_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'aglivc_{}.tif'.format(pft_i))
+            sv_reg['aglivc_{}_path'.format(pft_i)] = self.workspace_path(
+                'aglivc_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['aglivc_{}_path'.format(pft_i)], initial_aglivc)
-            sv_reg['bglivc_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'bglivc_{}.tif'.format(pft_i))
+            sv_reg['bglivc_{}_path'.format(pft_i)] = self.workspace_path(
+                'bglivc_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['bglivc_{}_path'.format(pft_i)], initial_bglivc)
-            sv_reg['aglive_1_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'aglive_1_{}.tif'.format(pft_i))
+            sv_reg['aglive_1_{}_path'.format(pft_i)] = self.workspace_path(
+                'aglive_1_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['aglive_1_{}_path'.format(pft_i)], initial_aglive_1)
-            sv_reg['aglive_2_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'aglive_2_{}.tif'.format(pft_i))
+            sv_reg['aglive_2_{}_path'.format(pft_i)] = self.workspace_path(
+                'aglive_2_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['aglive_2_{}_path'.format(pft_i)], initial_aglive_2)
-            sv_reg['bglive_1_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'bglive_1_{}.tif'.format(pft_i))
+            sv_reg['bglive_1_{}_path'.format(pft_i)] = self.workspace_path(
+                'bglive_1_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['bglive_1_{}_path'.format(pft_i)], initial_bglive_1)
-            sv_reg['bglive_2_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'bglive_2_{}.tif'.format(pft_i))
+            sv_reg['bglive_2_{}_path'.format(pft_i)] = self.workspace_path(
+                'bglive_2_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['bglive_2_{}_path'.format(pft_i)], initial_bglive_2)
-            sv_reg['crpstg_1_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'crpstg_1_{}.tif'.format(pft_i))
+            sv_reg['crpstg_1_{}_path'.format(pft_i)] = self.workspace_path(
+                'crpstg_1_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['crpstg_1_{}_path'.format(pft_i)], initial_crpstg_1)
-            sv_reg['crpstg_2_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'crpstg_2_{}.tif'.format(pft_i))
+            sv_reg['crpstg_2_{}_path'.format(pft_i)] = self.workspace_path(
+                'crpstg_2_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['crpstg_2_{}_path'.format(pft_i)], initial_crpstg_2)
-            sv_reg['crpstg_1_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'crpstg_1_{}.tif'.format(pft_i))
+            sv_reg['crpstg_1_{}_path'.format(pft_i)] = self.workspace_path(
+                'crpstg_1_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['crpstg_1_{}_path'.format(pft_i)], initial_crpstg_1)
-            sv_reg['crpstg_2_{}_path'.format(pft_i)] = os.path.join(
-                self.workspace_dir, 'crpstg_2_{}.tif'.format(pft_i))
+            sv_reg['crpstg_2_{}_path'.format(pft_i)] = self.workspace_path(
+                'crpstg_2_{}.tif'.format(pft_i))
             create_constant_raster(
                 sv_reg['crpstg_2_{}_path'.format(pft_i)], initial_crpstg_2)
 
         month_reg = {
-            'tgprod_pot_prod_1': os.path.join(
-                self.workspace_dir, 'tgprod_pot_prod_1.tif'),
-            'rtsh_1': os.path.join(
-                self.workspace_dir, 'rtsh_1.tif'),
-            'tgprod_pot_prod_2': os.path.join(
-                self.workspace_dir, 'tgprod_pot_prod_2.tif'),
-            'rtsh_2': os.path.join(
-                self.workspace_dir, 'rtsh_2.tif'),
+            'tgprod_pot_prod_1': self.workspace_path('tgprod_pot_prod_1.tif'),
+            'rtsh_1': self.workspace_path('rtsh_1.tif'),
+            'tgprod_pot_prod_2': self.workspace_path('tgprod_pot_prod_2.tif'),
+            'rtsh_2': self.workspace_path('rtsh_2.tif'),
         }
         for pft_i in [1, 2]:
             for iel in [1, 2]:
                 month_reg['cercrp_min_above_{}_{}'.format(
-                    iel, pft_i)] = os.path.join(
-                    self.workspace_dir, 'cercrp_min_above_{}_{}.tif'.format(
-                        iel, pft_i))
+                    iel, pft_i)] = self.workspace_path(
+                    'cercrp_min_above_{}_{}.tif'.format(iel, pft_i))
                 month_reg['cercrp_max_above_{}_{}'.format(
-                    iel, pft_i)] = os.path.join(
-                    self.workspace_dir, 'cercrp_max_above_{}_{}.tif'.format(
-                        iel, pft_i))
+                    iel, pft_i)] = self.workspace_path(
+                    'cercrp_max_above_{}_{}.tif'.format(iel, pft_i))
                 month_reg['cercrp_min_below_{}_{}'.format(
-                    iel, pft_i)] = os.path.join(
-                    self.workspace_dir, 'cercrp_min_below_{}_{}.tif'.format(
-                        iel, pft_i))
+                    iel, pft_i)] = self.workspace_path(
+                    'cercrp_min_below_{}_{}.tif'.format(iel, pft_i))
                 month_reg['cercrp_max_below_{}_{}'.format(
-                    iel, pft_i)] = os.path.join(
-                    self.workspace_dir, 'cercrp_max_below_{}_{}.tif'.format(
-                        iel, pft_i))
+                    iel, pft_i)] = self.workspace_path(
+                    'cercrp_max_below_{}_{}.tif'.format(iel, pft_i))
         create_constant_raster(month_reg['tgprod_pot_prod_1'], 426.04)
         create_constant_raster(month_reg['rtsh_1'], 0.3)
         create_constant_raster(month_reg['tgprod_pot_prod_2'], 341.04)
@@ -8834,7 +8715,6 @@ class foragetests(unittest.TestCase):
                         pass
             return ending_minerl_dict
 
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known values, no leaching of P
@@ -8869,8 +8749,8 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'sand': os.path.join(self.workspace_dir, 'sand.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'sand': self.workspace_path('sand.tif'),
         }
         create_constant_raster(aligned_inputs['site_index'], 1)
         create_constant_raster(aligned_inputs['sand'], sand)
@@ -8889,15 +8769,15 @@ class foragetests(unittest.TestCase):
         sv_reg = {}
         for iel in [1, 2]:
             for lyr in range(1, 5):
-                sv_reg['minerl_{}_{}_path'.format(lyr, iel)] = os.path.join(
-                    self.workspace_dir, 'minerl_{}_{}.tif'.format(lyr, iel))
+                sv_reg['minerl_{}_{}_path'.format(lyr, iel)] = (
+                    self.workspace_path('minerl_{}_{}.tif'.format(lyr, iel)))
                 create_constant_raster(
                     sv_reg['minerl_{}_{}_path'.format(lyr, iel)],
                     starting_minerl_dict['minerl_{}_{}'.format(lyr, iel)])
         month_reg = {}
         for lyr in range(1, 5):
-            month_reg['amov_{}'.format(lyr)] = os.path.join(
-                self.workspace_dir, 'amov_{}.tif'.format(lyr))
+            month_reg['amov_{}'.format(lyr)] = self.workspace_path(
+                'amov_{}.tif'.format(lyr))
             create_constant_raster(
                 month_reg['amov_{}'.format(lyr)],
                 amov_dict['amov_{}'.format(lyr)])
@@ -8944,8 +8824,8 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'sand': os.path.join(self.workspace_dir, 'sand.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'sand': self.workspace_path('sand.tif'),
         }
         create_constant_raster(aligned_inputs['site_index'], 1)
         create_constant_raster(aligned_inputs['sand'], sand)
@@ -8964,15 +8844,15 @@ class foragetests(unittest.TestCase):
         sv_reg = {}
         for iel in [1, 2]:
             for lyr in range(1, 5):
-                sv_reg['minerl_{}_{}_path'.format(lyr, iel)] = os.path.join(
-                    self.workspace_dir, 'minerl_{}_{}.tif'.format(lyr, iel))
+                sv_reg['minerl_{}_{}_path'.format(lyr, iel)] = (
+                    self.workspace_path('minerl_{}_{}.tif'.format(lyr, iel)))
                 create_constant_raster(
                     sv_reg['minerl_{}_{}_path'.format(lyr, iel)],
                     starting_minerl_dict['minerl_{}_{}'.format(lyr, iel)])
         month_reg = {}
         for lyr in range(1, 5):
-            month_reg['amov_{}'.format(lyr)] = os.path.join(
-                self.workspace_dir, 'amov_{}.tif'.format(lyr))
+            month_reg['amov_{}'.format(lyr)] = self.workspace_path(
+                'amov_{}.tif'.format(lyr))
             create_constant_raster(
                 month_reg['amov_{}'.format(lyr)],
                 amov_dict['amov_{}'.format(lyr)])
@@ -9075,7 +8955,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known inputs: one pft
@@ -9117,10 +8996,10 @@ class foragetests(unittest.TestCase):
         fdgrem = 0.05
 
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'animal_index': os.path.join(self.workspace_dir, 'animal.tif'),
-            'pft_1': os.path.join(self.workspace_dir, 'pft_1.tif'),
-            'clay': os.path.join(self.workspace_dir, 'clay.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'animal_index': self.workspace_path('animal.tif'),
+            'pft_1': self.workspace_path('pft_1.tif'),
+            'clay': self.workspace_path('clay.tif'),
         }
         create_constant_raster(aligned_inputs['site_index'], 1)
         create_constant_raster(aligned_inputs['animal_index'], 1)
@@ -9140,35 +9019,21 @@ class foragetests(unittest.TestCase):
             }
         }
         sv_reg = {
-            'aglivc_1_path': os.path.join(
-                self.workspace_dir, 'aglivc_1.tif'),
-            'aglive_1_1_path': os.path.join(
-                self.workspace_dir, 'aglive_1_1.tif'),
-            'aglive_2_1_path': os.path.join(
-                self.workspace_dir, 'aglive_2_1.tif'),
-            'stdedc_1_path': os.path.join(
-                self.workspace_dir, 'stdedc_1.tif'),
-            'stdede_1_1_path': os.path.join(
-                self.workspace_dir, 'stdede_1_1.tif'),
-            'stdede_2_1_path': os.path.join(
-                self.workspace_dir, 'stdede_2_1.tif'),
-            'minerl_1_1_path': os.path.join(
-                self.workspace_dir, 'minerl_1_1.tif'),
-            'minerl_1_2_path': os.path.join(
-                self.workspace_dir, 'minerl_1_2.tif'),
-            'metabc_1_path': os.path.join(
-                self.workspace_dir, 'metabc.tif'),
-            'strucc_1_path': os.path.join(
-                self.workspace_dir, 'strucc.tif'),
-            'struce_1_1_path': os.path.join(
-                self.workspace_dir, 'struce_1_1.tif'),
-            'metabe_1_1_path': os.path.join(
-                self.workspace_dir, 'metabe_1_1.tif'),
-            'struce_1_2_path': os.path.join(
-                self.workspace_dir, 'struce_1_2.tif'),
-            'metabe_1_2_path': os.path.join(
-                self.workspace_dir, 'metabe_1_2.tif'),
-            'strlig_1_path': os.path.join(self.workspace_dir, 'strlig.tif')
+            'aglivc_1_path': self.workspace_path('aglivc_1.tif'),
+            'aglive_1_1_path': self.workspace_path('aglive_1_1.tif'),
+            'aglive_2_1_path': self.workspace_path('aglive_2_1.tif'),
+            'stdedc_1_path': self.workspace_path('stdedc_1.tif'),
+            'stdede_1_1_path': self.workspace_path('stdede_1_1.tif'),
+            'stdede_2_1_path': self.workspace_path('stdede_2_1.tif'),
+            'minerl_1_1_path': self.workspace_path('minerl_1_1.tif'),
+            'minerl_1_2_path': self.workspace_path('minerl_1_2.tif'),
+            'metabc_1_path': self.workspace_path('metabc.tif'),
+            'strucc_1_path': self.workspace_path('strucc.tif'),
+            'struce_1_1_path': self.workspace_path('struce_1_1.tif'),
+            'metabe_1_1_path': self.workspace_path('metabe_1_1.tif'),
+            'struce_1_2_path': self.workspace_path('struce_1_2.tif'),
+            'metabe_1_2_path': self.workspace_path('metabe_1_2.tif'),
+            'strlig_1_path': self.workspace_path('strlig.tif')
         }
         create_constant_raster(sv_reg['aglivc_1_path'], aglivc)
         create_constant_raster(sv_reg['aglive_1_1_path'], aglive_1)
@@ -9187,8 +9052,8 @@ class foragetests(unittest.TestCase):
         create_constant_raster(sv_reg['strlig_1_path'], strlig_lyr)
 
         month_reg = {
-            'flgrem_1': os.path.join(self.workspace_dir, 'flgrem_1.tif'),
-            'fdgrem_1': os.path.join(self.workspace_dir, 'fdgrem_1.tif'),
+            'flgrem_1': self.workspace_path('flgrem_1.tif'),
+            'fdgrem_1': self.workspace_path('fdgrem_1.tif'),
         }
         create_constant_raster(month_reg['flgrem_1'], flgrem)
         create_constant_raster(month_reg['fdgrem_1'], fdgrem)
@@ -9271,22 +9136,16 @@ class foragetests(unittest.TestCase):
             strlig_1_after + tolerance, _SV_NODATA)
 
         # known inputs: two pfts, 50% cover each
-        aligned_inputs['pft_2'] = os.path.join(self.workspace_dir, 'pft_2.tif')
+        aligned_inputs['pft_2'] = self.workspace_path('pft_2.tif')
         create_constant_raster(aligned_inputs['pft_1'], 0.5)
         create_constant_raster(aligned_inputs['pft_2'], 0.5)
 
-        sv_reg['aglivc_2_path'] = os.path.join(
-            self.workspace_dir, 'aglivc_2.tif')
-        sv_reg['aglive_1_2_path'] = os.path.join(
-            self.workspace_dir, 'aglive_1_2.tif')
-        sv_reg['aglive_2_2_path'] = os.path.join(
-            self.workspace_dir, 'aglive_2_2.tif')
-        sv_reg['stdedc_2_path'] = os.path.join(
-            self.workspace_dir, 'stdedc_2.tif')
-        sv_reg['stdede_1_2_path'] = os.path.join(
-            self.workspace_dir, 'stdede_1_2.tif')
-        sv_reg['stdede_2_2_path'] = os.path.join(
-            self.workspace_dir, 'stdede_2_2.tif')
+        sv_reg['aglivc_2_path'] = self.workspace_path('aglivc_2.tif')
+        sv_reg['aglive_1_2_path'] = self.workspace_path('aglive_1_2.tif')
+        sv_reg['aglive_2_2_path'] = self.workspace_path('aglive_2_2.tif')
+        sv_reg['stdedc_2_path'] = self.workspace_path('stdedc_2.tif')
+        sv_reg['stdede_1_2_path'] = self.workspace_path('stdede_1_2.tif')
+        sv_reg['stdede_2_2_path'] = self.workspace_path('stdede_2_2.tif')
         create_constant_raster(sv_reg['aglivc_1_path'], aglivc)
         create_constant_raster(sv_reg['aglive_1_1_path'], aglive_1)
         create_constant_raster(sv_reg['aglive_2_1_path'], aglive_2)
@@ -9309,10 +9168,8 @@ class foragetests(unittest.TestCase):
         create_constant_raster(sv_reg['stdede_1_2_path'], stdede_1)
         create_constant_raster(sv_reg['stdede_2_2_path'], stdede_2)
 
-        month_reg['flgrem_2'] = os.path.join(
-            self.workspace_dir, 'flgrem_2.tif')
-        month_reg['fdgrem_2'] = os.path.join(
-            self.workspace_dir, 'fdgrem_2.tif')
+        month_reg['flgrem_2'] = self.workspace_path('flgrem_2.tif')
+        month_reg['fdgrem_2'] = self.workspace_path('fdgrem_2.tif')
         create_constant_raster(month_reg['flgrem_2'], flgrem)
         create_constant_raster(month_reg['fdgrem_2'], fdgrem)
 
@@ -9382,7 +9239,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known values
@@ -9401,11 +9257,9 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         sv_reg = {
-            'aglivc_1_path': os.path.join(self.workspace_dir, 'aglivc_1.tif'),
-            'aglive_1_1_path': os.path.join(
-                self.workspace_dir, 'aglive_1_1.tif'),
-            'aglive_2_1_path': os.path.join(
-                self.workspace_dir, 'aglive_2_1.tif'),
+            'aglivc_1_path': self.workspace_path('aglivc_1.tif'),
+            'aglive_1_1_path': self.workspace_path('aglive_1_1.tif'),
+            'aglive_2_1_path': self.workspace_path('aglive_2_1.tif'),
         }
         create_constant_raster(sv_reg['aglivc_1_path'], initial_aglivc)
         create_constant_raster(sv_reg['aglive_1_1_path'], initial_aglive_1)
@@ -9996,8 +9850,6 @@ class foragetests(unittest.TestCase):
                 'CP15': 0.1,
             },
         }
-        from rangeland_production import forage
-        from rangeland_production import utils
 
         # known derived trait values
         entire_m_Z = 0.480537
@@ -10131,7 +9983,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known inputs
@@ -10149,18 +10000,18 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         sv_reg = {
-            'aglivc_4_path': os.path.join(self.workspace_dir, 'aglivc_4.tif'),
-            'stdedc_4_path': os.path.join(self.workspace_dir, 'stdedc_4.tif'),
-            'aglivc_5_path': os.path.join(self.workspace_dir, 'aglivc_5.tif'),
-            'stdedc_5_path': os.path.join(self.workspace_dir, 'stdedc_5.tif'),
+            'aglivc_4_path': self.workspace_path('aglivc_4.tif'),
+            'stdedc_4_path': self.workspace_path('stdedc_4.tif'),
+            'aglivc_5_path': self.workspace_path('aglivc_5.tif'),
+            'stdedc_5_path': self.workspace_path('stdedc_5.tif'),
         }
         create_constant_raster(sv_reg['aglivc_4_path'], aglivc_4)
         create_constant_raster(sv_reg['stdedc_4_path'], stdedc_4)
         create_constant_raster(sv_reg['aglivc_5_path'], aglivc_5)
         create_constant_raster(sv_reg['stdedc_5_path'], stdedc_5)
         aligned_inputs = {
-            'pft_4': os.path.join(self.workspace_dir, 'cover_4.tif'),
-            'pft_5': os.path.join(self.workspace_dir, 'cover_5.tif'),
+            'pft_4': self.workspace_path('cover_4.tif'),
+            'pft_5': self.workspace_path('cover_5.tif'),
         }
         create_constant_raster(aligned_inputs['pft_4'], cover_4)
         create_constant_raster(aligned_inputs['pft_5'], cover_5)
@@ -10198,7 +10049,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known inputs
@@ -10217,23 +10067,22 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         sv_reg = {
-            'aglivc_4_path': os.path.join(self.workspace_dir, 'aglivc_4.tif'),
-            'stdedc_4_path': os.path.join(self.workspace_dir, 'stdedc_4.tif'),
-            'aglivc_5_path': os.path.join(self.workspace_dir, 'aglivc_5.tif'),
-            'stdedc_5_path': os.path.join(self.workspace_dir, 'stdedc_5.tif'),
+            'aglivc_4_path': self.workspace_path('aglivc_4.tif'),
+            'stdedc_4_path': self.workspace_path('stdedc_4.tif'),
+            'aglivc_5_path': self.workspace_path('aglivc_5.tif'),
+            'stdedc_5_path': self.workspace_path('stdedc_5.tif'),
         }
         create_constant_raster(sv_reg['aglivc_4_path'], aglivc_4)
         create_constant_raster(sv_reg['stdedc_4_path'], stdedc_4)
         create_constant_raster(sv_reg['aglivc_5_path'], aglivc_5)
         create_constant_raster(sv_reg['stdedc_5_path'], stdedc_5)
         aligned_inputs = {
-            'pft_4': os.path.join(self.workspace_dir, 'cover_4.tif'),
-            'pft_5': os.path.join(self.workspace_dir, 'cover_5.tif'),
+            'pft_4': self.workspace_path('cover_4.tif'),
+            'pft_5': self.workspace_path('cover_5.tif'),
         }
         create_constant_raster(aligned_inputs['pft_4'], cover_4)
         create_constant_raster(aligned_inputs['pft_5'], cover_5)
-        total_weighted_C_path = os.path.join(
-            self.workspace_dir, 'total_weighted_C.tif')
+        total_weighted_C_path = self.workspace_path('total_weighted_C.tif')
         create_constant_raster(total_weighted_C_path, total_weighted_C)
         pft_id_set = [4, 5]
         processing_dir = self.workspace_dir
@@ -10270,8 +10119,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         # known inputs
         aglivc_4 = 80
         aglive_1_4 = 35
@@ -10286,18 +10133,14 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         sv_reg = {
-            'aglivc_4_path': os.path.join(self.workspace_dir, 'aglivc_4.tif'),
-            'aglive_1_4_path': os.path.join(
-                self.workspace_dir, 'aglive_1_4.tif'),
-            'stdedc_4_path': os.path.join(self.workspace_dir, 'stdedc_4.tif'),
-            'stdede_1_4_path': os.path.join(
-                self.workspace_dir, 'stdede_1_4.tif'),
-            'aglivc_5_path': os.path.join(self.workspace_dir, 'aglivc_5.tif'),
-            'aglive_1_5_path': os.path.join(
-                self.workspace_dir, 'aglive_1_5.tif'),
-            'stdedc_5_path': os.path.join(self.workspace_dir, 'stdedc_5.tif'),
-            'stdede_1_5_path': os.path.join(
-                self.workspace_dir, 'stdede_1_5.tif'),
+            'aglivc_4_path': self.workspace_path('aglivc_4.tif'),
+            'aglive_1_4_path': self.workspace_path('aglive_1_4.tif'),
+            'stdedc_4_path': self.workspace_path('stdedc_4.tif'),
+            'stdede_1_4_path': self.workspace_path('stdede_1_4.tif'),
+            'aglivc_5_path': self.workspace_path('aglivc_5.tif'),
+            'aglive_1_5_path': self.workspace_path('aglive_1_5.tif'),
+            'stdedc_5_path': self.workspace_path('stdedc_5.tif'),
+            'stdede_1_5_path': self.workspace_path('stdede_1_5.tif'),
         }
         args = foragetests.generate_base_args(self.workspace_dir)
         pygeoprocessing.new_raster_from_base(
@@ -10349,7 +10192,6 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
         tolerance = 0.00001
 
         # known inputs
@@ -10397,10 +10239,10 @@ class foragetests(unittest.TestCase):
 
         # spatial inputs
         aligned_inputs = {
-            'pft_1': os.path.join(self.workspace_dir, 'pft_1.tif'),
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'proportion_legume_path': os.path.join(
-                self.workspace_dir, 'proportion_legume.tif'),
+            'pft_1': self.workspace_path('pft_1.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'proportion_legume_path': self.workspace_path(
+                'proportion_legume.tif'),
         }
         create_constant_raster(aligned_inputs['pft_1'], 1)
         create_constant_raster(aligned_inputs['site_index'], 1)
@@ -10408,10 +10250,10 @@ class foragetests(unittest.TestCase):
             aligned_inputs['proportion_legume_path'], proportion_legume)
         aoi_path = TEST_AOI
         sv_reg = {
-            'aglivc_1_path': os.path.join(self.workspace_dir, 'aglivc.tif'),
-            'aglive_1_1_path': os.path.join(self.workspace_dir, 'aglive.tif'),
-            'stdedc_1_path': os.path.join(self.workspace_dir, 'stdedc.tif'),
-            'stdede_1_1_path': os.path.join(self.workspace_dir, 'stdede.tif'),
+            'aglivc_1_path': self.workspace_path('aglivc.tif'),
+            'aglive_1_1_path': self.workspace_path('aglive.tif'),
+            'stdedc_1_path': self.workspace_path('stdedc.tif'),
+            'stdede_1_1_path': self.workspace_path('stdede.tif'),
         }
         create_constant_raster(sv_reg['aglivc_1_path'], aglivc)
         create_constant_raster(sv_reg['aglive_1_1_path'], aglive_1)
@@ -10419,7 +10261,7 @@ class foragetests(unittest.TestCase):
         create_constant_raster(sv_reg['stdede_1_1_path'], stdede_1)
 
         pft_id_set = [1]
-        animal_index_path = os.path.join(self.workspace_dir, 'animal.tif')
+        animal_index_path = self.workspace_path('animal.tif')
         create_constant_raster(animal_index_path, 1)
         animal_trait_table = {
             1: {
@@ -10462,10 +10304,9 @@ class foragetests(unittest.TestCase):
             }
         }
         month_reg = {
-            'animal_density': os.path.join(
-                self.workspace_dir, 'animal_density.tif'),
-            'flgrem_1': os.path.join(self.workspace_dir, 'flgrem_1.tif'),
-            'fdgrem_1': os.path.join(self.workspace_dir, 'fdgrem_1.tif'),
+            'animal_density': self.workspace_path('animal_density.tif'),
+            'flgrem_1': self.workspace_path('flgrem_1.tif'),
+            'fdgrem_1': self.workspace_path('fdgrem_1.tif'),
         }
         create_constant_raster(month_reg['animal_density'], stocking_density)
 
@@ -10514,7 +10355,6 @@ class foragetests(unittest.TestCase):
                 of the beta rangeland model
 
         """
-        from rangeland_production import forage
         tolerance = 0.000001
 
         # known inputs
@@ -10590,10 +10430,10 @@ class foragetests(unittest.TestCase):
 
         # raster-based inputs
         sv_reg = {
-            'aglivc_1_path': os.path.join(self.workspace_dir, 'aglivc.tif'),
-            'aglive_1_1_path': os.path.join(self.workspace_dir, 'aglive.tif'),
-            'stdedc_1_path': os.path.join(self.workspace_dir, 'stdedc.tif'),
-            'stdede_1_1_path': os.path.join(self.workspace_dir, 'stdede.tif'),
+            'aglivc_1_path': self.workspace_path('aglivc.tif'),
+            'aglive_1_1_path': self.workspace_path('aglive.tif'),
+            'stdedc_1_path': self.workspace_path('stdedc.tif'),
+            'stdede_1_1_path': self.workspace_path('stdede.tif'),
         }
         create_constant_raster(sv_reg['aglivc_1_path'], aglivc)
         create_constant_raster(sv_reg['aglive_1_1_path'], aglive_1)
@@ -10602,8 +10442,8 @@ class foragetests(unittest.TestCase):
 
         pft_id_set = [1]
         aligned_inputs = {
-            'pft_1': os.path.join(self.workspace_dir, 'pft_1.tif'),
-            'animal_index': os.path.join(self.workspace_dir, 'animal.tif'),
+            'pft_1': self.workspace_path('pft_1.tif'),
+            'animal_index': self.workspace_path('animal.tif'),
         }
         create_constant_raster(aligned_inputs['pft_1'], 1)
         create_constant_raster(aligned_inputs['animal_index'], 1)
@@ -10674,12 +10514,10 @@ class foragetests(unittest.TestCase):
             }
         }
         month_reg = {
-            'animal_density': os.path.join(
-                self.workspace_dir, 'animal_density.tif'),
-            'flgrem_1': os.path.join(self.workspace_dir, 'flgrem_1.tif'),
-            'fdgrem_1': os.path.join(self.workspace_dir, 'fdgrem_1.tif'),
-            'diet_sufficiency': os.path.join(
-                self.workspace_dir, 'diet_sufficiency.tif')
+            'animal_density': self.workspace_path('animal_density.tif'),
+            'flgrem_1': self.workspace_path('flgrem_1.tif'),
+            'fdgrem_1': self.workspace_path('fdgrem_1.tif'),
+            'diet_sufficiency': self.workspace_path('diet_sufficiency.tif')
         }
         create_constant_raster(month_reg['animal_density'], stocking_density)
         create_constant_raster(month_reg['flgrem_1'], flgrem)
@@ -10710,12 +10548,10 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         # known inputs
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'pft_1': os.path.join(self.workspace_dir, 'pft_1.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'pft_1': self.workspace_path('pft_1.tif'),
         }
         create_constant_raster(aligned_inputs['site_index'], 1)
         create_constant_raster(aligned_inputs['pft_1'], 1)
@@ -10994,12 +10830,10 @@ class foragetests(unittest.TestCase):
             None
 
         """
-        from rangeland_production import forage
-
         # valid inputs, single plant functional type
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'pft_1': os.path.join(self.workspace_dir, 'pft_1.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'pft_1': self.workspace_path('pft_1.tif'),
         }
         create_constant_raster(aligned_inputs['site_index'], 1)
         create_constant_raster(aligned_inputs['pft_1'], 1)
@@ -11009,10 +10843,10 @@ class foragetests(unittest.TestCase):
 
         # valid inputs, multiple plant functional types
         aligned_inputs = {
-            'site_index': os.path.join(self.workspace_dir, 'site.tif'),
-            'pft_1': os.path.join(self.workspace_dir, 'pft_1.tif'),
-            'pft_4': os.path.join(self.workspace_dir, 'pft_4.tif'),
-            'pft_5': os.path.join(self.workspace_dir, 'pft_5.tif'),
+            'site_index': self.workspace_path('site.tif'),
+            'pft_1': self.workspace_path('pft_1.tif'),
+            'pft_4': self.workspace_path('pft_4.tif'),
+            'pft_5': self.workspace_path('pft_5.tif'),
         }
         create_constant_raster(aligned_inputs['site_index'], 1)
         create_constant_raster(aligned_inputs['pft_1'], 0.3)